@@ -18,7 +18,7 @@ from import_export.admin import ImportExportMixin, ImportExportModelAdmin
 
 from .forms import FeedAdminForm, TextareaWithCopyButtonWidget, UserSettingsAdminForm
 from .models import Article, Feed, FeedGroup, RedditSubreddit, UserSettings, YouTubeChannel
-from .services import AggregatorService, ArticleService
+from .services import AggregatorService, ArticleService, FeedCounterService
 
 # Customize Admin Site
 admin.site.site_header = "Yana"
@@ -66,7 +66,7 @@ def clear_raw_article_content(modeladmin, request, queryset):
 def delete_all_articles(modeladmin, request, queryset):
     from .models import Article
 
-    count, _ = Article.objects.filter(feed__in=queryset).delete()
+    count = FeedCounterService.delete_articles(Article.objects.filter(feed__in=queryset))
     modeladmin.message_user(request, f"Deleted {count} articles from selected feeds.")
 
 
@@ -202,7 +202,7 @@ class FeedAdmin(YanaDjangoQLMixin, ImportExportModelAdmin):
                 from .aggregators.registry import AggregatorRegistry
 
                 agg_class = AggregatorRegistry.get(aggregator_type)
-                config_fields = agg_class.get_configuration_fields()
+                config_fields = agg_class.get_all_configuration_fields()
                 config_field_names = list(config_fields.keys())
             except Exception:
                 pass
@@ -323,7 +323,7 @@ class FeedAdmin(YanaDjangoQLMixin, ImportExportModelAdmin):
                                     choices=choices
                                 )
 
-                        config_fields = agg_class.get_configuration_fields()
+                        config_fields = agg_class.get_all_configuration_fields()
 
                         # Add config fields
                         for field_name, field in config_fields.items():
@@ -502,6 +502,14 @@ class ArticleAdmin(YanaDjangoQLMixin, ImportExportModelAdmin):
         qs = super().get_queryset(request)
         return qs.defer("content", "raw_content")
 
+    def delete_model(self, request, obj):
+        """Delete the article through FeedCounterService to keep counters in step."""
+        FeedCounterService.delete_articles(Article.objects.filter(pk=obj.pk))
+
+    def delete_queryset(self, request, queryset):
+        """Delete the articles through FeedCounterService to keep counters in step."""
+        FeedCounterService.delete_articles(queryset)
+
     @admin.action(description="Reload selected articles")
     def reload_selected_articles(self, request, queryset):
         """Admin action to reload selected articles directly."""
@@ -549,7 +557,7 @@ class ArticleAdmin(YanaDjangoQLMixin, ImportExportModelAdmin):
     def force_delete_selected(self, request, queryset):
         """Force delete selected articles without confirmation."""
         count = queryset.count()
-        queryset.delete()
+        self.delete_queryset(request, queryset)
         self.message_user(request, f"Successfully deleted {count} articles.", messages.SUCCESS)
 
 
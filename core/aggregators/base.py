@@ -6,11 +6,15 @@ import logging
 import math
 import random
 import re
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse
 
+from django.db import connection
 from django.utils import timezone
 
 from bs4 import BeautifulSoup
@@ -19,6 +23,7 @@ from core.ai_client import AIClient
 from core.models import UserSettings
 
 from .services.header_element.context import HeaderElementData
+from .utils.page_cache import PageCache
 
 
 class BaseAggregator(ABC):
@@ -31,6 +36,22 @@ class BaseAggregator(ABC):
     # (i.e. uses the query parameter in get_identifier_choices)
     supports_identifier_search = False
 
+    # Drop articles that are already stored for the feed before enrichment.
+    # AggregatorService disables this for force_update runs.
+    skip_existing = True
+
+    # Send the validators of the previous poll, so unchanged sources can be
+    # skipped. AggregatorService disables this for force_update runs.
+    conditional_fetch = True
+
+    # Set to True if enrich_articles goes through enrich_each, so articles can
+    # be enriched on a thread pool when the feed opts in via its options
+    supports_concurrent_enrichment = False
+
+    # Defaults for the concurrent enrichment options
+    default_enrichment_workers = 8
+    default_enrichment_per_host = 4
+
     def __init__(self, feed):
         """
         Initialize aggregator with a feed.
@@ -41,6 +62,13 @@ class BaseAggregator(ABC):
         self.feed = feed
         self.identifier = feed.identifier
         self.daily_limit = feed.daily_limit
+        self.skipped_existing_count = 0
+        # Feed fields describing the fetched source (e.g. fetch_etag), stored by
+        # save_fetch_state once the articles of the run have been saved
+        self.fetch_state: Dict[str, str] = {}
+        # Aggregators that fetch article pages set a PageCache here so header
+        # extraction and content extraction share one download per article
+        self.page_cache: Optional[PageCache] = None
         self.logger = logging.getLogger(f"aggregator.{self.get_aggregator_type()}")
 
     @classmethod
@@ -255,6 +283,62 @@ class BaseAggregator(ABC):
         self.logger.info(f"[filter_articles] Kept {len(filtered)}/{len(articles)} articles")
         return filtered
 
+    def remove_existing_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Drop articles whose identifier is already stored for this feed.
+
+        Runs between filtering and enrichment so that known articles never
+        trigger content or image fetches. Uses a single ``identifier__in``
+        lookup backed by the (feed, identifier) index.
+
+        Args:
+            articles: List of article dictionaries
+
+        Returns:
+            Articles that are not yet stored for the feed
+        """
+        if not self.skip_existing or not articles or not getattr(self.feed, "pk", None):
+            return articles
+
+        from core.models import Article
+
+        identifiers = {article["identifier"] for article in articles if article.get("identifier")}
+        if not identifiers:
+            return articles
+
+        existing = set(
+            Article.objects.filter(feed=self.feed, identifier__in=identifiers).values_list(
+                "identifier", flat=True
+            )
+        )
+        if not existing:
+            return articles
+
+        remaining = [article for article in articles if article.get("identifier") not in existing]
+        skipped = len(articles) - len(remaining)
+        self.skipped_existing_count += skipped
+        self.logger.info(
+            f"[remove_existing_articles] Skipped {skipped} already stored articles "
+            f"({len(remaining)} left to enrich)"
+        )
+        return remaining
+
+    def save_fetch_state(self) -> None:
+        """
+        Store the fetch state of the run on the feed.
+
+        Called after the articles of the run have been saved, so a failed run
+        is fetched in full again next time.
+        """
+        if not self.fetch_state or not getattr(self.feed, "pk", None):
+            return
+
+        from core.models import Feed
+
+        Feed.objects.filter(pk=self.feed.pk).update(**self.fetch_state)
+        for field, value in self.fetch_state.items():
+            setattr(self.feed, field, value)
+
     def enrich_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Enrich articles with additional data (full content, images, etc.).
@@ -269,6 +353,77 @@ class BaseAggregator(ABC):
         """
         return articles
 
+    def get_enrichment_workers(self) -> int:
+        """
+        Get the number of articles enriched at the same time.
+
+        Returns 1 unless the aggregator supports concurrent enrichment and the
+        feed enabled it via the "concurrent_enrichment" option.
+        """
+        options = self.feed.options or {}
+        if not self.supports_concurrent_enrichment or not options.get("concurrent_enrichment"):
+            return 1
+        return max(1, int(options.get("enrichment_workers") or self.default_enrichment_workers))
+
+    def get_enrichment_host(self, article: Dict[str, Any]) -> str:
+        """
+        Get the host an article's enrichment requests go to.
+
+        Used to cap concurrent requests per host. Override if enrichment talks
+        to a different host than the article URL.
+        """
+        return urlparse(article.get("identifier", "")).netloc
+
+    def enrich_each(
+        self,
+        articles: List[Dict[str, Any]],
+        enrich_article: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Run enrich_article for every article, serially or on a thread pool.
+
+        enrich_article handles its own errors and returns the article to keep
+        or None to skip it. The result keeps the input order either way.
+
+        Args:
+            articles: List of article dictionaries
+            enrich_article: Callable enriching a single article
+
+        Returns:
+            Enriched articles that were not skipped, in input order
+        """
+        workers = min(self.get_enrichment_workers(), len(articles))
+        if workers <= 1:
+            results = [enrich_article(article) for article in articles]
+            return [article for article in results if article is not None]
+
+        options = self.feed.options or {}
+        per_host = max(
+            1, int(options.get("enrichment_per_host") or self.default_enrichment_per_host)
+        )
+        host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        for article in articles:
+            host_slots.setdefault(
+                self.get_enrichment_host(article), threading.BoundedSemaphore(per_host)
+            )
+
+        def run(article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            try:
+                with host_slots[self.get_enrichment_host(article)]:
+                    return enrich_article(article)
+            finally:
+                # Worker threads get their own database connection
+                connection.close()
+
+        self.logger.info(
+            f"[enrich_each] Enriching {len(articles)} articles with {workers} workers "
+            f"(max {per_host} per host)"
+        )
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enrich") as executor:
+            results = list(executor.map(run, articles))
+
+        return [article for article in results if article is not None]
+
     def finalize_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Final processing before returning articles.
@@ -489,11 +644,53 @@ class BaseAggregator(ABC):
         """
         return {}
 
+    @classmethod
+    def get_enrichment_configuration_fields(cls) -> Dict[str, Any]:
+        """
+        Get the concurrent enrichment fields for aggregators that support it.
+        """
+        if not cls.supports_concurrent_enrichment:
+            return {}
+
+        from django import forms
+
+        return {
+            "concurrent_enrichment": forms.BooleanField(
+                initial=False,
+                label="Concurrent Enrichment",
+                help_text="Fetch several articles at the same time instead of one after another.",
+                required=False,
+            ),
+            "enrichment_workers": forms.IntegerField(
+                initial=cls.default_enrichment_workers,
+                label="Enrichment Workers",
+                help_text="Maximum number of articles fetched at the same time.",
+                required=False,
+                min_value=1,
+                max_value=20,
+            ),
+            "enrichment_per_host": forms.IntegerField(
+                initial=cls.default_enrichment_per_host,
+                label="Requests per Host",
+                help_text="Maximum number of articles fetched from the same host at the same time.",
+                required=False,
+                min_value=1,
+                max_value=20,
+            ),
+        }
+
+    @classmethod
+    def get_all_configuration_fields(cls) -> Dict[str, Any]:
+        """
+        Get the aggregator-specific fields plus the shared enrichment fields.
+        """
+        return {**cls.get_configuration_fields(), **cls.get_enrichment_configuration_fields()}
+
     def save_options(self, form_cleaned_data: Dict[str, Any]) -> None:
         """
         Extract aggregator-specific options from form data and save to feed.options.
         """
-        config_fields = self.get_configuration_fields()
+        config_fields = self.get_all_configuration_fields()
         options = self.feed.options or {}
         for field_name in config_fields:
             if field_name in form_cleaned_data:
@@ -527,7 +724,7 @@ class BaseAggregator(ABC):
             article: Article dictionary with 'identifier' and 'name' keys
 
         Returns:
-            HeaderElementData containing raw bytes and base64 URI, or None if extraction fails
+            HeaderElementData containing raw bytes and image src, or None if extraction fails
 
         Raises:
             ArticleSkipError: On 4xx HTTP errors (article should be skipped)
@@ -546,7 +743,9 @@ class BaseAggregator(ABC):
             # Run extraction synchronously
             extractor = HeaderElementExtractor()
             user_id = getattr(getattr(self.feed, "user", None), "id", None)
-            header_data = extractor.extract_header_element(url, alt, user_id=user_id)
+            header_data = extractor.extract_header_element(
+                url, alt, user_id=user_id, page_cache=self.page_cache
+            )
 
             return header_data
 
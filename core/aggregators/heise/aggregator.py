@@ -6,14 +6,7 @@ from urllib.parse import urljoin, urlparse
 
 from bs4 import BeautifulSoup, Tag
 
-from ..utils import (
-    clean_html,
-    fetch_html,
-    format_article_content,
-    remove_image_by_url,
-    sanitize_class_names,
-)
-from ..utils.youtube import proxy_youtube_embeds
+from ..utils import HtmlPipeline, fetch_html, parse_document
 from ..website import FullWebsiteAggregator
 
 
@@ -163,75 +156,39 @@ class HeiseAggregator(FullWebsiteAggregator):
 
         return final_articles
 
-    def extract_content(self, html: str, article: Dict[str, Any]) -> str:
+    def extract_content_tree(self, html: str, article: Dict[str, Any]) -> HtmlPipeline:
         """Extract Heise specific content and remove empty elements."""
-        extracted = super().extract_content(html, article)
+        content = super().extract_content_tree(html, article)
 
-        # Process content - remove empty elements (similar to cheerio logic in TS)
-        soup = BeautifulSoup(extracted, "html.parser")
-        for tag in soup.find_all(["p", "div", "span"]):
+        # Remove empty elements (similar to cheerio logic in TS)
+        for tag in content.root.find_all(["p", "div", "span"]):
             # Remove if it has no text and no images
             if not tag.get_text(strip=True) and not tag.find_all("img"):
                 tag.decompose()
 
-        return str(soup)
+        return content
 
-    def process_content(self, html: str, article: Dict[str, Any]) -> str:
-        """Process content and optionally add comments."""
-        # Note: We override FullWebsiteAggregator.process_content entirely
-        # to inject comments BEFORE the footer (which format_article_content adds).
-
-        # 1. Standard Content Processing (copied from FullWebsiteAggregator)
-        soup = BeautifulSoup(html, "html.parser")
-
-        # Proxy YouTube embeds
-        proxy_youtube_embeds(soup)
-
-        # Remove header image from content if it was extracted
-        header_data = article.get("header_data")
-        if header_data and header_data.image_url:
-            self.logger.debug(f"Removing header image from content: {header_data.image_url}")
-            remove_image_by_url(soup, header_data.image_url)
-
-        # Sanitize class names
-        sanitize_class_names(soup)
-
-        # Clean HTML
-        cleaned = clean_html(str(soup))
-
-        # Determine header image URL for formatting
-        header_image_url = None
-        if header_data:
-            header_image_url = header_data.base64_data_uri or header_data.image_url
-
-        # 2. Extract Comments (Heise Specific)
-        comments_html = None
+    def get_comments_content(self, article: Dict[str, Any]) -> Optional[str]:
+        """Extract forum comments if enabled."""
         include_comments = self.feed.options.get("include_comments", True)
         max_comments = self.feed.options.get("max_comments", 5)
 
-        if include_comments:
-            try:
-                # We need the original full HTML to find the forum link
-                raw_html = article.get("raw_content", "")
-                if raw_html:
-                    comments_html = self.extract_comments(
-                        article["identifier"], raw_html, max_comments=max_comments
-                    )
-            except Exception as e:
-                self.logger.warning(
-                    f"[process_content] Failed to extract comments for {article['identifier']}: {e}"
-                )
+        if not include_comments:
+            return None
 
-        # 3. Format Article (Inject content + comments + footer)
-        formatted = format_article_content(
-            cleaned,
-            title=article["name"],
-            url=article["identifier"],
-            header_image_url=header_image_url,
-            comments_content=comments_html,
-        )
+        try:
+            # We need the original full HTML to find the forum link
+            raw_html = article.get("raw_content", "")
+            if raw_html:
+                return self.extract_comments(
+                    article["identifier"], raw_html, max_comments=max_comments
+                )
+        except Exception as e:
+            self.logger.warning(
+                f"[get_comments_content] Failed to extract comments for {article['identifier']}: {e}"
+            )
 
-        return formatted
+        return None
 
     def extract_comments(
         self, article_url: str, article_html: str, max_comments: int = 5
@@ -250,7 +207,7 @@ class HeiseAggregator(FullWebsiteAggregator):
         self.logger.info(f"[extract_comments] Fetching comments from forum: {forum_url}")
         try:
             forum_html = fetch_html(forum_url)
-            soup = BeautifulSoup(forum_html, "html.parser")
+            soup = parse_document(forum_html)
 
             # Find comment elements
             comment_elements = self._find_comment_elements(soup)
@@ -276,7 +233,7 @@ class HeiseAggregator(FullWebsiteAggregator):
 
     def _find_forum_url(self, html: str, article_url: str) -> Optional[str]:
         """Find forum URL from JSON-LD or fallback links."""
-        soup = BeautifulSoup(html, "html.parser")
+        soup = parse_document(html)
 
         # JSON-LD
         for script in soup.find_all("script", type="application/ld+json"):
@@ -183,7 +183,7 @@ class MactechnewsAggregator(FullWebsiteAggregator):
         # Determine header image URL
         header_image_url = None
         if header_data:
-            header_image_url = header_data.base64_data_uri or header_data.image_url
+            header_image_url = header_data.image_src or header_data.image_url
 
         # Extract comments from the raw (full) HTML
         comments_html = None
@@ -3,7 +3,9 @@
 import logging
 from typing import Optional
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
+
+from ..utils import parse_document
 
 
 def extract_comments(
@@ -33,7 +35,7 @@ def extract_comments(
     if logger is None:
         logger = logging.getLogger(__name__)
 
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_document(html)
 
     # Find the comments container
     comment_scroll = soup.select_one("div.MtnCommentScroll")
@@ -5,7 +5,7 @@ import re
 from typing import Callable, Set
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
-from bs4 import BeautifulSoup
+from ..utils import parse_document
 
 
 def detect_pagination(html: str, logger: logging.Logger) -> Set[int]:
@@ -23,7 +23,7 @@ def detect_pagination(html: str, logger: logging.Logger) -> Set[int]:
     Returns:
         Set of page numbers (always includes 1)
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_document(html)
     page_numbers: Set[int] = {1}
 
     logger.debug("Starting MacTechNews pagination detection")
@@ -100,7 +100,7 @@ def fetch_all_pages(
                 logger.debug(f"Page {page_num}: HTML fetched ({len(page_html)} bytes)")
 
             # Extract content using the provided selector
-            soup = BeautifulSoup(page_html, "html.parser")
+            soup = parse_document(page_html)
             content_div = soup.select_one(content_selector)
 
             if content_div:
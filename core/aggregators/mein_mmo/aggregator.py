@@ -2,8 +2,7 @@
 
 from typing import Any, Dict, List, Optional, Tuple
 
-from ..utils import clean_html, format_article_content, remove_image_by_url
-from ..utils.youtube import proxy_youtube_embeds
+from ..utils import HtmlPipeline, format_article_content
 from ..website import FullWebsiteAggregator
 from .content_extraction import extract_mein_mmo_content
 from .multipage_handler import detect_pagination, fetch_all_pages
@@ -119,29 +118,26 @@ class MeinMmoAggregator(FullWebsiteAggregator):
         )
         return combined_html
 
-    def extract_content(self, html: str, article: Dict[str, Any]) -> str:
+    def extract_content_tree(self, html: str, article: Dict[str, Any]) -> HtmlPipeline:
         """Extract Mein-MMO specific content."""
         self.logger.debug(f"[extract_content] Starting for {article.get('identifier')}")
-        result = extract_mein_mmo_content(
-            html=html,
+
+        # Reuse the soup parsed during header extraction for single page articles
+        page = self.page_cache.take_soup(article.get("identifier", ""), html)
+
+        return extract_mein_mmo_content(
+            html=page if page is not None else html,
             article=article,
             selectors_to_remove=self.selectors_to_remove,
             logger=self.logger,
         )
-        self.logger.debug(f"[extract_content] Completed, result size: {len(result)} bytes")
-        return result
 
-    def process_content(self, html: str, article: Dict[str, Any]) -> str:
+    def process_content_tree(self, content: HtmlPipeline, article: Dict[str, Any]) -> str:
         """Process Mein-MMO content with header image extraction."""
         self.logger.debug(f"[process_content] Starting for {article.get('identifier')}")
 
-        from bs4 import BeautifulSoup
-
-        # Parse HTML for processing
-        soup = BeautifulSoup(html, "html.parser")
-
         # Proxy YouTube embeds
-        proxy_youtube_embeds(soup)
+        content.proxy_youtube_embeds()
 
         # Remove header image from content if it was extracted
         header_data = article.get("header_data")
@@ -149,20 +145,17 @@ class MeinMmoAggregator(FullWebsiteAggregator):
             self.logger.debug(
                 f"[process_content] Removing header image from content: {header_data.image_url}"
             )
-            remove_image_by_url(soup, header_data.image_url)
-
-        # Convert back to string for cleaning
-        html = str(soup)
+            content.remove_image_by_url(header_data.image_url)
 
-        # Clean HTML
+        # Clean HTML (class names were already sanitized during extraction)
         self.logger.debug("[process_content] Cleaning HTML")
-        cleaned = clean_html(html)
+        cleaned = content.remove_comments().to_html()
 
         # Determine header image URL for formatting
-        # Use base64-encoded data URI if available, otherwise use original URL
+        # Use the stored image (or data URI) if available, otherwise use original URL
         header_image_url = None
         if header_data:
-            header_image_url = header_data.base64_data_uri or header_data.image_url
+            header_image_url = header_data.image_src or header_data.image_url
 
         # Format with header (image only) and footer
         self.logger.debug("[process_content] Formatting content with header image only")
@@ -2,19 +2,28 @@
 
 import logging
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 from django.conf import settings
 
 from bs4 import BeautifulSoup, Tag
 
-from ..utils import clean_data_attributes, remove_empty_elements, sanitize_class_names
+from ..utils import (
+    HtmlPipeline,
+    clean_data_attributes,
+    parse_document,
+    remove_empty_elements,
+    sanitize_class_names,
+)
 from .embed_processors import process_embeds
 
 
 def extract_mein_mmo_content(
-    html: str, article: Dict[str, Any], selectors_to_remove: List[str], logger: logging.Logger
-) -> str:
+    html: Union[str, BeautifulSoup],
+    article: Dict[str, Any],
+    selectors_to_remove: List[str],
+    logger: logging.Logger,
+) -> HtmlPipeline:
     """
     Extract and process Mein-MMO specific content.
 
@@ -29,16 +38,17 @@ def extract_mein_mmo_content(
     8. Sanitize class names
 
     Args:
-        html: HTML content (may contain multiple content divs for multi-page)
+        html: HTML content (may contain multiple content divs for multi-page),
+            or an already parsed document (modified in place)
         article: Article dictionary
         selectors_to_remove: CSS selectors to remove
         logger: Logger instance
 
     Returns:
-        Processed HTML content string
+        Pipeline over the processed content, not yet serialised
     """
     logger.debug(f"Starting content extraction for {article.get('identifier')}")
-    soup = BeautifulSoup(html, "html.parser")
+    soup = html if isinstance(html, BeautifulSoup) else parse_document(html)
 
     # Find all content divs (multi-page articles have multiple)
     content_divs = soup.select("div.entry-content")
@@ -46,7 +56,8 @@ def extract_mein_mmo_content(
 
     if not content_divs:
         logger.warning(f"No content divs found for {article.get('identifier')}, returning raw HTML")
-        return html
+        # Keep the whole page, parsed like any other content snippet
+        return HtmlPipeline.parse(html if isinstance(html, str) else str(soup))
 
     # Combine content from all pages
     if len(content_divs) > 1:
@@ -59,7 +70,7 @@ def extract_mein_mmo_content(
             for child in list(div.children):
                 wrapper.append(child)
         content = wrapper
-        logger.debug(f"Combined content div created, size: {len(str(content))} bytes")
+        logger.debug(f"Combined {len(content_divs)} content divs")
     else:
         content = content_divs[0]
         logger.debug("Single page article, using first content div")
@@ -105,9 +116,8 @@ def extract_mein_mmo_content(
     logger.debug("Sanitizing class names")
     sanitize_class_names(content)
 
-    result = str(content)
-    logger.info(f"Content extraction complete: {len(result)} bytes")
-    return result
+    logger.info(f"Content extraction complete for {article.get('identifier')}")
+    return HtmlPipeline(content)
 
 
 def process_dailymotion_blocks(content: Tag, logger: logging.Logger) -> None:
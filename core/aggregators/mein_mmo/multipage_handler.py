@@ -4,9 +4,7 @@ import logging
 import re
 from typing import Callable, Set
 
-from bs4 import BeautifulSoup
-
-from ..utils import get_attr_str
+from ..utils import get_attr_str, parse_document
 
 
 def detect_pagination(html: str, logger: logging.Logger) -> Set[int]:
@@ -23,7 +21,7 @@ def detect_pagination(html: str, logger: logging.Logger) -> Set[int]:
     Returns:
         Set of page numbers (always includes 1)
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_document(html)
     page_numbers = {1}  # Always include page 1
 
     logger.debug("Starting pagination detection")
@@ -124,7 +122,7 @@ def fetch_all_pages(
                 logger.debug(f"Page {page_num}: HTML fetched ({len(page_html)} bytes)")
 
             # Extract content div
-            soup = BeautifulSoup(page_html, "html.parser")
+            soup = parse_document(page_html)
             content_div = soup.select_one("div.entry-content")
 
             if content_div:
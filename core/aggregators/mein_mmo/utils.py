@@ -3,9 +3,9 @@
 import logging
 from typing import Optional
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
-from ..utils import get_attr_str
+from ..utils import get_attr_str, parse_document
 
 
 def extract_header_image_url(html: str, logger: logging.Logger) -> Optional[str]:
@@ -24,7 +24,7 @@ def extract_header_image_url(html: str, logger: logging.Logger) -> Optional[str]
         Image URL or None
     """
     logger.debug("[extract_header_image_url] Starting header image extraction")
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_document(html)
 
     # Strategy 1: Find wp-post-image inside the entry header's post-thumbnail
     logger.debug(
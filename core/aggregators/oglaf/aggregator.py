@@ -1,11 +1,11 @@
 """Oglaf aggregator implementation."""
 
-import base64
 import logging
 from typing import Any, Dict, Optional
 
 from bs4 import BeautifulSoup, Tag
 
+from ..services.image_extraction.compression import embed_image
 from ..services.image_extraction.fetcher import fetch_single_image
 from ..utils import format_article_content, get_attr_str
 from ..website import FullWebsiteAggregator
@@ -18,7 +18,7 @@ class OglafAggregator(FullWebsiteAggregator):
     Aggregator for Oglaf webcomic.
 
     Ported from legacy TypeScript implementation.
-    Handles extraction of comic images and conversion to base64.
+    Handles extraction of comic images and embedding them locally.
     """
 
     def __init__(self, feed):
@@ -46,8 +46,8 @@ class OglafAggregator(FullWebsiteAggregator):
             ),
             "convert_to_base64": forms.BooleanField(
                 initial=True,
-                label="Convert to Base64",
-                help_text="Download and embed the image as base64 to ensure it displays correctly in all readers.",
+                label="Embed Image",
+                help_text="Download and embed the image (stored locally, or as base64) to ensure it displays correctly in all readers.",
                 required=False,
             ),
         }
@@ -77,7 +77,7 @@ class OglafAggregator(FullWebsiteAggregator):
 
     def process_content(self, html: str, article: Dict[str, Any]) -> str:
         """
-        Process Oglaf content by extracting the comic image and converting to base64.
+        Process Oglaf content by extracting the comic image and embedding it.
         """
         # Get options
         show_alt_text = self.feed.options.get("show_alt_text", True)
@@ -104,15 +104,13 @@ class OglafAggregator(FullWebsiteAggregator):
             alt_text = get_attr_str(comic_img, "alt") or "Oglaf comic"
             joke_text = get_attr_str(comic_img, "title")
 
-            # Fetch image and convert to base64 if enabled
+            # Fetch image and embed it if enabled
             image_result = None
             if convert_to_base64:
                 image_result = fetch_single_image(img_url)
 
             if image_result:
-                b64_data = base64.b64encode(image_result["imageData"]).decode("utf-8")
-                data_uri = f"data:{image_result['contentType']};base64,{b64_data}"
-                img_src = data_uri
+                img_src = embed_image(image_result["imageData"], image_result["contentType"])
             else:
                 img_src = img_url
 
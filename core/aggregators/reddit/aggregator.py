@@ -42,6 +42,7 @@ class RedditAggregator(BaseAggregator):
 
     identifier_field = "reddit_subreddit"
     supports_identifier_search = True
+    supports_concurrent_enrichment = True
 
     def __init__(self, feed):
         """Initialize Reddit aggregator."""
@@ -187,6 +188,7 @@ class RedditAggregator(BaseAggregator):
         source_data = self.fetch_source_data(limit)
         articles = self.parse_to_raw_articles(source_data)
         articles = self.filter_articles(articles)
+        articles = self.remove_existing_articles(articles)
 
         # Respect daily_limit after filtering
         if len(articles) > limit:
@@ -484,45 +486,44 @@ class RedditAggregator(BaseAggregator):
         if not self.feed or not self.feed.user:
             return articles
 
+        return self.enrich_each(articles, self._enrich_article)
+
+    def _enrich_article(self, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Build the content of a single post, returning None if it should be skipped."""
         user_id = self.feed.user.id
 
         # Get comment_limit option (default: 10)
         comment_limit = self.feed.options.get("comment_limit", 10)
 
-        enriched = []
-
-        for article in articles:
-            try:
-                post_data_dict = article.get("_reddit_post_data", {})
-                post_data = RedditPostData(post_data_dict)
-                subreddit = article.get("_reddit_subreddit", "")
-                is_cross_post = article.get("_reddit_is_cross_post", False)
-
-                # Build post content with comments
-                content = build_post_content(
-                    post_data,
-                    comment_limit,
-                    subreddit,
-                    user_id,
-                    is_cross_post,
-                )
-
-                article["raw_content"] = content
-                article["content"] = content
+        try:
+            post_data_dict = article.get("_reddit_post_data", {})
+            post_data = RedditPostData(post_data_dict)
+            subreddit = article.get("_reddit_subreddit", "")
+            is_cross_post = article.get("_reddit_is_cross_post", False)
+
+            # Build post content with comments
+            content = build_post_content(
+                post_data,
+                comment_limit,
+                subreddit,
+                user_id,
+                is_cross_post,
+            )
 
-            except ArticleSkipError:
-                # Skip this article if comments fetch failed with 4xx
-                logger.warning(f"Skipping article due to error: {article.get('name')}")
-                continue
-            except Exception as e:
-                logger.error(f"Error enriching article {article.get('name')}: {e}")
-                # Continue with empty content rather than failing entire aggregation
-                article["raw_content"] = ""
-                article["content"] = ""
+            article["raw_content"] = content
+            article["content"] = content
 
-            enriched.append(article)
+        except ArticleSkipError:
+            # Skip this article if comments fetch failed with 4xx
+            logger.warning(f"Skipping article due to error: {article.get('name')}")
+            return None
+        except Exception as e:
+            logger.error(f"Error enriching article {article.get('name')}: {e}")
+            # Continue with empty content rather than failing entire aggregation
+            article["raw_content"] = ""
+            article["content"] = ""
 
-        return enriched
+        return article
 
     def process_content(self, content: str, article: Dict[str, Any]) -> str:
         """
@@ -542,7 +543,7 @@ class RedditAggregator(BaseAggregator):
             # Fallback to header_data if available (e.g. during article reloads)
             if not header_image_url and article.get("header_data"):
                 header_data = article["header_data"]
-                header_image_url = getattr(header_data, "base64_data_uri", None) or getattr(
+                header_image_url = getattr(header_data, "image_src", None) or getattr(
                     header_data, "image_url", None
                 )
 
@@ -603,7 +604,7 @@ class RedditAggregator(BaseAggregator):
                 if is_youtube_header or is_twitter_header:
                     article["header_image_url"] = header_image_url
                 else:
-                    # Fetch and inline header image (user requirement: base64 encoded)
+                    # Fetch and store header image (base64 encoded if storing fails)
                     try:
                         # Check if it's already a Data URI or a regular URL
                         if header_image_url.startswith("http"):
@@ -616,7 +617,7 @@ class RedditAggregator(BaseAggregator):
                                     is_header=True,
                                 )
                                 if encoded:
-                                    header_image_url = encoded["dataUri"]
+                                    header_image_url = encoded["src"]
                     except Exception as e:
                         logger.warning(
                             f"Failed to inline header image for {article.get('name')}: {e}"
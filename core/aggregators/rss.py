@@ -21,8 +21,20 @@ class RssAggregator(BaseAggregator):
         if limit == 0:
             return []
         source_data = self.fetch_source_data(limit)
+        if source_data.get("not_modified"):
+            self.logger.info("Feed not modified since last poll, skipping run")
+            return []
+        # Remember every download, even one longer than the run limit: an
+        # unchanged feed would only yield the same newest entries again
+        if source_data.get("content_hash"):
+            self.fetch_state = {
+                "fetch_etag": source_data.get("etag", ""),
+                "fetch_last_modified": source_data.get("modified", ""),
+                "fetch_content_hash": source_data["content_hash"],
+            }
         articles = self.parse_to_raw_articles(source_data)
         articles = self.filter_articles(articles)
+        articles = self.remove_existing_articles(articles)
         articles = self.enrich_articles(articles)
         articles = self.finalize_articles(articles)
         return articles
@@ -30,7 +42,15 @@ class RssAggregator(BaseAggregator):
     def fetch_source_data(self, limit: Optional[int] = None) -> Dict[str, Any]:
         """Fetch RSS feed data."""
         self.logger.info(f"Fetching RSS feed: {self.identifier}")
-        data = parse_rss_feed(self.identifier)
+        if not self.conditional_fetch:
+            return parse_rss_feed(self.identifier)
+
+        data = parse_rss_feed(
+            self.identifier,
+            etag=self.feed.fetch_etag,
+            modified=self.feed.fetch_last_modified,
+            previous_hash=self.feed.fetch_content_hash,
+        )
 
         return data
 
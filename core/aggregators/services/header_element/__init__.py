@@ -1,7 +1,7 @@
 """
 Header element extraction service.
 
-Provides functionality for extracting header elements (HTML iframes or base64 images)
+Provides functionality for extracting header elements (HTML iframes or stored images)
 from various sources using Strategy pattern.
 """
 
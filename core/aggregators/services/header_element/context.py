@@ -6,6 +6,8 @@ Dataclass for passing context to header element extraction strategies.
 
 from dataclasses import dataclass
 
+from core.aggregators.utils.page_cache import PageCache
+
 
 @dataclass
 class HeaderElementContext:
@@ -14,6 +16,7 @@ class HeaderElementContext:
     url: str  # Source URL
     alt: str  # Alt text for image/title for iframe
     user_id: int | None = None  # Optional user ID for authenticated API calls
+    page_cache: PageCache | None = None  # Shared article page cache of the running aggregator
 
 
 @dataclass
@@ -22,5 +25,5 @@ class HeaderElementData:
 
     image_bytes: bytes  # Raw image data
     content_type: str  # MIME type (e.g., 'image/jpeg')
-    base64_data_uri: str  # Base64 data URI for embedding in HTML
+    image_src: str  # Stored image URL (or base64 data URI) for embedding in HTML
     image_url: str | None = None  # Original image URL for removal from content
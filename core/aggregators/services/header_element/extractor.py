@@ -8,6 +8,7 @@ Tries strategies in specific order (RedditEmbed BEFORE RedditPost) until one suc
 import logging
 
 from ...exceptions import ArticleSkipError
+from ...utils.page_cache import PageCache
 from ..image_extraction.compression import compress_and_encode_image
 from ..image_extraction.domain_overrides import get_override_image_url
 from ..image_extraction.fetcher import fetch_single_image
@@ -48,7 +49,11 @@ class HeaderElementExtractor:
         ]
 
     def extract_header_element(
-        self, url: str, alt: str = "Article image", user_id: int | None = None
+        self,
+        url: str,
+        alt: str = "Article image",
+        user_id: int | None = None,
+        page_cache: PageCache | None = None,
     ) -> HeaderElementData | None:
         """
         Extract header element from URL using strategy chain.
@@ -63,9 +68,11 @@ class HeaderElementExtractor:
             url: URL to extract header element from
             alt: Alt text / title for element
             user_id: Optional user ID for authenticated API calls (e.g. Reddit)
+            page_cache: Optional page cache shared with content extraction, so the
+                article page is only downloaded and parsed once
 
         Returns:
-            HeaderElementData containing raw bytes and base64 URI, or None if extraction fails
+            HeaderElementData containing raw bytes and image src, or None if extraction fails
 
         Raises:
             ArticleSkipError: On 4xx HTTP errors (article should be skipped)
@@ -80,7 +87,7 @@ class HeaderElementExtractor:
         if override_result is not None:
             return override_result
 
-        context = HeaderElementContext(url=url, alt=alt, user_id=user_id)
+        context = HeaderElementContext(url=url, alt=alt, user_id=user_id, page_cache=page_cache)
 
         # Try each strategy in order
         for strategy in self.strategies:
@@ -150,6 +157,6 @@ class HeaderElementExtractor:
         return HeaderElementData(
             image_bytes=image_result["imageData"],
             content_type=image_result["contentType"],
-            base64_data_uri=encode_result["dataUri"],
+            image_src=encode_result["src"],
             image_url=override_url,
         )
@@ -5,9 +5,6 @@ Handles saving raw image bytes to Django ImageField.
 """
 
 import logging
-import uuid
-
-from django.core.files.base import ContentFile
 
 from core.models import Article
 
@@ -18,14 +15,20 @@ class HeaderElementFileHandler:
     """Handles saving header element images to Article models."""
 
     @staticmethod
-    def save_image_to_article(article: Article, image_bytes: bytes, content_type: str) -> bool:
+    def save_image_to_article(
+        article: Article, image_bytes: bytes, content_type: str, save: bool = True
+    ) -> bool:
         """
         Save image bytes to Article.icon ImageField.
 
+        The bytes are stored once per distinct content (see ImageBlobService).
+
         Args:
             article: Article instance
             image_bytes: Raw image data
             content_type: MIME type
+            save: Save the article; pass False to store the file only and write
+                the icon field later (e.g. with bulk_update)
 
         Returns:
             True if successful, False otherwise
@@ -34,25 +37,14 @@ class HeaderElementFileHandler:
             return False
 
         try:
-            # Generate a unique filename
-            extension = content_type.split("/")[-1]
-            if extension == "jpeg":
-                extension = "jpg"
-            elif "icon" in extension or "vnd.microsoft.icon" in content_type:
-                extension = "ico"
-
-            # Sanitize extension (limit length and remove weird chars)
-            extension = "".join(c for c in extension if c.isalnum())[:4]
-            if not extension:
-                extension = "jpg"
-
-            filename = f"{uuid.uuid4()}.{extension}"
+            from core.services.image_blob_service import ImageBlobService
 
-            # Save to ImageField
-            # This handles file storage and updating the database field
-            article.icon.save(filename, ContentFile(image_bytes), save=True)
+            # Identical images share one content-addressed file
+            blob = ImageBlobService.attach(article, image_bytes, content_type)
+            if save:
+                article.save()
 
-            logger.debug(f"Successfully saved header image to article {article.id}: {filename}")
+            logger.debug(f"Successfully saved header image to article {article.id}: {blob.name}")
             return True
 
         except Exception as e:
@@ -3,7 +3,7 @@ Header element extraction strategies using Strategy Pattern.
 
 Provides strategies for extracting header elements (HTML) from different sources:
 1. RedditEmbedStrategy - Reddit video embeds (vxreddit.com, reddit.com/embed)
-2. RedditPostStrategy - Reddit post subreddit icons (fetches icon, compresses to base64)
+2. RedditPostStrategy - Reddit post subreddit icons (fetches icon, compresses and stores it)
 3. YouTubeStrategy - YouTube video iframes
 4. GenericImageStrategy - Fallback for all other sources (uses ImageExtractor)
 """
@@ -119,7 +119,7 @@ class RedditPostStrategy(HeaderElementStrategy):
             return HeaderElementData(
                 image_bytes=image_result["imageData"],
                 content_type=image_result["contentType"],
-                base64_data_uri=encode_result["dataUri"],
+                image_src=encode_result["src"],
             )
 
         except ArticleSkipError:
@@ -173,7 +173,7 @@ class YouTubeStrategy(HeaderElementStrategy):
             return HeaderElementData(
                 image_bytes=image_result["imageData"],
                 content_type=image_result["contentType"],
-                base64_data_uri=encode_result["dataUri"],
+                image_src=encode_result["src"],
             )
 
         except Exception as e:
@@ -201,7 +201,9 @@ class GenericImageStrategy(HeaderElementStrategy):
         extractor = None
         try:
             extractor = ImageExtractor()
-            image_result = extractor.extract_image_from_url(context.url, is_header_image=True)
+            image_result = extractor.extract_image_from_url(
+                context.url, is_header_image=True, page_cache=context.page_cache
+            )
 
             if not image_result:
                 logger.debug("GenericImageStrategy: No image extracted")
@@ -222,7 +224,7 @@ class GenericImageStrategy(HeaderElementStrategy):
             return HeaderElementData(
                 image_bytes=image_result["imageData"],
                 content_type=image_result["contentType"],
-                base64_data_uri=encode_result["dataUri"],
+                image_src=encode_result["src"],
                 image_url=image_result.get("imageUrl"),
             )
 
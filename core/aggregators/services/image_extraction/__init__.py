@@ -3,11 +3,16 @@ Image extraction and compression service.
 
 Provides functionality for:
 - Extracting images from various sources (URLs, meta tags, pages)
-- Compressing and encoding images
+- Compressing images and embedding them by URL or as base64
 - HTTP image fetching with validation
 """
 
-from .compression import compress_and_encode_image, compress_image, create_image_element
+from .compression import (
+    compress_and_encode_image,
+    compress_image,
+    create_image_element,
+    embed_image,
+)
 from .fetcher import fetch_single_image
 
 __all__ = [
@@ -15,4 +20,5 @@ __all__ = [
     "compress_image",
     "compress_and_encode_image",
     "create_image_element",
+    "embed_image",
 ]
@@ -2,17 +2,24 @@
 Image compression and encoding utilities.
 
 Handles:
-- Image resizing and format conversion using Pillow
-- Base64 encoding for data URIs
+- Image resizing and format conversion using Pillow, in the image worker
+  pool (core.image_processing)
+- Storing images for embedding by URL, or base64 encoding for data URIs
 - Quality optimization
+- Caching of compressed variants, so recurring images are encoded once
 """
 
 import base64
-import io
+import hashlib
 import logging
+import time
 from typing import Any, Dict, Optional
 
-from PIL import Image
+from django.conf import settings
+
+from core import image_processing
+
+from .fetch_cache import CachedImage, get_image_fetch_cache
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +33,18 @@ WEBP_QUALITY = 95
 PREFER_WEBP = True
 MIN_IMAGE_SIZE = 5000  # 5KB - skip compression if smaller
 
+# Part of the variant cache key; bump when compress_image output changes for
+# the same settings (e.g. a different resampling filter or encoder method)
+VARIANT_VERSION = 2
+
+# Compressed variants never go stale, they are only evicted when unused
+VARIANT_TTL = 10 * 365 * 24 * 3600
+
+# Default BASE_URL; image URLs below it only work on the server itself
+LOCAL_BASE_URL = "http://localhost:8000"
+
+_warned_local_base_url = False
+
 
 def compress_image(
     image_data: bytes,
@@ -36,7 +55,7 @@ def compress_image(
     Compress and convert image to optimized format.
 
     Process:
-    1. Load image with Pillow
+    1. Load image with Pillow (large JPEGs at a reduced scale)
     2. Resize if larger than max dimensions (never upscale)
     3. Convert to WebP or JPEG (prefer WebP)
     4. Return compressed data and metadata
@@ -53,114 +72,91 @@ def compress_image(
             - size: Size in bytes
             - width: Output width
             - height: Output height
+        Returns None if compression fails
     """
-    try:
-        # Skip compression for very small files
-        if len(image_data) < MIN_IMAGE_SIZE:
-            logger.debug(f"Skipping compression for small image ({len(image_data)} bytes)")
-            return {
-                "data": image_data,
-                "contentType": content_type,
-                "size": len(image_data),
-                "width": None,
-                "height": None,
-            }
-
-        # Load image
-        img: Any = Image.open(io.BytesIO(image_data))
-
-        # Convert RGBA to RGB if needed (for JPEG)
-        if img.mode in ("RGBA", "LA", "P"):
-            # Check if image has transparency
-            if img.mode == "P" and "transparency" in img.info:
-                # Keep as PNG
-                output_format = "PNG"
-            elif img.mode == "RGBA" or img.mode == "LA":
-                # Has transparency, keep as PNG or use WEBP
-                output_format = "WEBP" if PREFER_WEBP else "PNG"
-            else:
-                # No transparency, convert to RGB
-                background = Image.new("RGB", img.size, (255, 255, 255))
-                background.paste(img, mask=img.split()[-1] if img.mode == "RGBA" else None)
-                img = background
-                output_format = "WEBP" if PREFER_WEBP else "JPEG"
-        else:
-            output_format = "WEBP" if PREFER_WEBP else "JPEG"
-
-        # Get original dimensions
-        original_width, original_height = img.size
-
-        # Calculate resize ratio
-        if is_header:
-            max_width = MAX_HEADER_IMAGE_WIDTH
-            max_height = MAX_HEADER_IMAGE_HEIGHT
-            # Never upscale
-            ratio = min(max_width / original_width, max_height / original_height, 1.0)
-        else:
-            # Do not shrink non-header images
-            ratio = 1.0
-
-        if ratio < 1.0:
-            # Resize using high-quality resampling
-            new_width = int(original_width * ratio)
-            new_height = int(original_height * ratio)
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            logger.debug(
-                f"Resized image from {original_width}x{original_height} to {new_width}x{new_height}"
-            )
-        else:
-            new_width, new_height = original_width, original_height
-
-        # Compress and encode
-        output = io.BytesIO()
-
-        if output_format == "WEBP":
-            img.save(
-                output,
-                format="WEBP",
-                quality=WEBP_QUALITY,
-                method=6,  # Slowest but best quality
-            )
-            content_type = "image/webp"
-        elif output_format == "PNG":
-            img.save(output, format="PNG", optimize=True)
-            content_type = "image/png"
-        else:  # JPEG
-            # Convert to RGB if needed
-            if img.mode != "RGB":
-                img = img.convert("RGB")
-            img.save(
-                output,
-                format="JPEG",
-                quality=JPEG_QUALITY,
-                optimize=True,
-                progressive=True,
+    # Skip compression for very small files
+    if len(image_data) < MIN_IMAGE_SIZE:
+        logger.debug(f"Skipping compression for small image ({len(image_data)} bytes)")
+        return {
+            "data": image_data,
+            "contentType": content_type,
+            "size": len(image_data),
+            "width": None,
+            "height": None,
+        }
+
+    # Recurring images (override images, subreddit icons, site logos) were
+    # most likely compressed before with the same settings
+    cache = get_image_fetch_cache()
+    key = _variant_key(image_data, is_header)
+    cached = cache.get(key) if cache else None
+    if cached:
+        logger.debug(f"Using cached compressed image ({len(cached.data)} bytes)")
+        return {
+            "data": cached.data,
+            "contentType": cached.content_type,
+            "size": len(cached.data),
+            "width": cached.width,
+            "height": cached.height,
+        }
+
+    result = _compress_image(image_data, is_header)
+    if result and cache:
+        cache.put(
+            CachedImage(
+                url=key,
+                expires=time.time() + VARIANT_TTL,
+                content_type=result["contentType"],
+                width=result["width"],
+                height=result["height"],
+                data=result["data"],
             )
-            content_type = "image/jpeg"
+        )
+    return result
 
-        compressed_data = output.getvalue()
 
-        # Log compression ratio
-        original_size = len(image_data)
-        compressed_size = len(compressed_data)
-        ratio_pct = (1 - compressed_size / original_size) * 100 if original_size > 0 else 0
+def _variant_key(image_data: bytes, is_header: bool) -> str:
+    """
+    Get the variant cache key of a compress_image call.
 
-        logger.debug(
-            f"Compressed image: {original_size}b -> {compressed_size}b ({ratio_pct:.1f}% reduction) [{content_type}]"
-        )
+    Covers everything the output depends on: the source bytes, the target
+    size and the output format and quality.
+    """
+    digest = hashlib.sha256(image_data).hexdigest()
+    target = f"{MAX_HEADER_IMAGE_WIDTH}x{MAX_HEADER_IMAGE_HEIGHT}" if is_header else "original"
+    output = f"webp-q{WEBP_QUALITY}" if PREFER_WEBP else f"jpeg-q{JPEG_QUALITY}"
+    return f"variant:v{VARIANT_VERSION}:{digest}:{target}:{output}"
 
-        return {
-            "data": compressed_data,
-            "contentType": content_type,
-            "size": compressed_size,
-            "width": new_width,
-            "height": new_height,
-        }
 
+def _compress_image(image_data: bytes, is_header: bool) -> Dict[str, Any] | None:
+    """Decode, resize and re-encode an image (uncached part of compress_image)."""
+    # Do not shrink non-header images
+    max_size = (MAX_HEADER_IMAGE_WIDTH, MAX_HEADER_IMAGE_HEIGHT) if is_header else None
+
+    try:
+        # Off the calling thread, see core.image_processing
+        result = image_processing.run(
+            image_processing.resize_and_encode,
+            image_data,
+            max_size,
+            PREFER_WEBP,
+            WEBP_QUALITY,
+            JPEG_QUALITY,
+        )
     except Exception as e:
         logger.error(f"Error compressing image: {e}")
         return None
 
+    if result:
+        # Log compression ratio
+        original_size = len(image_data)
+        ratio_pct = (1 - result["size"] / original_size) * 100 if original_size > 0 else 0
+        logger.debug(
+            f"Compressed image: {original_size}b -> {result['size']}b "
+            f"({ratio_pct:.1f}% reduction) [{result['contentType']}]"
+        )
+    return result
+
 
 def compress_and_encode_image(
     image_data: bytes,
@@ -168,12 +164,11 @@ def compress_and_encode_image(
     is_header: bool = False,
 ) -> Optional[Dict[str, Any]]:
     """
-    Compress image and encode as base64 data URI.
+    Compress image and get the src to embed it in article content.
 
     Process:
     1. Compress image using compress_image()
-    2. Base64 encode compressed data
-    3. Create data URI
+    2. Store the compressed image, or base64 encode it (see embed_image())
 
     Args:
         image_data: Raw image bytes
@@ -182,7 +177,7 @@ def compress_and_encode_image(
 
     Returns:
         Dict with keys:
-            - dataUri: Complete data URI for HTML (data:image/...;base64,...)
+            - src: Media URL of the stored image, or data URI (data:image/...;base64,...)
             - size: Compressed size in bytes
             - outputType: Output MIME type
         Returns None if compression fails
@@ -192,34 +187,74 @@ def compress_and_encode_image(
         if not result:
             return None
 
-        compressed_data = result["data"]
-        output_type = result["contentType"]
-
-        # Base64 encode
-        b64_str = base64.b64encode(compressed_data).decode("utf-8")
-        data_uri = f"data:{output_type};base64,{b64_str}"
-
-        logger.debug(f"Created data URI ({len(data_uri)} chars)")
-
         return {
-            "dataUri": data_uri,
+            "src": embed_image(result["data"], result["contentType"]),
             "size": result["size"],
-            "outputType": output_type,
+            "outputType": result["contentType"],
         }
 
     except Exception as e:
-        logger.error(f"Error encoding image to data URI: {e}")
+        logger.error(f"Error encoding image: {e}")
         return None
 
 
-def create_image_element(data_uri: str, alt: str = "Image") -> str:
+def embed_image(image_data: bytes, content_type: str) -> str:
+    """
+    Get the src for embedding an image in article content.
+
+    With AGGREGATOR_IMAGE_EMBED="file" (default) the image is stored once per
+    distinct content (see ImageBlobService) and referenced by its media URL,
+    so article rows and API responses do not carry the bytes. A base64 data
+    URI is the fallback if storing fails or BASE_URL is still the local
+    default, and the only form with "base64".
+
+    Args:
+        image_data: Image bytes
+        content_type: Image MIME type
+
+    Returns:
+        Absolute media URL or data URI
+    """
+    if _embed_as_file():
+        try:
+            from core.services.image_blob_service import ImageBlobService
+
+            return ImageBlobService.url(ImageBlobService.store(image_data, content_type))
+        except Exception as e:
+            logger.warning(f"Could not store image, embedding it as data URI: {e}")
+
+    b64_str = base64.b64encode(image_data).decode("utf-8")
+    data_uri = f"data:{content_type};base64,{b64_str}"
+    logger.debug(f"Created data URI ({len(data_uri)} chars)")
+    return data_uri
+
+
+def _embed_as_file() -> bool:
+    """Whether embed_image stores images as files (warns once if BASE_URL is the default)."""
+    global _warned_local_base_url
+
+    if getattr(settings, "AGGREGATOR_IMAGE_EMBED", "file") != "file":
+        return False
+    if settings.BASE_URL == LOCAL_BASE_URL:
+        # Content keeps absolute image URLs, never bake localhost into it
+        if not _warned_local_base_url:
+            logger.warning(
+                f"BASE_URL is the default {LOCAL_BASE_URL}, embedding images as data URIs; "
+                "set BASE_URL to the public URL to store them as files"
+            )
+            _warned_local_base_url = True
+        return False
+    return True
+
+
+def create_image_element(src: str, alt: str = "Image") -> str:
     """
-    Create HTML image element from data URI.
+    Create HTML image element from an image src.
 
     Wraps image in <p> tag with responsive styling.
 
     Args:
-        data_uri: Base64 data URI
+        src: Image URL or data URI (see embed_image())
         alt: Alt text for accessibility
 
     Returns:
@@ -228,6 +263,4 @@ def create_image_element(data_uri: str, alt: str = "Image") -> str:
     # Escape alt text for HTML
     alt_escaped = alt.replace('"', "&quot;").replace("<", "&lt;").replace(">", "&gt;")
 
-    return (
-        f'<p><img src="{data_uri}" alt="{alt_escaped}" style="max-width: 100%; height: auto;"></p>'
-    )
+    return f'<p><img src="{src}" alt="{alt_escaped}" style="max-width: 100%; height: auto;"></p>'
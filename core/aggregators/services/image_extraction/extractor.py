@@ -11,7 +11,11 @@ from typing import Any, Dict, Optional
 import requests
 from bs4 import BeautifulSoup
 
+from core import http_client
+
 from ...exceptions import ArticleSkipError
+from ...utils.html_parser import parse_document
+from ...utils.page_cache import PageCache
 from .domain_overrides import get_override_image_url
 from .fetcher import fetch_single_image
 from .strategies import (
@@ -52,7 +56,7 @@ class ImageExtractor:
         ]
 
     def extract_image_from_url(
-        self, url: str, is_header_image: bool = False
+        self, url: str, is_header_image: bool = False, page_cache: Optional[PageCache] = None
     ) -> Optional[Dict[str, Any]]:
         """
         Extract image from URL using strategy chain.
@@ -67,6 +71,8 @@ class ImageExtractor:
         Args:
             url: URL to extract image from
             is_header_image: Whether this is for a header (affects size validation)
+            page_cache: Optional page cache to fetch the page through (shared with
+                content extraction)
 
         Returns:
             Dict with imageData and contentType, or None if extraction fails
@@ -115,7 +121,7 @@ class ImageExtractor:
 
         try:
             # Fetch and parse page
-            context.soup = self._fetch_and_parse_page(url)
+            context.soup = self._fetch_and_parse_page(url, page_cache)
             if not context.soup:
                 logger.debug("ImageExtractor: Failed to fetch/parse page")
                 return None
@@ -146,27 +152,40 @@ class ImageExtractor:
         return None
 
     @staticmethod
-    def _fetch_and_parse_page(url: str) -> Optional[BeautifulSoup]:
+    def _fetch_and_parse_page(
+        url: str, page_cache: Optional[PageCache] = None
+    ) -> Optional[BeautifulSoup]:
         """
         Fetch and parse page HTML using requests + BeautifulSoup.
 
+        When a page cache is given, the page is fetched through it so content
+        extraction can reuse the download and the parsed soup.
+
         Args:
             url: URL to fetch
+            page_cache: Optional shared page cache
 
         Returns:
             BeautifulSoup object, or None if fetch fails
         """
         try:
+            if page_cache is not None:
+                soup = page_cache.get_soup(url)
+                logger.debug(f"ImageExtractor: Got parsed page from page cache for {url}")
+                return soup
+
             # Set headers for HTTP request
             headers = {
                 "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
             }
 
-            response = requests.get(url, headers=headers, timeout=10, allow_redirects=True)
+            response = http_client.get(
+                url, headers=headers, timeout=10, allow_redirects=True, polite=True
+            )
             response.raise_for_status()
 
             # Parse with BeautifulSoup
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = parse_document(response.content)
             logger.debug(f"ImageExtractor: Successfully fetched and parsed {url}")
             return soup
 
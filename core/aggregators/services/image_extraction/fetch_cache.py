@@ -0,0 +1,351 @@
+"""
+On-disk HTTP cache for image fetches.
+
+The same image URLs come up again and again across articles and feed runs
+(subreddit icons, YouTube thumbnails, domain override images). Responses are
+cached by URL in AGGREGATOR_IMAGE_CACHE_DIR, shared by all worker processes:
+
+- Freshness follows Cache-Control (no-store, no-cache, max-age) and Expires;
+  responses without either are kept for DEFAULT_TTL
+- Stale entries with an ETag or Last-Modified are revalidated with a
+  conditional request, so an unchanged image is not downloaded again
+- Failures that will not fix themselves soon (404/410 and other client
+  errors, wrong content type, image too small) are cached as negative
+  entries for NEGATIVE_TTL
+- Total size is bounded by AGGREGATOR_IMAGE_CACHE_SIZE (MB); the least
+  recently used entries are evicted first
+"""
+
+import contextlib
+import email.utils
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_SIZE_MB = 256
+
+# Lifetime of responses without Cache-Control/Expires, and upper bound for all
+DEFAULT_TTL = 24 * 3600
+MAX_TTL = 30 * 24 * 3600
+
+# Lifetime of negative entries
+NEGATIVE_TTL = 6 * 3600
+
+# HTTP statuses cached as negative entries (not 408/429 or server errors,
+# which are usually transient)
+NEGATIVE_STATUS_CODES = {400, 401, 403, 404, 410, 451}
+
+# Eviction scans the cache directory after this fraction of the size bound
+# has been written by the process
+EVICTION_CHECK_FRACTION = 0.05
+
+# Eviction removes entries until the cache is below this fraction of the bound
+EVICTION_TARGET_FRACTION = 0.9
+
+# Larger entries are not cached, they would evict much of the cache
+MAX_ENTRY_FRACTION = 0.05
+
+
+@dataclass
+class CachedImage:
+    """A cached image fetch: the image, or the reason it could not be used."""
+
+    url: str
+    expires: float  # Unix time the entry stops being fresh
+    content_type: str = ""
+    etag: str = ""
+    last_modified: str = ""
+    error: str = ""  # Set for negative entries
+    width: int | None = None  # Dimensions, known for derived variants
+    height: int | None = None
+    data: bytes = b""
+
+    @property
+    def is_negative(self) -> bool:
+        return bool(self.error)
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        return self.expires > (time.time() if now is None else now)
+
+    def validators(self) -> Dict[str, str]:
+        """Get conditional request headers to revalidate a stale entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def result(self) -> Optional[Dict[str, Any]]:
+        """Get the entry in fetch_single_image's return format."""
+        if self.is_negative:
+            return None
+        return {"imageData": self.data, "contentType": self.content_type}
+
+
+def freshness_lifetime(headers: Mapping[str, str]) -> Optional[int]:
+    """
+    Get how long a response may be served from the cache.
+
+    Args:
+        headers: Response headers
+
+    Returns:
+        Seconds (0: revalidate before every use), or None if the response
+        must not be stored
+    """
+    directives = {}
+    for part in headers.get("Cache-Control", "").split(","):
+        name, _, value = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0
+    if "max-age" in directives:
+        try:
+            return min(max(int(directives["max-age"]), 0), MAX_TTL)
+        except ValueError:
+            return 0
+
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            expires_at = email.utils.parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError):
+            # Invalid dates (e.g. "0") mean already expired
+            return 0
+        return min(max(int(expires_at - time.time()), 0), MAX_TTL)
+
+    return DEFAULT_TTL
+
+
+class ImageFetchCache:
+    """
+    Bounded on-disk cache of image fetches, keyed by URL.
+
+    Each entry is one file: a JSON metadata line followed by the image
+    bytes. Files are replaced atomically, so concurrent processes only ever
+    read complete entries. The file modification time records the last use
+    and drives LRU eviction.
+    """
+
+    def __init__(self, directory: Path, max_size: int):
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Directory holding the entries
+            max_size: Maximum total size of the entries in bytes
+        """
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self._written = 0
+        self._lock = threading.Lock()
+
+    def _path(self, url: str) -> Path:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return self.directory / key[:2] / f"{key}.entry"
+
+    def get(self, url: str) -> Optional[CachedImage]:
+        """
+        Get the entry for a URL, fresh or stale.
+
+        Args:
+            url: Image URL (or other key, see compression.compress_image)
+
+        Returns:
+            CachedImage, or None if the URL is not cached
+        """
+        path = self._path(url)
+        try:
+            with open(path, "rb") as f:
+                meta = json.loads(f.readline())
+                data = f.read()
+            entry = CachedImage(**meta, data=data)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug(f"Dropping unreadable image cache entry for {url}: {e}")
+            self._remove(path)
+            return None
+
+        if entry.url != url:
+            # Hash collision
+            return None
+
+        # Mark as recently used
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return entry
+
+    def put(self, entry: CachedImage) -> None:
+        """
+        Store an entry, replacing the URL's previous one.
+
+        Args:
+            entry: Entry to store
+        """
+        meta = asdict(entry)
+        del meta["data"]
+        try:
+            content = json.dumps(meta).encode() + b"\n" + entry.data
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Not caching image fetch of {entry.url}: {e}")
+            return
+        if len(content) > self.max_size * MAX_ENTRY_FRACTION:
+            return
+
+        path = self._path(entry.url)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(content)
+                os.replace(temp_path, path)
+            except BaseException:
+                self._remove(Path(temp_path))
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write image cache entry for {entry.url}: {e}")
+            return
+
+        with self._lock:
+            self._written += len(content)
+            check = self._written >= self.max_size * EVICTION_CHECK_FRACTION
+            if check:
+                self._written = 0
+        if check:
+            self.evict()
+
+    def put_response(
+        self, url: str, headers: Mapping[str, str], data: bytes, content_type: str
+    ) -> None:
+        """
+        Store a successful image response if its headers allow caching.
+
+        Args:
+            url: Image URL
+            headers: Response headers
+            data: Image bytes
+            content_type: Image MIME type
+        """
+        lifetime = freshness_lifetime(headers)
+        etag = headers.get("ETag", "")
+        last_modified = headers.get("Last-Modified", "")
+        if lifetime is None or (lifetime == 0 and not (etag or last_modified)):
+            return
+
+        self.put(
+            CachedImage(
+                url=url,
+                expires=time.time() + lifetime,
+                content_type=content_type,
+                etag=etag,
+                last_modified=last_modified,
+                data=data,
+            )
+        )
+
+    def put_negative(self, url: str, error: str) -> None:
+        """
+        Remember that a URL did not yield a usable image.
+
+        Args:
+            url: Image URL
+            error: Why the image could not be used
+        """
+        self.put(CachedImage(url=url, expires=time.time() + NEGATIVE_TTL, error=error))
+
+    def revalidated(self, entry: CachedImage, headers: Mapping[str, str]) -> None:
+        """
+        Extend a stale entry after the server answered 304 Not Modified.
+
+        Args:
+            entry: The revalidated entry
+            headers: Headers of the 304 response
+        """
+        lifetime = freshness_lifetime(headers)
+        if lifetime is None:
+            self._remove(self._path(entry.url))
+            return
+        entry.expires = time.time() + lifetime
+        entry.etag = headers.get("ETag", entry.etag)
+        entry.last_modified = headers.get("Last-Modified", entry.last_modified)
+        self.put(entry)
+
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits its size bound.
+
+        Returns:
+            Number of removed entries
+        """
+        entries = []
+        total = 0
+        for path in self.directory.glob("*/*.entry"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        if total <= self.max_size:
+            return 0
+
+        removed = 0
+        target = self.max_size * EVICTION_TARGET_FRACTION
+        for _mtime, size, path in sorted(entries):
+            if total <= target:
+                break
+            self._remove(path)
+            total -= size
+            removed += 1
+
+        logger.debug(f"Evicted {removed} image cache entries")
+        return removed
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        with contextlib.suppress(OSError):
+            path.unlink()
+
+
+def get_image_fetch_cache() -> Optional[ImageFetchCache]:
+    """
+    Get the image fetch cache configured in settings.
+
+    Configured via AGGREGATOR_IMAGE_CACHE_DIR (default: data/image-cache) and
+    AGGREGATOR_IMAGE_CACHE_SIZE in MB (default: 256, 0 disables the cache).
+
+    Returns:
+        ImageFetchCache, or None if disabled
+    """
+    size_mb = getattr(settings, "AGGREGATOR_IMAGE_CACHE_SIZE", DEFAULT_MAX_SIZE_MB)
+    directory = getattr(settings, "AGGREGATOR_IMAGE_CACHE_DIR", "") or str(
+        Path(settings.BASE_DIR) / "data" / "image-cache"
+    )
+    if size_mb <= 0:
+        return None
+    return _get_cache(str(directory), int(size_mb * 1024 * 1024))
+
+
+@lru_cache(maxsize=4)
+def _get_cache(directory: str, max_size: int) -> ImageFetchCache:
+    return ImageFetchCache(Path(directory), max_size)
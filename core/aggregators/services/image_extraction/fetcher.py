@@ -6,6 +6,7 @@ Handles downloading images from URLs with proper:
 - MIME type detection and validation
 - Timeout handling
 - Error handling
+- Caching of fetched images (see fetch_cache)
 """
 
 import logging
@@ -14,6 +15,10 @@ from urllib.parse import urlparse
 
 import requests
 
+from core import http_client
+
+from .fetch_cache import NEGATIVE_STATUS_CODES, get_image_fetch_cache
+
 logger = logging.getLogger(__name__)
 
 # HTTP configuration
@@ -92,7 +97,8 @@ def fetch_single_image(url: str, timeout: int = DEFAULT_TIMEOUT) -> Optional[Dic
     - HTTP fetching with proper headers
     - Content-type validation
     - Timeout handling
-    - Size validation (must be > 1KB)
+    - Size validation (must be > 100 bytes)
+    - Caching of results, including failures (see fetch_cache)
 
     Args:
         url: URL to fetch image from
@@ -108,35 +114,61 @@ def fetch_single_image(url: str, timeout: int = DEFAULT_TIMEOUT) -> Optional[Dic
         logger.warning("Empty URL provided to fetch_single_image")
         return None
 
+    cache = get_image_fetch_cache()
+    cached = cache.get(url) if cache else None
+    if cached and cached.is_fresh():
+        logger.debug(f"Image cache hit ({cached.error or 'ok'}): {url}")
+        return cached.result()
+
     try:
         logger.debug(f"Fetching image from {url}")
 
         headers = get_image_headers(url)
-        response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+        if cached:
+            headers.update(cached.validators())
+        response = http_client.get(
+            url, headers=headers, timeout=timeout, allow_redirects=True, polite=True
+        )
+
+        if cache and cached and cached.validators() and response.status_code == 304:
+            logger.debug(f"Image not modified: {url}")
+            cache.revalidated(cached, response.headers)
+            return cached.result()
 
         # Check for HTTP errors
         try:
             response.raise_for_status()
         except requests.exceptions.HTTPError as e:
-            logger.warning(f"HTTP {e.response.status_code} fetching {url}")
+            status_code = e.response.status_code
+            logger.warning(f"HTTP {status_code} fetching {url}")
+            if cache and status_code in NEGATIVE_STATUS_CODES:
+                cache.put_negative(url, f"HTTP {status_code}")
             raise
 
         # Validate content type
         content_type = response.headers.get("Content-Type", "")
         if not is_image_content_type(content_type):
             logger.warning(f"Invalid content type for image: {content_type}")
+            if cache:
+                cache.put_negative(url, f"content type {content_type}")
             return None
 
         # Validate content length
         image_data = response.content
         if len(image_data) < 100:  # Minimum 100 bytes
             logger.debug(f"Image too small ({len(image_data)} bytes): {url}")
+            if cache:
+                cache.put_negative(url, "image too small")
             return None
 
+        content_type = content_type.split(";")[0].strip()
+        if cache:
+            cache.put_response(url, response.headers, image_data, content_type)
+
         logger.debug(f"Successfully fetched image ({len(image_data)} bytes): {url}")
         return {
             "imageData": image_data,
-            "contentType": content_type.split(";")[0].strip(),
+            "contentType": content_type,
         }
 
     except requests.exceptions.Timeout:
@@ -1,8 +1,8 @@
 """Tagesschau content extraction logic."""
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
-from ..utils import get_attr_list
+from ..utils import get_attr_list, parse_document
 
 
 def extract_tagesschau_content(html: str) -> str:
@@ -15,7 +15,7 @@ def extract_tagesschau_content(html: str) -> str:
     Returns:
         Extracted HTML content
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_document(html)
     content_div = soup.new_tag("div")
     content_div["data-sanitized-class"] = "article-content"
 
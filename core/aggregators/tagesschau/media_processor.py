@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional
 
 from bs4 import BeautifulSoup, Tag
 
-from ..utils import get_attr_list, get_attr_str
+from ..utils import get_attr_list, get_attr_str, parse_document
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +15,7 @@ def extract_media_header(html: str) -> Optional[str]:
     """
     Extract video or audio header from Tagesschau article page.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = parse_document(html)
     players = _get_media_players(soup)
 
     for player_div in players:
@@ -6,6 +6,7 @@ from .content_formatter import format_article_content
 from .html_cleaner import (
     clean_data_attributes,
     clean_html,
+    remove_comments,
     remove_empty_elements,
     remove_image_by_url,
     remove_sanitized_attributes,
@@ -14,13 +15,21 @@ from .html_cleaner import (
     sanitize_html_attributes,
 )
 from .html_fetcher import fetch_html
+from .html_parser import get_document_parser, parse_document
+from .html_pipeline import HtmlPipeline
+from .page_cache import PageCache
 from .rss_parser import parse_rss_feed
 
 __all__ = [
     "parse_rss_feed",
     "fetch_html",
+    "parse_document",
+    "get_document_parser",
+    "PageCache",
     "extract_main_content",
+    "HtmlPipeline",
     "clean_html",
+    "remove_comments",
     "remove_selectors",
     "remove_empty_elements",
     "clean_data_attributes",
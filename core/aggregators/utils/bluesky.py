@@ -16,6 +16,8 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
+from core import http_client
+
 logger = logging.getLogger(__name__)
 
 # Public (unauthenticated) Bluesky AppView API endpoint
@@ -85,9 +87,7 @@ def resolve_bluesky_did(actor: str, timeout: int = 10) -> Optional[str]:
 
     try:
         url = f"{BSKY_API_BASE}/xrpc/com.atproto.identity.resolveHandle"
-        headers = {"User-Agent": "Yana/1.0"}
-
-        response = requests.get(url, params={"handle": actor}, headers=headers, timeout=timeout)
+        response = http_client.get(url, params={"handle": actor}, timeout=timeout)
         response.raise_for_status()
 
         did = response.json().get("did")
@@ -129,9 +129,7 @@ def fetch_bluesky_post(actor: str, rkey: str, timeout: int = 10) -> Optional[Dic
 
     try:
         url = f"{BSKY_API_BASE}/xrpc/app.bsky.feed.getPosts"
-        headers = {"User-Agent": "Yana/1.0"}
-
-        response = requests.get(url, params={"uris": at_uri}, headers=headers, timeout=timeout)
+        response = http_client.get(url, params={"uris": at_uri}, timeout=timeout)
         response.raise_for_status()
 
         posts = response.json().get("posts") or []
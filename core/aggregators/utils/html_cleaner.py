@@ -51,13 +51,22 @@ def clean_html(html: str) -> str:
     """
     soup = BeautifulSoup(html, "html.parser")
 
-    # Remove comments
-    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-        comment.extract()
+    remove_comments(soup)
 
     return str(soup)
 
 
+def remove_comments(soup: Union[BeautifulSoup, Tag]) -> None:
+    """
+    Remove HTML comments from soup.
+
+    Args:
+        soup: BeautifulSoup or Tag object
+    """
+    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        comment.extract()
+
+
 def remove_selectors(soup: Union[BeautifulSoup, Tag], selectors: List[str]) -> None:
     """
     Remove elements matching CSS selectors from soup.
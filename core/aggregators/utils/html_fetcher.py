@@ -4,7 +4,10 @@ import time
 
 import requests
 
-USER_AGENT = "Mozilla/5.0 (compatible; YanaBot/1.0; +https://github.com/yourusername/yana)"
+from core import http_client
+from core.http_client import USER_AGENT
+from core.rate_limiter import HostRateLimitedError
+
 DEFAULT_RETRIES = 3
 
 
@@ -36,7 +39,9 @@ def fetch_html(url: str, timeout: int = 30) -> str:
 
     for attempt in range(retries):
         try:
-            response = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+            response = http_client.get(
+                url, headers=headers, timeout=timeout, allow_redirects=True, polite=True
+            )
             response.raise_for_status()
 
             # requests defaults to ISO-8859-1 for text/html without explicit
@@ -52,9 +57,17 @@ def fetch_html(url: str, timeout: int = 30) -> str:
 
             return response.text
 
+        except HostRateLimitedError:
+            # The host is paced or blocked for longer than we are willing to wait
+            raise
         except requests.RequestException as e:
+            # Client errors will not go away on retry (429 is rate limiting and may)
+            status_code = e.response.status_code if e.response is not None else None
+            if status_code is not None and 400 <= status_code < 500 and status_code != 429:
+                raise
             last_exception = e
-            if attempt < retries - 1:
+            # After a 429 the rate limiter holds the next attempt until Retry-After
+            if attempt < retries - 1 and status_code != 429:
                 wait_time = 2**attempt  # Exponential backoff
                 time.sleep(wait_time)
             continue
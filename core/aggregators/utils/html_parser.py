@@ -0,0 +1,54 @@
+"""HTML parser backend selection for BeautifulSoup."""
+
+import logging
+from functools import lru_cache
+from typing import Optional, Union
+
+from django.conf import settings
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARSER = "lxml"
+FALLBACK_PARSER = "html.parser"
+
+
+def get_document_parser() -> str:
+    """
+    Get the BeautifulSoup backend used for full pages.
+
+    Configured via the AGGREGATOR_HTML_PARSER setting (default: lxml). Falls
+    back to html.parser if the configured backend is not installed.
+    """
+    parser = getattr(settings, "AGGREGATOR_HTML_PARSER", DEFAULT_PARSER) or FALLBACK_PARSER
+    return _resolve_parser(parser)
+
+
+@lru_cache(maxsize=None)
+def _resolve_parser(parser: str) -> str:
+    """Return the parser if it is installed, else the fallback (warns once)."""
+    try:
+        BeautifulSoup("", parser)
+    except FeatureNotFound:
+        logger.warning(f"HTML parser '{parser}' is not available, using {FALLBACK_PARSER}")
+        return FALLBACK_PARSER
+    return parser
+
+
+def parse_document(markup: Union[str, bytes], parser: Optional[str] = None) -> BeautifulSoup:
+    """
+    Parse a full HTML page with the configured backend.
+
+    Only use this for complete documents. lxml wraps fragments in
+    <html><body>, so content snippets that are serialised again must keep
+    using html.parser.
+
+    Args:
+        markup: HTML document
+        parser: Backend to use instead of the configured one
+
+    Returns:
+        Parsed document
+    """
+    return BeautifulSoup(markup, parser or get_document_parser())
@@ -0,0 +1,140 @@
+"""Single-parse HTML processing pipeline for article content."""
+
+from typing import List, Optional, Union
+
+from bs4 import BeautifulSoup, Tag
+
+from .html_cleaner import (
+    remove_comments,
+    remove_empty_elements,
+    remove_image_by_url,
+    remove_sanitized_attributes,
+    remove_selectors,
+    sanitize_class_names,
+    sanitize_html_attributes,
+)
+from .html_parser import parse_document
+from .youtube import proxy_youtube_embeds
+
+
+class HtmlPipeline:
+    """
+    Carry one parsed tree through the content processing steps.
+
+    Every step modifies the tree in place and returns the pipeline, so steps
+    can be chained:
+
+        HtmlPipeline.extract(html, "article", ["script"])
+            .proxy_youtube_embeds()
+            .remove_image_by_url(header_image_url)
+            .sanitize_class_names()
+            .remove_comments()
+            .to_html()
+
+    The tree is parsed once and serialised once, by to_html().
+    """
+
+    def __init__(self, root: Union[BeautifulSoup, Tag]):
+        """
+        Initialize the pipeline.
+
+        Args:
+            root: Parsed document or element to process (modified in place)
+        """
+        self.root = root
+
+    @classmethod
+    def parse(cls, html: Union[str, BeautifulSoup, Tag]) -> "HtmlPipeline":
+        """
+        Start a pipeline from HTML, or from an already parsed tree.
+
+        Args:
+            html: HTML string, or a parsed document/element (used as is)
+        """
+        if isinstance(html, Tag):
+            return cls(html)
+        return cls(BeautifulSoup(html, "html.parser"))
+
+    @classmethod
+    def extract(
+        cls,
+        html: Union[str, BeautifulSoup],
+        selector: str,
+        remove_selectors: Optional[List[str]] = None,
+    ) -> "HtmlPipeline":
+        """
+        Start a pipeline from the main content of a page.
+
+        Args:
+            html: Full HTML document, or an already parsed document (modified in place)
+            selector: CSS selector for main content
+            remove_selectors: CSS selectors for elements to remove
+
+        Returns:
+            Pipeline over the main content element (the body if nothing matches)
+        """
+        soup = html if isinstance(html, BeautifulSoup) else parse_document(html)
+
+        # Find main content
+        content = soup.select_one(selector)
+
+        if not isinstance(content, Tag):
+            # Fallback: use entire body
+            body = soup.find("body")
+            content = body if isinstance(body, Tag) else soup
+
+        if content is not soup:
+            # Move the element into its own document, so the steps (which only
+            # look at descendants) also cover the element itself
+            document = BeautifulSoup("", "html.parser")
+            document.append(content.extract())
+            content = document
+
+        pipeline = cls(content)
+        if remove_selectors:
+            pipeline.remove_selectors(remove_selectors)
+        return pipeline
+
+    def remove_selectors(self, selectors: List[str]) -> "HtmlPipeline":
+        """Remove elements matching CSS selectors."""
+        remove_selectors(self.root, selectors)
+        return self
+
+    def remove_empty_elements(self, tags: List[str]) -> "HtmlPipeline":
+        """Remove elements without text and media."""
+        remove_empty_elements(self.root, tags)
+        return self
+
+    def proxy_youtube_embeds(self) -> "HtmlPipeline":
+        """Route YouTube iframes through the YouTube proxy."""
+        proxy_youtube_embeds(self.root)
+        return self
+
+    def remove_image_by_url(self, image_url: Optional[str]) -> "HtmlPipeline":
+        """Remove the image with the given URL (e.g. the extracted header image)."""
+        remove_image_by_url(self.root, image_url)
+        return self
+
+    def sanitize_class_names(self) -> "HtmlPipeline":
+        """Move class attributes to data-sanitized-class."""
+        sanitize_class_names(self.root)
+        return self
+
+    def sanitize_html_attributes(self) -> "HtmlPipeline":
+        """Remove dangerous elements and rename attributes to data-sanitized-*."""
+        sanitize_html_attributes(self.root)
+        return self
+
+    def remove_sanitized_attributes(self) -> "HtmlPipeline":
+        """Remove all data-sanitized-* attributes."""
+        remove_sanitized_attributes(self.root)
+        return self
+
+    def remove_comments(self) -> "HtmlPipeline":
+        """Remove HTML comments."""
+        remove_comments(self.root)
+        return self
+
+    def to_html(self) -> str:
+        """Serialise the tree."""
+        return str(self.root)
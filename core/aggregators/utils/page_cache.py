@@ -0,0 +1,129 @@
+"""Per-run cache for fetched article pages."""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from bs4 import BeautifulSoup
+
+from .html_parser import parse_document
+
+DEFAULT_MAX_ENTRIES = 8
+
+
+class _CachedPage:
+    """A fetched page, its parsed soup (lazy) or the error raised while fetching."""
+
+    __slots__ = ("html", "soup", "error")
+
+    def __init__(self, html: str = "", error: Optional[Exception] = None):
+        self.html = html
+        self.soup: Optional[BeautifulSoup] = None
+        self.error = error
+
+
+class PageCache:
+    """
+    Share one download and one parse of an article page within an aggregation run.
+
+    Header image extraction and content extraction both need the article page.
+    The first caller downloads it through ``fetcher``; later callers get the same
+    HTML string (and parsed soup) back. Fetch errors are cached as well so a page
+    that failed once is not requested again in the same run.
+
+    The cache is bounded (least recently used pages are dropped first) and safe
+    to share between threads.
+    """
+
+    def __init__(self, fetcher: Callable[[str], str], max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache.
+
+        Args:
+            fetcher: Callable returning the HTML for a URL (e.g. fetch_html)
+            max_entries: Maximum number of pages kept at once
+        """
+        self._fetcher = fetcher
+        self._max_entries = max_entries
+        self._pages: OrderedDict[str, _CachedPage] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_page(self, url: str) -> _CachedPage:
+        with self._lock:
+            page = self._pages.get(url)
+            if page is not None:
+                self._pages.move_to_end(url)
+                return page
+
+        try:
+            page = _CachedPage(html=self._fetcher(url))
+        except Exception as e:
+            page = _CachedPage(error=e)
+
+        with self._lock:
+            self._pages[url] = page
+            self._pages.move_to_end(url)
+            while len(self._pages) > self._max_entries:
+                self._pages.popitem(last=False)
+        return page
+
+    def get_html(self, url: str) -> str:
+        """
+        Return the HTML for a URL, fetching it on first use.
+
+        Raises:
+            Exception: Whatever the fetcher raised for this URL
+        """
+        page = self._get_page(url)
+        if page.error is not None:
+            raise page.error
+        return page.html
+
+    def get_soup(self, url: str) -> BeautifulSoup:
+        """
+        Return the parsed page for a URL, fetching and parsing it on first use.
+
+        The returned soup is shared; callers must treat it as read-only.
+
+        Raises:
+            Exception: Whatever the fetcher raised for this URL
+        """
+        page = self._get_page(url)
+        if page.error is not None:
+            raise page.error
+        soup = page.soup
+        if soup is None:
+            soup = parse_document(page.html)
+            page.soup = soup
+        return soup
+
+    def take_soup(self, url: str, html: str) -> Optional[BeautifulSoup]:
+        """
+        Hand out the parsed page for in-place modification.
+
+        Only succeeds when ``html`` is the exact string cached for ``url``, so
+        callers working on transformed or combined HTML fall back to parsing it
+        themselves. The soup is removed from the cache, because the caller is
+        going to modify it.
+
+        Returns:
+            The parsed page, or None if ``html`` is not the cached page
+        """
+        with self._lock:
+            page = self._pages.get(url)
+            if page is None or page.error is not None or page.html is not html:
+                return None
+            soup, page.soup = page.soup, None
+        if soup is None:
+            soup = parse_document(html)
+        return soup
+
+    def discard(self, url: str) -> None:
+        """Drop a page from the cache once an article is done."""
+        with self._lock:
+            self._pages.pop(url, None)
+
+    def clear(self) -> None:
+        """Drop all cached pages."""
+        with self._lock:
+            self._pages.clear()
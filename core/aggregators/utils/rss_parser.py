@@ -1,31 +1,78 @@
 """RSS feed parsing utilities."""
 
+import hashlib
 from typing import Any, Dict
 from urllib.parse import urlparse
 
 import feedparser
+import requests
 
+from core import http_client
 
-def parse_rss_feed(url: str) -> Dict[str, Any]:
+
+def parse_rss_feed(
+    url: str,
+    etag: str = "",
+    modified: str = "",
+    previous_hash: str = "",
+    timeout: int = 30,
+) -> Dict[str, Any]:
     """
     Parse RSS/Atom feed from URL.
 
+    Sends the validators of the previous poll as a conditional GET. If the
+    server answers 304 Not Modified, or the body hashes to previous_hash (for
+    servers that ignore validators), the feed is not parsed and the result
+    has 'not_modified' set and no entries.
+
     Args:
         url: RSS feed URL
+        etag: ETag of the previous poll
+        modified: Last-Modified of the previous poll
+        previous_hash: Content hash of the previous poll
+        timeout: Request timeout in seconds
 
     Returns:
-        Parsed feed dictionary with 'entries' list
+        Parsed feed dictionary with 'entries' list, plus the validators of this
+        download ('etag', 'modified', 'content_hash') and 'not_modified'
 
     Raises:
-        ValueError: If feed cannot be parsed or URL is invalid
+        ValueError: If feed cannot be fetched or parsed or URL is invalid
     """
     # Validate URL
     parsed_url = urlparse(url)
     if not all([parsed_url.scheme, parsed_url.netloc]):
         raise ValueError(f"Invalid feed URL: {url}")
 
-    # Parse feed
-    feed = feedparser.parse(url)
+    headers = {
+        "Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, */*;q=0.8",
+    }
+    if etag:
+        headers["If-None-Match"] = etag
+    if modified:
+        headers["If-Modified-Since"] = modified
+
+    try:
+        response = http_client.get(url, headers=headers, timeout=timeout, polite=True)
+        if response.status_code != 304:
+            response.raise_for_status()
+    except requests.RequestException as e:
+        raise ValueError(f"Feed fetch error: {e}") from e
+
+    etag = response.headers.get("ETag", etag)
+    modified = response.headers.get("Last-Modified", modified)
+
+    if response.status_code == 304:
+        return _not_modified(etag, modified, previous_hash)
+
+    content_hash = hashlib.sha256(response.content).hexdigest()
+    if content_hash == previous_hash:
+        return _not_modified(etag, modified, content_hash)
+
+    # Parse feed (headers are passed on for encoding detection and relative links)
+    response_headers = {key.lower(): value for key, value in response.headers.items()}
+    response_headers["content-location"] = response.url
+    feed = feedparser.parse(response.content, response_headers=response_headers)
 
     # Check for errors
     if hasattr(feed, "bozo") and feed.bozo and hasattr(feed, "bozo_exception"):
@@ -34,4 +81,25 @@ def parse_rss_feed(url: str) -> Dict[str, Any]:
     if not feed.entries:
         raise ValueError(f"No entries found in feed: {url}")
 
-    return {"feed": feed.feed, "entries": feed.entries, "version": feed.version}
+    return {
+        "feed": feed.feed,
+        "entries": feed.entries,
+        "version": feed.version,
+        "etag": etag,
+        "modified": modified,
+        "content_hash": content_hash,
+        "not_modified": False,
+    }
+
+
+def _not_modified(etag: str, modified: str, content_hash: str) -> Dict[str, Any]:
+    """Result for a feed that did not change since the previous poll."""
+    return {
+        "feed": {},
+        "entries": [],
+        "version": "",
+        "etag": etag,
+        "modified": modified,
+        "content_hash": content_hash,
+        "not_modified": True,
+    }
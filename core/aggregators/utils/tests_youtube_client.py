@@ -9,7 +9,7 @@ class TestYouTubeClient(unittest.TestCase):
         self.api_key = "test_api_key"
         self.client = YouTubeClient(self.api_key)
 
-    @patch("requests.get")
+    @patch("core.http_client.get")
     def test_resolve_channel_id_from_uc_id(self, mock_get):
         # Mock successful channel lookup
         uc_id = "UC12345678901234567890123"
@@ -24,7 +24,7 @@ class TestYouTubeClient(unittest.TestCase):
         self.assertIsNone(error)
         mock_get.assert_called_once()
 
-    @patch("requests.get")
+    @patch("core.http_client.get")
     def test_resolve_channel_id_from_handle(self, mock_get):
         # 1. Mock search response
         search_response = MagicMock()
@@ -58,7 +58,7 @@ class TestYouTubeClient(unittest.TestCase):
         self.assertIsNone(error)
         self.assertEqual(mock_get.call_count, 2)
 
-    @patch("requests.get")
+    @patch("core.http_client.get")
     def test_fetch_channel_data(self, mock_get):
         # Mock channels.list response
         uc_id = "UC12345678901234567890123"
@@ -82,7 +82,7 @@ class TestYouTubeClient(unittest.TestCase):
         self.assertEqual(data["channel_icon_url"], "https://icon.url")
         self.assertEqual(data["uploads_playlist_id"], "UU123")
 
-    @patch("requests.get")
+    @patch("core.http_client.get")
     def test_fetch_video_details(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -99,7 +99,7 @@ class TestYouTubeClient(unittest.TestCase):
         self.assertEqual(videos[0]["id"], "vid1")
         self.assertEqual(videos[1]["snippet"]["title"], "Video 2")
 
-    @patch("requests.get")
+    @patch("core.http_client.get")
     def test_fetch_video_comments(self, mock_get):
         mock_response = MagicMock()
         mock_response.status_code = 200
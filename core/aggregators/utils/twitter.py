@@ -14,6 +14,8 @@ from typing import Any, Dict, List, Optional
 
 import requests
 
+from core import http_client
+
 logger = logging.getLogger(__name__)
 
 # fxtwitter API endpoint
@@ -83,9 +85,7 @@ def fetch_tweet_data(tweet_id: str, timeout: int = 10) -> Optional[Dict[str, Any
 
     try:
         url = f"{FXTWITTER_API_BASE}/status/{tweet_id}"
-        headers = {"User-Agent": "Yana/1.0"}
-
-        response = requests.get(url, headers=headers, timeout=timeout)
+        response = http_client.get(url, timeout=timeout)
         response.raise_for_status()
 
         data = response.json()
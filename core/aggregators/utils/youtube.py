@@ -8,11 +8,11 @@ Provides functions for:
 """
 
 import re
-from typing import Optional
+from typing import Optional, Union
 
 from django.conf import settings
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 
 def extract_youtube_video_id(url: str) -> Optional[str]:
@@ -148,12 +148,12 @@ def is_youtube_url(url: str) -> bool:
     return any(domain in url for domain in youtube_domains)
 
 
-def proxy_youtube_embeds(soup: BeautifulSoup) -> None:
+def proxy_youtube_embeds(soup: Union[BeautifulSoup, Tag]) -> None:
     """
     Find and replace YouTube iframes with proxy embeds.
 
     Args:
-        soup: BeautifulSoup object to modify in-place
+        soup: BeautifulSoup or Tag object to modify in-place
     """
     for iframe in soup.find_all("iframe"):
         src = iframe.get("src", "")
@@ -4,6 +4,8 @@ from urllib.parse import parse_qs, urlparse
 
 import requests
 
+from core import http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -33,7 +35,7 @@ class YouTubeClient:
         params["key"] = self.api_key
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = http_client.get(url, params=params, timeout=10, polite=True)
             response.raise_for_status()
             return response.json()
         except requests.exceptions.RequestException as e:
@@ -1,20 +1,11 @@
 """Full website aggregator base class."""
 
-from typing import Any, Dict, List
-
-from bs4 import BeautifulSoup
+from typing import Any, Dict, List, Optional
 
 from .exceptions import ArticleSkipError
 from .rss import RssAggregator
-from .utils import (
-    clean_html,
-    extract_main_content,
-    fetch_html,
-    format_article_content,
-    remove_image_by_url,
-    sanitize_class_names,
-)
-from .utils.youtube import proxy_youtube_embeds
+from .utils import HtmlPipeline, PageCache, fetch_html, format_article_content
+from .utils.page_cache import DEFAULT_MAX_ENTRIES
 
 
 class FullWebsiteAggregator(RssAggregator):
@@ -34,6 +25,19 @@ class FullWebsiteAggregator(RssAggregator):
     # Main content selector (override in subclasses)
     content_selector: str = "article, .article-content, .entry-content, main"
 
+    supports_concurrent_enrichment = True
+
+    page_cache: PageCache
+
+    def __init__(self, feed):
+        super().__init__(feed)
+        # Header extraction and content extraction share one download per article.
+        # Keep room for one page per enrichment worker.
+        self.page_cache = PageCache(
+            lambda url: fetch_html(url, timeout=30),
+            max_entries=max(DEFAULT_MAX_ENTRIES, self.get_enrichment_workers()),
+        )
+
     @classmethod
     def get_configuration_fields(cls) -> Dict[str, Any]:
         """Get configuration fields for FullWebsiteAggregator."""
@@ -62,8 +66,6 @@ class FullWebsiteAggregator(RssAggregator):
 
     def enrich_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Fetch and extract full article content with header elements."""
-        enriched = []
-
         # Check configuration
         use_full_content = self.feed.options.get("use_full_content", True)
 
@@ -71,51 +73,68 @@ class FullWebsiteAggregator(RssAggregator):
             self.logger.info("Full content extraction disabled via options.")
             return articles
 
-        for article in articles:
-            url = article["identifier"]
-            self.logger.info(f"Fetching full content from: {url}")
+        return self.enrich_each(articles, self._enrich_article)
 
-            try:
-                # Extract header element FIRST (may throw ArticleSkipError)
-                header_data = self.extract_header_element(article)
-                if header_data:
-                    article["header_data"] = header_data
-                    self.logger.debug(f"Extracted header data for {url}")
-                else:
-                    self.logger.debug(f"No header element found for {url}")
+    def _enrich_article(self, article: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Enrich a single article, returning None if it should be skipped."""
+        url = article["identifier"]
+        self.logger.info(f"Fetching full content from: {url}")
 
-                # Fetch HTML
-                raw_html = self.fetch_article_content(url)
-                article["raw_content"] = raw_html
+        try:
+            # Extract header element FIRST (may throw ArticleSkipError)
+            header_data = self.extract_header_element(article)
+            if header_data:
+                article["header_data"] = header_data
+                self.logger.debug(f"Extracted header data for {url}")
+            else:
+                self.logger.debug(f"No header element found for {url}")
 
-                # Extract content
-                content = self.extract_content(raw_html, article)
+            # Fetch HTML
+            raw_html = self.fetch_article_content(url)
+            article["raw_content"] = raw_html
 
-                # Process content (clean, format)
-                processed = self.process_content(content, article)
+            # Extract and process content (clean, format)
+            article["content"] = self.build_content(raw_html, article)
 
-                # Update article
-                article["content"] = processed
+            return article
 
-                enriched.append(article)
+        except ArticleSkipError as e:
+            # Skip article on 4xx HTTP errors (e.g., from header extraction)
+            self.logger.warning(f"Skipping article {url}: {e}")
+            return None
 
-            except ArticleSkipError as e:
-                # Skip article on 4xx HTTP errors (e.g., from header extraction)
-                self.logger.warning(f"Skipping article {url}: {e}")
+        except Exception as e:
+            self.logger.error(f"Failed to fetch article {url}: {e}")
+            # Keep original RSS content without header element
+            return article
 
-            except Exception as e:
-                self.logger.error(f"Failed to fetch article {url}: {e}")
-                # Keep original RSS content without header element
-                enriched.append(article)
-
-        return enriched
+        finally:
+            self.page_cache.discard(url)
 
     def fetch_article_content(self, url: str) -> str:
-        """Fetch HTML content from URL."""
-        return fetch_html(url, timeout=30)
+        """Fetch HTML content from URL (shared with header extraction via the page cache)."""
+        return self.page_cache.get_html(url)
 
-    def extract_content(self, html: str, article: Dict[str, Any]) -> str:
-        """Extract main content from HTML."""
+    def build_content(self, raw_html: str, article: Dict[str, Any]) -> str:
+        """
+        Extract and process article content from the fetched page.
+
+        Carries one parsed tree from extraction to the final serialisation.
+        Subclasses that still override the string hooks (extract_content or
+        process_content) go through those instead.
+        """
+        if self._overrides("extract_content") or self._overrides("process_content"):
+            content = self.extract_content(raw_html, article)
+            return self.process_content(content, article)
+
+        return self.process_content_tree(self.extract_content_tree(raw_html, article), article)
+
+    def _overrides(self, method_name: str) -> bool:
+        """Check whether a subclass overrides a FullWebsiteAggregator method."""
+        return getattr(type(self), method_name) is not getattr(FullWebsiteAggregator, method_name)
+
+    def extract_content_tree(self, html: str, article: Dict[str, Any]) -> HtmlPipeline:
+        """Extract main content from HTML as a live tree."""
         # Get selectors from options
         content_selector = self.feed.options.get("custom_content_selector") or self.content_selector
 
@@ -126,41 +145,57 @@ class FullWebsiteAggregator(RssAggregator):
             additional = [s.strip() for s in custom_remove.split(",") if s.strip()]
             remove_selectors.extend(additional)
 
-        return extract_main_content(
-            html, selector=content_selector, remove_selectors=remove_selectors
+        # Reuse the soup parsed during header extraction when html is that page
+        page = self.page_cache.take_soup(article.get("identifier", ""), html)
+
+        return HtmlPipeline.extract(
+            page if page is not None else html,
+            selector=content_selector,
+            remove_selectors=remove_selectors,
         )
 
-    def process_content(self, html: str, article: Dict[str, Any]) -> str:
-        """Process and format content."""
-        # Parse HTML
-        soup = BeautifulSoup(html, "html.parser")
+    def extract_content(self, html: str, article: Dict[str, Any]) -> str:
+        """Extract main content from HTML."""
+        return self.extract_content_tree(html, article).to_html()
 
+    def process_content_tree(self, content: HtmlPipeline, article: Dict[str, Any]) -> str:
+        """Process and format extracted content, serialising it once."""
         # Proxy YouTube embeds
-        proxy_youtube_embeds(soup)
+        content.proxy_youtube_embeds()
 
         # Remove header image from content if it was extracted
         header_data = article.get("header_data")
         if header_data and header_data.image_url:
             self.logger.debug(f"Removing header image from content: {header_data.image_url}")
-            remove_image_by_url(soup, header_data.image_url)
+            content.remove_image_by_url(header_data.image_url)
 
-        # Sanitize class names
-        sanitize_class_names(soup)
-
-        # Clean HTML
-        cleaned = clean_html(str(soup))
+        # Sanitize class names and clean HTML
+        cleaned = content.sanitize_class_names().remove_comments().to_html()
 
         # Determine header image URL for formatting
         header_image_url = None
         if header_data:
-            header_image_url = header_data.base64_data_uri or header_data.image_url
+            header_image_url = header_data.image_src or header_data.image_url
 
-        # Format with header and footer
+        # Format with header, comments and footer
         formatted = format_article_content(
             cleaned,
             title=article["name"],
             url=article["identifier"],
             header_image_url=header_image_url,
+            comments_content=self.get_comments_content(article),
         )
 
         return formatted
+
+    def get_comments_content(self, article: Dict[str, Any]) -> Optional[str]:
+        """
+        Get HTML for a comments section placed before the footer.
+
+        Override in subclasses that include comments.
+        """
+        return None
+
+    def process_content(self, html: str, article: Dict[str, Any]) -> str:
+        """Process and format content."""
+        return self.process_content_tree(HtmlPipeline.parse(html), article)
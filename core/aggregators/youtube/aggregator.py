@@ -36,6 +36,7 @@ class YouTubeAggregator(BaseAggregator):
         return "youtube"
 
     supports_identifier_search = True
+    supports_concurrent_enrichment = True
 
     @classmethod
     def get_identifier_choices(
@@ -288,7 +289,7 @@ class YouTubeAggregator(BaseAggregator):
 
         comment_limit = self.feed.options.get("comment_limit", 10)
 
-        for article in articles:
+        def enrich_article(article: Dict[str, Any]) -> Dict[str, Any]:
             video_id = article.get("_youtube_video_id")
             description = article.get("content", "")
 
@@ -305,8 +306,9 @@ class YouTubeAggregator(BaseAggregator):
             article["raw_content"] = (
                 content_html  # YouTube articles don't have separate raw content from website
             )
+            return article
 
-        return articles
+        return self.enrich_each(articles, enrich_article)
 
     def _build_content_html(
         self, description: str, comments: List[Dict[str, Any]], video_id: str
@@ -445,6 +447,7 @@ class YouTubeAggregator(BaseAggregator):
             source_data = self.fetch_source_data(limit)
             articles = self.parse_to_raw_articles(source_data)
             articles = self.filter_articles(articles)
+            articles = self.remove_existing_articles(articles)
             articles = self.enrich_articles(articles)
             articles = self.finalize_articles(articles)
             return articles
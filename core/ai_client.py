@@ -4,6 +4,8 @@ from typing import Optional
 
 import requests
 
+from core import http_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,7 +28,7 @@ class AIClient:
         start_time = time.monotonic()
 
         for attempt in range(1 + max_retries):
-            response = requests.post(url, headers=headers, json=data, timeout=timeout)
+            response = http_client.post(url, headers=headers, json=data, timeout=timeout)
             try:
                 response.raise_for_status()
                 return response
@@ -94,7 +96,7 @@ class AIClient:
             "max_tokens": 5,
         }
 
-        response = requests.post(url, headers=headers, json=data, timeout=10)
+        response = http_client.post(url, headers=headers, json=data, timeout=10)
         response.raise_for_status()
         return True
 
@@ -116,7 +118,7 @@ class AIClient:
             "max_tokens": 5,
         }
 
-        response = requests.post(url, headers=headers, json=data, timeout=10)
+        response = http_client.post(url, headers=headers, json=data, timeout=10)
         response.raise_for_status()
         return True
 
@@ -137,7 +139,7 @@ class AIClient:
             },
         }
 
-        response = requests.post(url, headers=headers, json=data, timeout=10)
+        response = http_client.post(url, headers=headers, json=data, timeout=10)
         response.raise_for_status()
         return True
 
@@ -0,0 +1,226 @@
+"""
+Shared HTTP client for all outbound requests.
+
+Every fetch goes through one pooled requests.Session per process, so
+connections (TCP + TLS) to a host are kept alive and reused across articles,
+images and API calls. The session also holds the default User-Agent, the
+connection retry policy and a small DNS cache. Crawling requests can opt in
+to per-host pacing with polite=True.
+"""
+
+import http.cookiejar
+import logging
+import os
+import socket
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+from urllib3.util.retry import Retry
+
+from core import rate_limiter
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (compatible; YanaBot/1.0; +https://github.com/yourusername/yana)"
+
+# Number of hosts to keep connection pools for, and connections kept per host.
+# The per-host size matches the concurrent enrichment defaults with headroom
+# for image downloads running next to page fetches.
+POOL_CONNECTIONS = 50
+POOL_MAXSIZE = 10
+
+# Only failures to connect are retried here: nothing has been sent yet, so this
+# is safe for POST as well. HTTP status retries stay with the callers, which
+# know what a 429 or 5xx means for them.
+RETRY_POLICY = Retry(total=2, connect=2, read=0, status=0, other=0, backoff_factor=0.5)
+
+# Seconds to reuse resolved addresses for new connections
+DNS_CACHE_TTL = 300
+
+_dns_cache: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+_dns_lock = threading.Lock()
+
+_session: Optional[requests.Session] = None
+_session_pid: Optional[int] = None
+_session_lock = threading.Lock()
+
+
+def resolve_host(host: str, port: int) -> List[str]:
+    """
+    Resolve a host to its addresses, cached for DNS_CACHE_TTL seconds.
+
+    Args:
+        host: Host name (or address)
+        port: Port to connect to
+
+    Returns:
+        Addresses in resolver order, or an empty list if resolution failed
+    """
+    key = (host, port)
+    now = time.monotonic()
+    with _dns_lock:
+        cached = _dns_cache.get(key)
+        if cached and cached[0] > now:
+            return cached[1]
+
+    try:
+        infos = socket.getaddrinfo(host, port, allowed_gai_family(), socket.SOCK_STREAM)
+    except OSError as e:
+        logger.debug(f"DNS lookup for {host} failed: {e}")
+        return []
+
+    addresses = list(dict.fromkeys(str(info[4][0]) for info in infos))
+    with _dns_lock:
+        _dns_cache[key] = (now + DNS_CACHE_TTL, addresses)
+    return addresses
+
+
+def clear_dns_cache() -> None:
+    """Forget all resolved addresses."""
+    with _dns_lock:
+        _dns_cache.clear()
+
+
+class _CachedDnsMixin:
+    """Connect to the cached addresses of the host instead of resolving again."""
+
+    _dns_host: str
+    port: int
+
+    def _new_conn(self) -> socket.socket:
+        host = self._dns_host
+        addresses = resolve_host(host, self.port)
+        if not addresses:
+            # Let urllib3 resolve (and report the error) itself
+            return super()._new_conn()  # type: ignore[misc]
+
+        last_error: Optional[Exception] = None
+        for address in addresses:
+            # The host name is still used for TLS (SNI, certificate) and the Host header
+            self._dns_host = address
+            try:
+                return super()._new_conn()  # type: ignore[misc]
+            except (NewConnectionError, ConnectTimeoutError) as e:
+                last_error = e
+            finally:
+                self._dns_host = host
+        assert last_error is not None
+        raise last_error
+
+
+class _HTTPConnection(_CachedDnsMixin, HTTPConnection):
+    pass
+
+
+class _HTTPSConnection(_CachedDnsMixin, HTTPSConnection):
+    pass
+
+
+class _HTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _HTTPConnection
+
+
+class _HTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _HTTPSConnection
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections use the shared DNS cache."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _HTTPConnectionPool,
+            "https": _HTTPSConnectionPool,
+        }
+
+
+def create_session() -> requests.Session:
+    """
+    Create a session with the shared pool, retry and header configuration.
+
+    Cookies are not kept between requests (redirect chains still carry them),
+    so sharing the session behaves like separate requests.get calls.
+    """
+    session = requests.Session()
+    adapter = PooledHTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=RETRY_POLICY,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the shared session of this process.
+
+    A new session is created after a fork, so worker processes never share
+    sockets with their parent.
+    """
+    global _session, _session_pid
+
+    pid = os.getpid()
+    if _session is not None and _session_pid == pid:
+        return _session
+
+    with _session_lock:
+        if _session is None or _session_pid != pid:
+            _session = create_session()
+            _session_pid = pid
+        return _session
+
+
+def close_session() -> None:
+    """Close the shared session and its pooled connections."""
+    global _session, _session_pid
+
+    with _session_lock:
+        if _session is not None and _session_pid == os.getpid():
+            _session.close()
+        _session = None
+        _session_pid = None
+
+
+def request(method: str, url: str, polite: bool = False, **kwargs: Any) -> requests.Response:
+    """
+    Send a request through the shared session (same arguments as requests.request).
+
+    Args:
+        method: HTTP method
+        url: URL to request
+        polite: Pace the request with the per-host rate limiter shared by all
+            workers (see core.rate_limiter). Use this for crawling sites.
+
+    Raises:
+        HostRateLimitedError: If polite and the host is paced for too long
+    """
+    if not polite:
+        return get_session().request(method, url, **kwargs)
+
+    rate_limiter.acquire(url)
+    response = get_session().request(method, url, **kwargs)
+    rate_limiter.report_response(url, response)
+    return response
+
+
+def get(url: str, **kwargs: Any) -> requests.Response:
+    """Send a GET request through the shared session."""
+    kwargs.setdefault("allow_redirects", True)
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, **kwargs: Any) -> requests.Response:
+    """Send a POST request through the shared session."""
+    return request("POST", url, **kwargs)
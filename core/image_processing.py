@@ -0,0 +1,327 @@
+"""
+Image decoding and encoding in a pool of worker processes.
+
+Decoding, resizing and WebP encoding of article images is CPU-bound and holds
+the GIL, so done inline it stalls the aggregation task and every enrichment
+thread next to it. Image jobs run in a small pool of spawned processes
+instead (AGGREGATOR_IMAGE_WORKERS, 0 runs them inline):
+
+- Workers run with an address space limit (AGGREGATOR_IMAGE_WORKER_MEMORY),
+  so a decompression bomb fails with MemoryError in the worker instead of
+  growing the task worker's RSS
+- Every job has a deadline (JOB_TIMEOUT); when it is missed the pool is
+  terminated and replaced, so one pathological image cannot hold up a feed run.
+  Other jobs still pending in that pool are resubmitted to the new one right
+  away instead of waiting out their own deadline
+- Large JPEGs are decoded at a reduced scale (Image.draft) when only a
+  smaller version is needed, and resizing uses Pillow's reduce shortcut
+- Sources above MAX_DECODED_PIXELS are rejected before decoding
+
+This module must stay importable without Django being set up: spawned
+workers import it to run their jobs.
+"""
+
+import concurrent.futures
+import io
+import logging
+import multiprocessing
+import os
+import threading
+from multiprocessing.pool import Pool
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+from PIL import Image
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 2
+DEFAULT_WORKER_MEMORY_MB = 1024
+
+# Seconds a job may take before its pool is replaced
+JOB_TIMEOUT = 30
+
+# Jobs per worker process before it is replaced, returning memory that
+# large images left fragmented
+MAX_TASKS_PER_WORKER = 200
+
+# Largest image decoded (after draft scaling); 40 MP is about 160 MB as RGBA
+MAX_DECODED_PIXELS = 40_000_000
+
+# Resizing first reduces by an integer factor to within this multiple of the
+# target size; 3.0 is indistinguishable from resampling the full image
+REDUCING_GAP = 3.0
+
+_pool: Optional[Pool] = None
+_pool_key: Optional[Tuple[int, int, int]] = None  # (pid, workers, memory limit)
+_pool_lock = threading.Lock()
+# Jobs submitted to each pool that have not finished yet
+_pending: Dict[Pool, Set[concurrent.futures.Future]] = {}
+
+
+class _PoolDiscarded(RuntimeError):
+    """The pool running a job was terminated before the job finished."""
+
+
+def resize_and_encode(
+    image_data: bytes,
+    max_size: Optional[Tuple[int, int]],
+    prefer_webp: bool,
+    webp_quality: int,
+    jpeg_quality: int,
+) -> Optional[Dict[str, Any]]:
+    """
+    Decode an image, shrink it to fit max_size and re-encode it.
+
+    Args:
+        image_data: Raw image bytes
+        max_size: Maximum (width, height), or None to keep the original size
+        prefer_webp: Encode as WebP rather than JPEG/PNG
+        webp_quality: WebP quality
+        jpeg_quality: JPEG quality
+
+    Returns:
+        Dict with data, contentType, size, width and height (see
+        compression.compress_image), or None if the image is too large
+    """
+    img: Any = Image.open(io.BytesIO(image_data))
+    original_width, original_height = img.size
+
+    if max_size:
+        # Never upscale
+        ratio = min(max_size[0] / original_width, max_size[1] / original_height, 1.0)
+    else:
+        ratio = 1.0
+    new_width = max(int(original_width * ratio), 1)
+    new_height = max(int(original_height * ratio), 1)
+
+    if ratio < 1.0:
+        # JPEG only: decode at 1/2, 1/4 or 1/8 scale, still at least the target size
+        img.draft(None, (new_width, new_height))
+
+    if img.width * img.height > MAX_DECODED_PIXELS:
+        logger.warning(
+            f"Skipping image of {original_width}x{original_height} pixels "
+            f"(limit {MAX_DECODED_PIXELS})"
+        )
+        return None
+
+    # Convert RGBA to RGB if needed (for JPEG)
+    if img.mode in ("RGBA", "LA", "P"):
+        # Check if image has transparency
+        if img.mode == "P" and "transparency" in img.info:
+            # Keep as PNG
+            output_format = "PNG"
+        elif img.mode == "RGBA" or img.mode == "LA":
+            # Has transparency, keep as PNG or use WEBP
+            output_format = "WEBP" if prefer_webp else "PNG"
+        else:
+            # No transparency, convert to RGB
+            background = Image.new("RGB", img.size, (255, 255, 255))
+            background.paste(img, mask=img.split()[-1] if img.mode == "RGBA" else None)
+            img = background
+            output_format = "WEBP" if prefer_webp else "JPEG"
+    else:
+        output_format = "WEBP" if prefer_webp else "JPEG"
+
+    if img.size != (new_width, new_height):
+        img = img.resize(
+            (new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=REDUCING_GAP
+        )
+        logger.debug(
+            f"Resized image from {original_width}x{original_height} to {new_width}x{new_height}"
+        )
+
+    output = io.BytesIO()
+    if output_format == "WEBP":
+        img.save(
+            output,
+            format="WEBP",
+            quality=webp_quality,
+            method=6,  # Slowest but best quality
+        )
+        content_type = "image/webp"
+    elif output_format == "PNG":
+        img.save(output, format="PNG", optimize=True)
+        content_type = "image/png"
+    else:  # JPEG
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        img.save(
+            output,
+            format="JPEG",
+            quality=jpeg_quality,
+            optimize=True,
+            progressive=True,
+        )
+        content_type = "image/jpeg"
+
+    data = output.getvalue()
+    return {
+        "data": data,
+        "contentType": content_type,
+        "size": len(data),
+        "width": new_width,
+        "height": new_height,
+    }
+
+
+def run(func: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run an image job in the pool, or inline if the pool is disabled.
+
+    Args:
+        func: Module-level function (it is pickled by reference)
+        *args: Picklable arguments
+
+    Returns:
+        The job's return value
+
+    Raises:
+        TimeoutError: If the job took longer than JOB_TIMEOUT
+        RuntimeError: If the workers were restarted twice while the job was pending
+        Exception: Whatever the job raised (MemoryError above the memory limit)
+    """
+    try:
+        return _run_once(func, args)
+    except _PoolDiscarded:
+        # Killed along with another job that timed out, try once more
+        logger.debug("Image workers were restarted, resubmitting image job")
+        return _run_once(func, args)
+
+
+def _run_once(func: Callable[..., Any], args: Tuple[Any, ...]) -> Any:
+    """Run an image job in the current pool (see run)."""
+    pool = _get_pool()
+    if pool is None:
+        return func(*args)
+
+    try:
+        return _submit(pool, func, args).result(JOB_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        # A running job cannot be cancelled, only its process killed
+        logger.warning(f"Image job timed out after {JOB_TIMEOUT}s, restarting image workers")
+        _discard_pool(pool)
+        raise TimeoutError(f"Image job timed out after {JOB_TIMEOUT}s") from None
+
+
+def shutdown_pool() -> None:
+    """Terminate the pool of this process, it is started again on the next job."""
+    with _pool_lock:
+        pool = _pool
+    if pool is not None:
+        _discard_pool(pool)
+
+
+def _get_pool() -> Optional[Pool]:
+    """
+    Get this process's pool, starting it on first use.
+
+    Returns:
+        Pool, or None if image jobs run inline
+    """
+    global _pool, _pool_key
+
+    from django.conf import settings
+
+    workers = getattr(settings, "AGGREGATOR_IMAGE_WORKERS", DEFAULT_WORKERS)
+    memory_mb = getattr(settings, "AGGREGATOR_IMAGE_WORKER_MEMORY", DEFAULT_WORKER_MEMORY_MB)
+    if workers <= 0:
+        return None
+
+    key = (os.getpid(), workers, memory_mb)
+    with _pool_lock:
+        if _pool is not None and _pool_key == key:
+            return _pool
+        if _pool_key == key:
+            # Starting failed before, keep running inline
+            return None
+
+        previous = _pool if _pool_key and _pool_key[0] == key[0] else None
+        if _pool_key and _pool_key[0] != key[0]:
+            # Forked: the parent's pools and jobs are not ours
+            _pending.clear()
+        _pool, _pool_key = None, key
+        if previous is not None:
+            _fail_pending(previous)
+            previous.terminate()
+
+        try:
+            # Spawned, not forked: the caller runs threads (enrichment, HTTP)
+            # whose locks a forked child could inherit in a held state
+            _pool = multiprocessing.get_context("spawn").Pool(
+                workers,
+                initializer=_init_worker,
+                initargs=(memory_mb * 1024 * 1024,),
+                maxtasksperchild=MAX_TASKS_PER_WORKER,
+            )
+        except (AssertionError, OSError) as e:
+            # Daemonic processes (e.g. daemonized django-q workers) cannot have children
+            logger.warning(f"Could not start image workers, processing images inline: {e}")
+        return _pool
+
+
+def _submit(
+    pool: Pool, func: Callable[..., Any], args: Tuple[Any, ...]
+) -> concurrent.futures.Future:
+    """
+    Submit a job to a pool.
+
+    Returns:
+        Future of the job, failed with _PoolDiscarded if the pool is
+        terminated before the job finishes
+    """
+    future: concurrent.futures.Future = concurrent.futures.Future()
+
+    def finish(outcome: Any, failed: bool = False) -> None:
+        # Runs in the pool's result handler thread
+        with _pool_lock:
+            pending = _pending.get(pool)
+            if pending is None or future not in pending:
+                # Already failed when the pool was discarded
+                return
+            pending.discard(future)
+        if failed:
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+
+    with _pool_lock:
+        if _pool is not pool:
+            raise _PoolDiscarded("Image workers were restarted")
+        _pending.setdefault(pool, set()).add(future)
+        pool.apply_async(
+            func, args, callback=finish, error_callback=lambda e: finish(e, failed=True)
+        )
+    return future
+
+
+def _discard_pool(pool: Pool) -> None:
+    """Terminate a pool and forget it if it is the current one."""
+    global _pool, _pool_key
+
+    with _pool_lock:
+        if _pool is pool:
+            _pool, _pool_key = None, None
+        _fail_pending(pool)
+    pool.terminate()
+
+
+def _fail_pending(pool: Pool) -> None:
+    """Fail the unfinished jobs of a pool that is being terminated (holding _pool_lock)."""
+    for future in _pending.pop(pool, set()):
+        future.set_exception(_PoolDiscarded("Image workers were restarted"))
+
+
+def _init_worker(memory_limit: int) -> None:
+    """Apply the address space limit in a new worker process."""
+    if not memory_limit or resource is None:
+        return
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    except (ValueError, OSError) as e:
+        logger.warning(f"Could not limit image worker memory: {e}")
@@ -0,0 +1,84 @@
+"""Django command to benchmark the JSON encoders for GReader responses."""
+
+import json
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.models import Article, Feed
+from core.services.greader.stream_format import format_stream_contents, format_stream_item
+from core.views.greader.json_encoder import get_dumps
+
+# Article body of a typical full-website article (~6 KB of HTML)
+PARAGRAPH = (
+    "<p>Die Entwickler haben das Update am Dienstag veröffentlicht. Es bringt "
+    '<a href="https://example.com/details">zahlreiche Verbesserungen</a>, '
+    "<strong>neue Funktionen</strong> und behebt mehrere Fehler – darunter "
+    "einen, der „zufällige“ Abstürze verursachte.</p>\n"
+)
+CONTENT = (
+    '<header><img src="https://example.com/images/header.jpg" alt=""></header>\n'
+    + PARAGRAPH * 20
+    + '<footer><a href="https://example.com/article">Original</a></footer>'
+)
+
+
+class Command(BaseCommand):
+    help = "Benchmark JSON encoders on a realistic stream/contents payload"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--items", type=int, default=1000, help="Items per payload")
+        parser.add_argument("--repeat", type=int, default=20, help="Encodings per encoder")
+
+    def handle(self, *args, **options):
+        payload = self._build_payload(options["items"])
+        repeat = options["repeat"]
+
+        encoders = ["json"]
+        try:
+            import orjson  # noqa: F401
+
+            encoders.append("orjson")
+        except ImportError:
+            self.stdout.write(self.style.WARNING("orjson is not installed, skipping it"))
+
+        baseline = None
+        for encoder in encoders:
+            dumps = get_dumps(encoder)
+            encoded = dumps(payload)
+            if json.loads(encoded) != json.loads(get_dumps("json")(payload)):
+                raise CommandError(f"{encoder} output differs from json")
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                dumps(payload)
+            per_call = (time.perf_counter() - start) / repeat
+
+            baseline = baseline or per_call
+            self.stdout.write(
+                f"{encoder:>8}: {per_call * 1000:8.2f} ms per response "
+                f"({len(encoded) / 1024 / 1024:.1f} MiB, {baseline / per_call:.1f}x)"
+            )
+
+    def _build_payload(self, count: int) -> dict:
+        """Format unsaved articles exactly like stream/contents does."""
+        feed = Feed(
+            id=1, name="Benchmark Feed", aggregator="rss", identifier="https://example.com/feed"
+        )
+        now = timezone.now()
+        items = []
+        for i in range(count):
+            article = Article(
+                id=i + 1,
+                feed=feed,
+                name=f"Benchmark article {i}: Update bringt neue Funktionen",
+                identifier=f"https://example.com/articles/{i}",
+                content=CONTENT,
+                author="Redaktion",
+                date=now - timedelta(minutes=i),
+                updated_at=now,
+            )
+            items.append(format_stream_item(article, feed, None, is_read=i % 3 == 0))
+        return format_stream_contents(items)
@@ -0,0 +1,25 @@
+"""Django command to delete image blobs no article references."""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from core.services import ImageBlobService
+from core.services.image_blob_service import GARBAGE_GRACE_PERIOD
+
+
+class Command(BaseCommand):
+    help = "Recount image blob references and delete unreferenced blobs with their files"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-minutes",
+            type=int,
+            default=int(GARBAGE_GRACE_PERIOD.total_seconds() // 60),
+            help="Keep unreferenced blobs attached within this many minutes (default: 60)",
+        )
+
+    def handle(self, *args, **options):
+        grace_period = timedelta(minutes=options["grace_minutes"])
+        deleted = ImageBlobService.collect_garbage(grace_period)
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} unreferenced image blob(s)"))
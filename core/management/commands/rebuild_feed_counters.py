@@ -0,0 +1,36 @@
+"""Django command to rebuild or verify the per-feed article counters."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.models import Feed
+from core.services import FeedCounterService
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-feed unread/total counters from the articles table"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Only compare stored counters with the articles table, do not write",
+        )
+
+    def handle(self, *args, **options):
+        if options.get("verify"):
+            mismatches = FeedCounterService.verify()
+            for feed_id, stored, actual in mismatches:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Feed {feed_id}: stored (unread={stored[0]}, total={stored[1]}, "
+                        f"newest={stored[2]}) != actual (unread={actual[0]}, "
+                        f"total={actual[1]}, newest={actual[2]})"
+                    )
+                )
+            if mismatches:
+                raise CommandError(f"{len(mismatches)} feed counter(s) out of date")
+            self.stdout.write(self.style.SUCCESS("All feed counters are up to date"))
+            return
+
+        count = FeedCounterService.refresh(Feed.objects.values_list("id", flat=True))
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt counters for {count} feed(s)"))
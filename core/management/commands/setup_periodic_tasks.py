@@ -7,6 +7,22 @@ class Command(BaseCommand):
     help = "Sets up periodic tasks for the application"
 
     def handle(self, *args, **options):
+        # Schedule feed aggregation (only feeds that are due are enqueued)
+        task_name = "aggregate_due_feeds"
+        func_name = "core.services.aggregator_service.AggregatorService.trigger_due"
+
+        if not Schedule.objects.filter(func=func_name).exists():
+            Schedule.objects.create(
+                func=func_name,
+                name="Aggregate Due Feeds",
+                schedule_type=Schedule.MINUTES,
+                minutes=5,
+                repeats=-1,  # Forever
+            )
+            self.stdout.write(self.style.SUCCESS(f"Created periodic task: {task_name}"))
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Periodic task {task_name} already exists"))
+
         # Schedule article cleanup
         task_name = "cleanup_old_articles"
         func_name = "core.services.article_service.ArticleService.delete_old_articles"
@@ -96,6 +96,9 @@ class Command(BaseCommand):
             # Get aggregator class info
             self._print_section("AGGREGATOR CLASS INFO")
             aggregator = get_aggregator(feed)
+            # Show every article the source returns, including already stored ones
+            aggregator.skip_existing = False
+            aggregator.conditional_fetch = False
             aggregator_class = aggregator.__class__
             self._print_field("Class", f"{aggregator_class.__module__}.{aggregator_class.__name__}")
             self._print_field(
@@ -0,0 +1,28 @@
+# Generated by Django 6.0 on 2026-10-16 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0025_add_ai_request_delay'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='feed',
+            name='fetch_content_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='feed',
+            name='fetch_etag',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='feed',
+            name='fetch_last_modified',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+    ]
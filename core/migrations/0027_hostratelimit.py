@@ -0,0 +1,26 @@
+# Generated by Django 6.0 on 2026-10-16 10:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0026_feed_fetch_validators'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HostRateLimit',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('host', models.CharField(max_length=255, unique=True)),
+                ('next_request_at', models.FloatField(default=0.0)),
+                ('blocked_until', models.FloatField(default=0.0)),
+            ],
+            options={
+                'verbose_name': 'Host Rate Limit',
+                'verbose_name_plural': 'Host Rate Limits',
+            },
+        ),
+    ]
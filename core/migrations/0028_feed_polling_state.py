@@ -0,0 +1,47 @@
+# Generated by Django 6.0 on 2026-10-16 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0027_hostratelimit'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='feed',
+            name='consecutive_failures',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='feed',
+            name='last_new_article_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='feed',
+            name='last_polled_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='feed',
+            name='new_article_rate',
+            field=models.FloatField(default=0.0, help_text='Smoothed number of new articles per hour'),
+        ),
+        migrations.AddField(
+            model_name='feed',
+            name='next_poll_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='feed',
+            name='poll_interval',
+            field=models.PositiveIntegerField(default=0, help_text='Current polling interval in seconds'),
+        ),
+        migrations.AddIndex(
+            model_name='feed',
+            index=models.Index(fields=['enabled', 'next_poll_at'], name='core_feed_enabled_009433_idx'),
+        ),
+    ]
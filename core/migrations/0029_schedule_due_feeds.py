@@ -0,0 +1,48 @@
+# Generated by Django 6.0 on 2026-10-16 11:24
+
+from django.db import migrations
+
+TRIGGER_ALL = "core.services.aggregator_service.AggregatorService.trigger_all"
+TRIGGER_DUE = "core.services.aggregator_service.AggregatorService.trigger_due"
+
+
+def schedule_due_feeds(apps, schema_editor):
+    """Replace the fixed 30 minute aggregation of all feeds with adaptive polling."""
+    Schedule = apps.get_model("django_q", "Schedule")
+
+    Schedule.objects.filter(func=TRIGGER_ALL).delete()
+    if not Schedule.objects.filter(func=TRIGGER_DUE).exists():
+        Schedule.objects.create(
+            func=TRIGGER_DUE,
+            name="Aggregate Due Feeds",
+            schedule_type="I",  # MINUTES type
+            minutes=5,
+            repeats=-1,  # Forever
+        )
+
+
+def schedule_all_feeds(apps, schema_editor):
+    """Restore the fixed 30 minute aggregation of all feeds (reverse migration)."""
+    Schedule = apps.get_model("django_q", "Schedule")
+
+    Schedule.objects.filter(func=TRIGGER_DUE).delete()
+    if not Schedule.objects.filter(func=TRIGGER_ALL).exists():
+        Schedule.objects.create(
+            func=TRIGGER_ALL,
+            name="Aggregate All Feeds",
+            schedule_type="I",  # MINUTES type
+            minutes=30,
+            repeats=-1,  # Forever
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0028_feed_polling_state"),
+        ("django_q", "__latest__"),
+    ]
+
+    operations = [
+        migrations.RunPython(schedule_due_feeds, schedule_all_feeds),
+    ]
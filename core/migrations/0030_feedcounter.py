@@ -0,0 +1,27 @@
+# Generated by Django 6.0 on 2026-10-16 22:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0029_schedule_due_feeds'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FeedCounter',
+            fields=[
+                ('feed', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='counter', serialize=False, to='core.feed')),
+                ('unread_count', models.IntegerField(default=0)),
+                ('total_count', models.IntegerField(default=0)),
+                ('newest_date', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name': 'Feed Counter',
+                'verbose_name_plural': 'Feed Counters',
+            },
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 6.0 on 2026-10-16 22:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0030_feedcounter'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='article',
+            name='core_articl_read_0e838a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='article',
+            name='core_articl_starred_f4b11d_idx',
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('read', False)), fields=['date'], name='core_article_unread_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('read', False)), fields=['feed', 'date'], name='core_article_unread_feed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='article',
+            index=models.Index(condition=models.Q(('starred', True)), fields=['date'], name='core_article_starred_date_idx'),
+        ),
+    ]
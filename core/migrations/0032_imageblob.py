@@ -0,0 +1,54 @@
+# Generated by Django 6.0 on 2026-10-16 22:30
+
+from django.db import migrations, models
+
+COLLECT_GARBAGE = "core.services.image_blob_service.ImageBlobService.collect_garbage"
+
+
+def schedule_blob_collection(apps, schema_editor):
+    """Delete unreferenced image blobs daily."""
+    Schedule = apps.get_model("django_q", "Schedule")
+
+    if not Schedule.objects.filter(func=COLLECT_GARBAGE).exists():
+        Schedule.objects.create(
+            func=COLLECT_GARBAGE,
+            name="Collect Unreferenced Images",
+            schedule_type="D",  # DAILY type
+            repeats=-1,  # Forever
+        )
+
+
+def unschedule_blob_collection(apps, schema_editor):
+    """Remove the image blob collection task (reverse migration)."""
+    Schedule = apps.get_model("django_q", "Schedule")
+
+    Schedule.objects.filter(func=COLLECT_GARBAGE).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0031_article_partial_indexes'),
+        ('django_q', '__latest__'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ImageBlob',
+            fields=[
+                ('digest', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('content_type', models.CharField(max_length=100)),
+                ('size', models.PositiveIntegerField()),
+                ('ref_count', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Image Blob',
+                'verbose_name_plural': 'Image Blobs',
+                'indexes': [models.Index(fields=['name'], name='core_imageb_name_79f05a_idx'), models.Index(fields=['ref_count', 'updated_at'], name='core_imageb_ref_cou_f1f878_idx')],
+            },
+        ),
+        migrations.RunPython(schedule_blob_collection, unschedule_blob_collection),
+    ]
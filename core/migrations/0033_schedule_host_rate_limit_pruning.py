@@ -0,0 +1,37 @@
+# Generated by Django 6.0 on 2026-10-17 09:10
+
+from django.db import migrations
+
+PRUNE_IDLE_HOSTS = "core.rate_limiter.prune_idle_hosts"
+
+
+def schedule_host_pruning(apps, schema_editor):
+    """Delete the rate limit state of idle hosts daily."""
+    Schedule = apps.get_model("django_q", "Schedule")
+
+    if not Schedule.objects.filter(func=PRUNE_IDLE_HOSTS).exists():
+        Schedule.objects.create(
+            func=PRUNE_IDLE_HOSTS,
+            name="Prune Idle Rate Limit Hosts",
+            schedule_type="D",  # DAILY type
+            repeats=-1,  # Forever
+        )
+
+
+def unschedule_host_pruning(apps, schema_editor):
+    """Remove the host pruning task (reverse migration)."""
+    Schedule = apps.get_model("django_q", "Schedule")
+
+    Schedule.objects.filter(func=PRUNE_IDLE_HOSTS).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0032_imageblob"),
+        ("django_q", "__latest__"),
+    ]
+
+    operations = [
+        migrations.RunPython(schedule_host_pruning, unschedule_host_pruning),
+    ]
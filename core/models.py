@@ -2,8 +2,10 @@
 
 import secrets
 from datetime import timedelta
+from typing import Any, Optional, Tuple
 
-from django.db import models
+from django.db import models, transaction
+from django.db.models import Q
 from django.utils import timezone
 
 from .choices import AGGREGATOR_CHOICES
@@ -90,6 +92,22 @@ class Feed(models.Model):
     options = models.JSONField(
         default=dict, blank=True, help_text="Aggregator-specific configuration"
     )
+    # Validators of the last fully processed feed download, sent back on the
+    # next poll so unchanged feeds can be skipped (see parse_rss_feed)
+    fetch_etag = models.CharField(max_length=255, blank=True, default="")
+    fetch_last_modified = models.CharField(max_length=255, blank=True, default="")
+    fetch_content_hash = models.CharField(max_length=64, blank=True, default="")
+    # Adaptive polling state, maintained by PollScheduler
+    next_poll_at = models.DateTimeField(null=True, blank=True)
+    poll_interval = models.PositiveIntegerField(
+        default=0, help_text="Current polling interval in seconds"
+    )
+    last_polled_at = models.DateTimeField(null=True, blank=True)
+    last_new_article_at = models.DateTimeField(null=True, blank=True)
+    new_article_rate = models.FloatField(
+        default=0.0, help_text="Smoothed number of new articles per hour"
+    )
+    consecutive_failures = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -101,6 +119,7 @@ class Feed(models.Model):
             models.Index(fields=["user"]),
             models.Index(fields=["group"]),
             models.Index(fields=["aggregator"]),
+            models.Index(fields=["enabled", "next_poll_at"]),
         ]
 
     def __str__(self):
@@ -149,14 +168,133 @@ class Article(models.Model):
             models.Index(fields=["feed", "identifier"]),
             models.Index(fields=["feed", "date"]),
             models.Index(fields=["date"]),
-            models.Index(fields=["read"]),
-            models.Index(fields=["starred"]),
             models.Index(fields=["feed", "read", "date"]),
+            # Partial indexes for the unread and starred streams. Django renders
+            # boolean filters as `NOT "read"` / `"starred"`, which cannot seek
+            # a plain index on the flag; these keep the rows in date order.
+            models.Index(
+                fields=["date"], condition=Q(read=False), name="core_article_unread_date_idx"
+            ),
+            models.Index(
+                fields=["feed", "date"],
+                condition=Q(read=False),
+                name="core_article_unread_feed_idx",
+            ),
+            models.Index(
+                fields=["date"], condition=Q(starred=True), name="core_article_starred_date_idx"
+            ),
         ]
 
+    # Fields the feed counters depend on (see FeedCounterService), and their
+    # values when the article was loaded or last saved
+    COUNTED_FIELDS = ("feed_id", "read", "date")
+    _counted_state: Optional[Tuple[Any, ...]] = None
+
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        """
+        Save the article and keep the counters of its feed in step.
+
+        Bulk writes go through FeedCounterService directly; this covers
+        single saves elsewhere (admin edits, import-export, scripts).
+        """
+        from .services.feed_counter_service import FeedCounterService
+
+        adding = self._state.adding
+        previous = self._counted_state
+        update_fields = kwargs.get("update_fields")
+        counted = update_fields is None or {"feed", "feed_id", "read", "date"} & set(update_fields)
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            current = self._get_counted_state()
+            if adding:
+                FeedCounterService.record_created([self])
+            elif not counted or previous == current:
+                pass
+            elif (
+                previous is None
+                or current is None
+                or previous[0] != current[0]
+                or previous[2] != current[2]
+            ):
+                # Unknown previous state, or moved to another feed or date
+                feed_ids = {self.feed_id, previous[0] if previous else None}
+                FeedCounterService.refresh(feed_id for feed_id in feed_ids if feed_id)
+            else:
+                FeedCounterService.adjust_unread({self.feed_id: -1 if self.read else 1})
+        self._counted_state = current
+
+    def delete(self, *args, **kwargs):
+        """Delete the article, keeping its feed's counters and image references in step."""
+        from .services.feed_counter_service import FeedCounterService
+        from .services.image_blob_service import ImageBlobService
+
+        feed_id = self.feed_id
+        with transaction.atomic():
+            ImageBlobService.release([self.icon.name if self.icon else None])
+            result = super().delete(*args, **kwargs)
+            FeedCounterService.refresh([feed_id])
+        return result
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._counted_state = instance._get_counted_state()
+        return instance
+
+    def _get_counted_state(self) -> Optional[Tuple[Any, ...]]:
+        """Get the values of COUNTED_FIELDS, or None if some are deferred."""
+        if any(field not in self.__dict__ for field in self.COUNTED_FIELDS):
+            return None
+        return tuple(self.__dict__[field] for field in self.COUNTED_FIELDS)
+
+
+class FeedCounter(models.Model):
+    """Denormalised article counters of a feed, maintained by FeedCounterService."""
+
+    feed = models.OneToOneField(
+        Feed, on_delete=models.CASCADE, primary_key=True, related_name="counter"
+    )
+    unread_count = models.IntegerField(default=0)
+    total_count = models.IntegerField(default=0)
+    newest_date = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Feed Counter"
+        verbose_name_plural = "Feed Counters"
+
+    def __str__(self):
+        return f"{self.feed_id}: {self.unread_count}/{self.total_count}"
+
+
+class ImageBlob(models.Model):
+    """Image file stored once per distinct content, maintained by ImageBlobService.
+
+    Articles reference a blob by pointing Article.icon at its file name.
+    """
+
+    digest = models.CharField(max_length=64, primary_key=True)  # SHA-256 of the bytes
+    name = models.CharField(max_length=255)  # Storage name of the file
+    content_type = models.CharField(max_length=100)
+    size = models.PositiveIntegerField()
+    ref_count = models.IntegerField(default=0)  # Articles whose icon is this file
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Image Blob"
+        verbose_name_plural = "Image Blobs"
+        indexes = [
+            models.Index(fields=["name"]),
+            models.Index(fields=["ref_count", "updated_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} refs)"
+
 
 class UserSettings(models.Model):
     """User settings for API credentials and preferences."""
@@ -302,3 +440,19 @@ class GReaderAuthToken(models.Model):
         token = secrets.token_hex(32)
         expires_at = timezone.now() + timedelta(days=days)
         return cls.objects.create(user=user, token=token, expires_at=expires_at)
+
+
+class HostRateLimit(models.Model):
+    """Request pacing state of an outbound host, shared by all worker processes."""
+
+    host = models.CharField(max_length=255, unique=True)
+    # Unix timestamps (seconds), see core.rate_limiter
+    next_request_at = models.FloatField(default=0.0)
+    blocked_until = models.FloatField(default=0.0)
+
+    class Meta:
+        verbose_name = "Host Rate Limit"
+        verbose_name_plural = "Host Rate Limits"
+
+    def __str__(self):
+        return self.host
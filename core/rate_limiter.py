@@ -0,0 +1,285 @@
+"""
+Per-host request pacing shared by all worker processes.
+
+Each host gets a token bucket, implemented as GCRA (generic cell rate
+algorithm): the HostRateLimit row of a host stores the time at which the next
+request is due. A process reserves a window of LEASE_SLOTS request slots by
+moving that time forward with a compare-and-swap UPDATE, so any number of
+qcluster workers stay within the configured rate without holding locks. The
+threads of the process take their slots from that window in memory and sleep
+until their slot starts; only every LEASE_SLOTS-th request touches the
+database. Up to AGGREGATOR_HOST_BURST requests may start right away.
+
+429 and 503 responses block the host until their Retry-After has passed.
+Other processes see a block when they reserve their next window.
+Rows of hosts that have not been requested for a day are deleted by
+prune_idle_hosts, scheduled daily.
+
+Pacing is best effort: if the database is unavailable, requests go out
+unpaced rather than failing.
+"""
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from django.conf import settings
+from django.db import DatabaseError
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# Defaults for the AGGREGATOR_HOST_* settings
+DEFAULT_RATE = 2.0
+DEFAULT_BURST = 4
+DEFAULT_MAX_WAIT = 60.0
+
+# Host block for a 429 without a (valid) Retry-After header
+DEFAULT_RETRY_AFTER = 30.0
+
+# Attempts to win the compare-and-swap before giving up on pacing
+MAX_RESERVE_ATTEMPTS = 20
+
+# Request slots a process reserves at once. Slots it does not use in time
+# are lost, so larger windows save writes but pace a busy host more slowly.
+LEASE_SLOTS = 4
+
+# Hosts not requested or blocked for this long lose their row
+IDLE_HOST_AGE = timedelta(days=1)
+
+
+@dataclass
+class _Lease:
+    """Request slots of a host reserved by this process."""
+
+    next_slot: float = 0.0  # Start of the next unused slot
+    end: float = 0.0  # End of the reserved window
+    blocked_until: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+_leases: Dict[str, _Lease] = {}
+_leases_pid: Optional[int] = None
+_leases_lock = threading.Lock()
+
+
+class HostRateLimitedError(requests.RequestException):
+    """The host is paced or blocked for longer than AGGREGATOR_HOST_MAX_WAIT."""
+
+    def __init__(self, host: str, wait: float):
+        super().__init__(f"Rate limit for {host}: next request in {wait:.0f}s")
+        self.host = host
+        self.wait = wait
+
+
+def get_host(url: str) -> str:
+    """Get the host a URL is paced by."""
+    return (urlparse(url).hostname or "").lower()
+
+
+def _get_rate() -> float:
+    return float(getattr(settings, "AGGREGATOR_HOST_RATE_LIMIT", DEFAULT_RATE))
+
+
+def _get_burst() -> int:
+    return max(1, int(getattr(settings, "AGGREGATOR_HOST_BURST", DEFAULT_BURST)))
+
+
+def _get_max_wait() -> float:
+    return float(getattr(settings, "AGGREGATOR_HOST_MAX_WAIT", DEFAULT_MAX_WAIT))
+
+
+def acquire(url: str) -> float:
+    """
+    Wait until a request to the URL's host is allowed.
+
+    Args:
+        url: URL about to be requested
+
+    Returns:
+        Seconds waited
+
+    Raises:
+        HostRateLimitedError: If the wait would exceed AGGREGATOR_HOST_MAX_WAIT
+    """
+    rate = _get_rate()
+    host = get_host(url)
+    if rate <= 0 or not host:
+        return 0.0
+
+    interval = 1.0 / rate
+    tolerance = (_get_burst() - 1) * interval
+
+    lease = _get_lease(host)
+    with lease.lock:
+        now = time.time()
+        slot = max(lease.next_slot, now)
+        if slot >= lease.end - 1e-6:
+            # Window used up or passed, reserve the next one
+            window = _reserve(host, interval, tolerance)
+            if window is None:
+                return 0.0
+            start, blocked_until = window
+            lease.next_slot = slot = start
+            lease.blocked_until = max(lease.blocked_until, blocked_until)
+            lease.end = start + LEASE_SLOTS * interval
+
+        wait = max(slot - tolerance, lease.blocked_until) - now
+        if wait > _get_max_wait():
+            raise HostRateLimitedError(host, wait)
+        lease.next_slot = slot + interval
+
+    if wait <= 0:
+        return 0.0
+    logger.debug(f"Pacing {host}: waiting {wait:.2f}s")
+    time.sleep(wait)
+    return wait
+
+
+def _reserve(host: str, interval: float, tolerance: float) -> Optional[Tuple[float, float]]:
+    """
+    Reserve the host's next window of LEASE_SLOTS request slots for this process.
+
+    Returns:
+        Start of the window and the host's block (Unix times), or None if
+        pacing is unavailable
+
+    Raises:
+        HostRateLimitedError: If the window starts later than AGGREGATOR_HOST_MAX_WAIT
+    """
+    from core.models import HostRateLimit
+
+    try:
+        for _ in range(MAX_RESERVE_ATTEMPTS):
+            state, _created = HostRateLimit.objects.get_or_create(host=host)
+            now = time.time()
+            start = max(state.next_request_at, state.blocked_until, now)
+            wait = max(start - tolerance, state.blocked_until) - now
+
+            if wait > _get_max_wait():
+                raise HostRateLimitedError(host, wait)
+
+            reserved = HostRateLimit.objects.filter(
+                pk=state.pk, next_request_at=state.next_request_at
+            ).update(next_request_at=start + LEASE_SLOTS * interval)
+            if reserved:
+                return start, state.blocked_until
+    except DatabaseError as e:
+        logger.warning(f"Host rate limit unavailable for {host}: {e}")
+        return None
+
+    logger.warning(f"Could not reserve a request slot for {host}, not pacing")
+    return None
+
+
+def _get_lease(host: str) -> _Lease:
+    """Get this process's lease of a host; a forked process starts without leases."""
+    global _leases_pid
+
+    with _leases_lock:
+        if _leases_pid != os.getpid():
+            _leases.clear()
+            _leases_pid = os.getpid()
+        lease = _leases.get(host)
+        if lease is None:
+            lease = _leases[host] = _Lease()
+        return lease
+
+
+def clear_leases() -> None:
+    """Forget this process's reserved request slots."""
+    with _leases_lock:
+        _leases.clear()
+
+
+def block(url: str, seconds: float) -> None:
+    """
+    Block the URL's host for the given number of seconds.
+
+    Args:
+        url: URL of the host to block
+        seconds: Duration of the block
+    """
+    from core.models import HostRateLimit
+
+    host = get_host(url)
+    if not host or seconds <= 0:
+        return
+
+    until = time.time() + seconds
+    lease = _get_lease(host)
+    lease.blocked_until = max(lease.blocked_until, until)
+    try:
+        HostRateLimit.objects.get_or_create(host=host)
+        HostRateLimit.objects.filter(host=host, blocked_until__lt=until).update(blocked_until=until)
+    except DatabaseError as e:
+        logger.warning(f"Could not block {host}: {e}")
+        return
+    logger.info(f"Blocking {host} for {seconds:.0f}s")
+
+
+def prune_idle_hosts(max_age: timedelta = IDLE_HOST_AGE) -> int:
+    """
+    Delete the pacing state of hosts that have not been requested for a while.
+
+    Args:
+        max_age: Minimum time since the host's last request slot and block
+
+    Returns:
+        Number of deleted hosts
+    """
+    from core.models import HostRateLimit
+
+    cutoff = time.time() - max_age.total_seconds()
+    deleted, _ = HostRateLimit.objects.filter(
+        next_request_at__lt=cutoff, blocked_until__lt=cutoff
+    ).delete()
+    logger.info(f"Deleted rate limit state of {deleted} idle host(s)")
+    return deleted
+
+
+def report_response(url: str, response: requests.Response) -> None:
+    """
+    Honour rate limiting responses (429, or 503 with Retry-After).
+
+    Args:
+        url: Requested URL
+        response: Response of the host
+    """
+    if response.status_code not in (429, 503):
+        return
+
+    delay = parse_retry_after(response.headers.get("Retry-After"))
+    if delay is None:
+        if response.status_code != 429:
+            return
+        delay = DEFAULT_RETRY_AFTER
+    block(url, delay)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delay in seconds or HTTP date).
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
@@ -5,6 +5,15 @@ Services package.
 from .aggregator_service import AggregatorService
 from .article_service import ArticleService
 from .email_service import EmailService
+from .feed_counter_service import FeedCounterService
+from .image_blob_service import ImageBlobService
 from .maintenance_service import MaintenanceService
 
-__all__ = ["AggregatorService", "ArticleService", "EmailService", "MaintenanceService"]
+__all__ = [
+    "AggregatorService",
+    "ArticleService",
+    "EmailService",
+    "FeedCounterService",
+    "ImageBlobService",
+    "MaintenanceService",
+]
@@ -1,9 +1,11 @@
 """Service for triggering and managing feed aggregators."""
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
 from django.utils.text import slugify
 
@@ -12,6 +14,8 @@ from django_q.tasks import async_task
 from ..aggregators import get_aggregator
 from ..aggregators.services.header_element.file_handler import HeaderElementFileHandler
 from ..models import Article, Feed
+from .feed_counter_service import FeedCounterService
+from .poll_scheduler import PollScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +39,8 @@ class AggregatorService:
                 - feed_name: The feed name
                 - aggregator_type: The aggregator type used
                 - articles_count: Number of articles aggregated
+                - skipped_existing: Number of already stored articles dropped before
+                  enrichment (fetches avoided)
                 - error: Error message if failed (optional)
 
         Raises:
@@ -57,6 +63,9 @@ class AggregatorService:
 
             # Get the aggregator
             aggregator = get_aggregator(feed)
+            # Known articles are only worth re-fetching when they will be updated
+            aggregator.skip_existing = not force_update
+            aggregator.conditional_fetch = not force_update
 
             # Trigger aggregation
             print(f"\n{'=' * 60}")
@@ -66,61 +75,22 @@ class AggregatorService:
             articles_data = aggregator.aggregate()
 
             # Save articles to database
-            created_count = 0
-            updated_count = 0
-            for article_data in articles_data:
-                try:
-                    # Get or create article by identifier
-                    article = Article.objects.filter(
-                        feed=feed, identifier=article_data["identifier"]
-                    ).first()
-
-                    if article:
-                        # Update existing article only if force_update is True
-                        if force_update:
-                            updated = False
-                            if article.name != article_data.get("name", ""):
-                                article.name = article_data.get("name", "")
-                                updated = True
-                            if article.raw_content != article_data.get("raw_content", ""):
-                                article.raw_content = article_data.get("raw_content", "")
-                                updated = True
-                            if article.content != article_data.get("content", ""):
-                                article.content = article_data.get("content", "")
-                                updated = True
-                            if article.author != article_data.get("author", ""):
-                                article.author = article_data.get("author", "")
-                                updated = True
+            created_count, updated_count = AggregatorService._save_articles(
+                feed, articles_data, force_update
+            )
 
-                            if updated:
-                                article.save()
-                                updated_count += 1
-                    else:
-                        # Create new article
-                        article = Article.objects.create(
-                            feed=feed,
-                            identifier=article_data["identifier"],
-                            name=article_data.get("name", ""),
-                            raw_content=article_data.get("raw_content", ""),
-                            content=article_data.get("content", ""),
-                            date=timezone.now(),  # Always save with current timestamp
-                            author=article_data.get("author", ""),
-                        )
-                        created_count += 1
-
-                        # Handle header image if present
-                        header_data = article_data.get("header_data")
-                        if header_data:
-                            HeaderElementFileHandler.save_image_to_article(
-                                article, header_data.image_bytes, header_data.content_type
-                            )
-                except Exception as e:
-                    print(f"Warning: Failed to save article: {e}")
+            aggregator.save_fetch_state()
+            AggregatorService._schedule_next_poll(
+                feed,
+                created_count,
+                daily_limit_reached=aggregator.get_current_run_limit() == 0,
+            )
 
             print(f"{'=' * 60}")
             print("Aggregation completed successfully")
             print(f"Created {created_count} new articles")
             print(f"Updated {updated_count} articles")
+            print(f"Skipped {aggregator.skipped_existing_count} already stored articles")
             print(f"{'=' * 60}\n")
 
             return {
@@ -129,11 +99,14 @@ class AggregatorService:
                 "feed_name": feed.name,
                 "aggregator_type": feed.aggregator,
                 "articles_count": created_count + updated_count,
+                "skipped_existing": aggregator.skipped_existing_count,
             }
 
         except ObjectDoesNotExist as e:
             raise ObjectDoesNotExist(f"Feed with ID {feed_id} does not exist") from e
         except Exception as e:
+            if "feed" in locals():
+                AggregatorService._schedule_next_poll(feed, 0, success=False)
             return {
                 "success": False,
                 "feed_id": feed_id,
@@ -143,6 +116,111 @@ class AggregatorService:
                 "error": str(e),
             }
 
+    @staticmethod
+    def _schedule_next_poll(
+        feed: Feed, new_articles: int, success: bool = True, daily_limit_reached: bool = False
+    ) -> None:
+        """Record the run with the PollScheduler (never fails the run itself)."""
+        try:
+            PollScheduler.record_run(
+                feed, new_articles, success=success, daily_limit_reached=daily_limit_reached
+            )
+        except Exception as e:
+            logger.warning(f"Failed to schedule next poll for feed {feed.id}: {e}")
+
+    @staticmethod
+    def _save_articles(
+        feed: Feed, articles_data: List[Dict[str, Any]], force_update: bool
+    ) -> Tuple[int, int]:
+        """
+        Save aggregated articles with a constant number of queries.
+
+        Existing articles are fetched with one query. New articles are inserted
+        with bulk_create and (with force_update) changed ones are written with
+        bulk_update, both in one transaction, so the database write lock is only
+        held briefly. Header images are written to storage after the commit.
+
+        Args:
+            feed: Feed the articles belong to
+            articles_data: Article dictionaries returned by the aggregator
+            force_update: Whether to update existing articles
+
+        Returns:
+            Tuple of (created count, updated count)
+        """
+        identifiers = {
+            article_data["identifier"]
+            for article_data in articles_data
+            if article_data.get("identifier")
+        }
+        existing: Dict[str, Article] = {}
+        for stored in Article.objects.filter(feed=feed, identifier__in=identifiers):
+            # Keep the first match of the default ordering, like .first() did
+            existing.setdefault(stored.identifier, stored)
+
+        new_articles: List[Article] = []
+        new_header_data = []
+        changed_articles: Dict[str, Article] = {}
+        seen = set()
+        for article_data in articles_data:
+            try:
+                identifier = article_data["identifier"]
+                article = existing.get(identifier)
+
+                if article:
+                    # Update existing article only if force_update is True
+                    if force_update:
+                        updated = False
+                        for field in ("name", "raw_content", "content", "author"):
+                            value = article_data.get(field, "")
+                            if getattr(article, field) != value:
+                                setattr(article, field, value)
+                                updated = True
+                        if updated:
+                            changed_articles[identifier] = article
+                elif identifier not in seen:
+                    # Create new article
+                    new_articles.append(
+                        Article(
+                            feed=feed,
+                            identifier=identifier,
+                            name=article_data.get("name", ""),
+                            raw_content=article_data.get("raw_content", ""),
+                            content=article_data.get("content", ""),
+                            date=timezone.now(),  # Always save with current timestamp
+                            author=article_data.get("author", ""),
+                        )
+                    )
+                    new_header_data.append(article_data.get("header_data"))
+                seen.add(identifier)
+            except Exception as e:
+                print(f"Warning: Failed to save article: {e}")
+
+        now = timezone.now()
+        for article in changed_articles.values():
+            # bulk_update does not apply auto_now
+            article.updated_at = now
+
+        with transaction.atomic():
+            created = Article.objects.bulk_create(new_articles)
+            FeedCounterService.record_created(created)
+            Article.objects.bulk_update(
+                changed_articles.values(),
+                ["name", "raw_content", "content", "author", "updated_at"],
+            )
+
+        # Handle header images (file writes happen outside the transaction)
+        with_icons = []
+        for article, header_data in zip(created, new_header_data, strict=True):
+            if header_data and HeaderElementFileHandler.save_image_to_article(
+                article, header_data.image_bytes, header_data.content_type, save=False
+            ):
+                with_icons.append(article)
+        if with_icons:
+            Article.objects.bulk_update(with_icons, ["icon"])
+
+        return len(created), len(changed_articles)
+
     @staticmethod
     def trigger_by_aggregator_type(
         aggregator_type: str,
@@ -224,22 +302,53 @@ class AggregatorService:
                 result = AggregatorService.trigger_by_feed_id(feed.id, force_update=force_update)
                 results.append(result)
             else:
-                task_id = async_task(
-                    "core.services.aggregator_service.AggregatorService.trigger_by_feed_id",
-                    feed.id,
-                    force_update=force_update,
-                    task_name=f"aggregate_feed_{slugify(feed.name).replace('-', '_')}",
-                )
-                logger.info(f"Spawned aggregation task for feed {feed.id} ({feed.name}): {task_id}")
-                results.append(
-                    {
-                        "feed_id": feed.id,
-                        "feed_name": feed.name,
-                        "task_id": task_id,
-                        "status": "queued",
-                    }
-                )
+                results.append(AggregatorService._enqueue_feed(feed, force_update=force_update))
 
         if not sync:
             logger.info(f"Queued {len(results)} feed aggregation tasks")
         return results
+
+    @staticmethod
+    def trigger_due(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Enqueue the enabled feeds whose next poll is due.
+
+        This is the periodic aggregation task. PollScheduler decides per feed
+        when it is due, based on how often the feed publishes.
+
+        Args:
+            limit: Optional limit on number of feeds to enqueue (most overdue first)
+
+        Returns:
+            List of dictionaries with feed_id and task_id for each spawned task
+        """
+        feeds = PollScheduler.due_feeds().order_by(F("next_poll_at").asc(nulls_first=True))
+
+        if limit:
+            feeds = feeds[:limit]
+
+        results = []
+        for feed in feeds:
+            # Keep the feed from being enqueued again before its task has run
+            PollScheduler.lease(feed)
+            results.append(AggregatorService._enqueue_feed(feed))
+
+        logger.info(f"Queued {len(results)} due feed aggregation tasks")
+        return results
+
+    @staticmethod
+    def _enqueue_feed(feed: Feed, force_update: bool = False) -> Dict[str, Any]:
+        """Spawn an async aggregation task for a feed."""
+        task_id = async_task(
+            "core.services.aggregator_service.AggregatorService.trigger_by_feed_id",
+            feed.id,
+            force_update=force_update,
+            task_name=f"aggregate_feed_{slugify(feed.name).replace('-', '_')}",
+        )
+        logger.info(f"Spawned aggregation task for feed {feed.id} ({feed.name}): {task_id}")
+        return {
+            "feed_id": feed.id,
+            "feed_name": feed.name,
+            "task_id": task_id,
+            "status": "queued",
+        }
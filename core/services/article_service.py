@@ -7,6 +7,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from ..aggregators import get_aggregator
 from ..aggregators.services.header_element.file_handler import HeaderElementFileHandler
 from ..models import Article
+from .feed_counter_service import FeedCounterService
 
 
 class ArticleService:
@@ -150,6 +151,8 @@ class ArticleService:
 
         # Delete articles older than the cutoff date
         # We preserve starred articles as they are explicitly saved by the user
-        count, _ = Article.objects.filter(date__lt=cutoff_date, starred=False).delete()
+        count = FeedCounterService.delete_articles(
+            Article.objects.filter(date__lt=cutoff_date, starred=False)
+        )
 
         return count
@@ -0,0 +1,240 @@
+"""Service maintaining the denormalised per-feed article counters."""
+
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import models, transaction
+from django.db.models import Count, F, Max, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from ..models import Article, FeedCounter
+from .image_blob_service import ImageBlobService
+
+logger = logging.getLogger(__name__)
+
+# (unread count, total count, newest article date)
+Counts = Tuple[int, int, Optional[datetime]]
+
+
+class FeedCounterService:
+    """
+    Keep FeedCounter rows in step with the articles of each feed.
+
+    Counters are created lazily: a feed without a row gets it computed from
+    its articles the first time it is read (get_counters). Writes only adjust
+    rows that already exist, so article changes made before a row exists are
+    picked up by that first computation.
+
+    Every code path that inserts articles, changes their read state or
+    deletes them goes through this service, inside the same transaction as
+    the article change. Single-article writes elsewhere (admin edits,
+    import-export, scripts) are covered by Article.save and Article.delete,
+    which call this service as well. Only queryset-level writes that bypass
+    the model (QuerySet.update/delete, bulk_create/bulk_update) outside this
+    service leave the counters wrong; `manage.py rebuild_feed_counters`
+    repairs them.
+    """
+
+    @staticmethod
+    def compute(feed_ids: Optional[Iterable[int]] = None) -> Dict[int, Counts]:
+        """
+        Compute counters from the articles table.
+
+        Args:
+            feed_ids: Feeds to compute, or None for every feed with articles
+
+        Returns:
+            Dictionary mapping feed ID to (unread, total, newest date). Feeds
+            without articles are only included if listed in feed_ids.
+        """
+        articles = Article.objects.order_by()
+        counts: Dict[int, Counts] = {}
+        if feed_ids is not None:
+            feed_ids = list(feed_ids)
+            articles = articles.filter(feed_id__in=feed_ids)
+            counts = dict.fromkeys(feed_ids, (0, 0, None))
+
+        rows = articles.values("feed_id").annotate(
+            unread=Count("id", filter=Q(read=False)),
+            total=Count("id"),
+            newest=Max("date"),
+        )
+        for row in rows:
+            counts[row["feed_id"]] = (row["unread"], row["total"], row["newest"])
+        return counts
+
+    @staticmethod
+    def refresh(feed_ids: Optional[Iterable[int]] = None) -> int:
+        """
+        Recompute and store the counters of feeds.
+
+        Args:
+            feed_ids: Feeds to refresh, or None for every feed with articles
+
+        Returns:
+            Number of counter rows written
+        """
+        # One transaction, so articles counted by record_created() in between
+        # cannot be overwritten by the older computation (IMMEDIATE
+        # transactions take the write lock before compute() reads)
+        with transaction.atomic():
+            counts = FeedCounterService.compute(feed_ids)
+            FeedCounter.objects.bulk_create(
+                [
+                    FeedCounter(
+                        feed_id=feed_id, unread_count=unread, total_count=total, newest_date=newest
+                    )
+                    for feed_id, (unread, total, newest) in counts.items()
+                ],
+                update_conflicts=True,
+                unique_fields=["feed"],
+                update_fields=["unread_count", "total_count", "newest_date"],
+            )
+        return len(counts)
+
+    @staticmethod
+    def get_counters(feed_ids: Iterable[int]) -> Dict[int, FeedCounter]:
+        """
+        Get the counters of feeds, computing rows that do not exist yet.
+
+        Args:
+            feed_ids: IDs of the feeds
+
+        Returns:
+            Dictionary mapping feed ID to its FeedCounter
+        """
+        feed_ids = list(feed_ids)
+        counters = FeedCounter.objects.in_bulk(feed_ids)
+        missing = [feed_id for feed_id in feed_ids if feed_id not in counters]
+        if missing:
+            FeedCounterService.refresh(missing)
+            counters.update(FeedCounter.objects.in_bulk(missing))
+        return counters
+
+    @staticmethod
+    def record_created(articles: Iterable[Article]) -> None:
+        """
+        Count newly inserted articles.
+
+        Call inside the transaction that inserted them.
+
+        Args:
+            articles: Article instances that were just created
+        """
+        stats: Dict[int, List] = {}
+        for article in articles:
+            unread, total, newest = stats.setdefault(article.feed_id, [0, 0, article.date])
+            stats[article.feed_id] = [
+                unread + (0 if article.read else 1),
+                total + 1,
+                max(newest, article.date),
+            ]
+
+        for feed_id, (unread, total, newest) in stats.items():
+            newest_value = Value(newest, output_field=models.DateTimeField())
+            FeedCounter.objects.filter(feed_id=feed_id).update(
+                unread_count=F("unread_count") + unread,
+                total_count=F("total_count") + total,
+                newest_date=Greatest(Coalesce("newest_date", newest_value), newest_value),
+            )
+
+    @staticmethod
+    def adjust_unread(deltas: Dict[int, int]) -> None:
+        """
+        Apply changes of the unread counts.
+
+        Args:
+            deltas: Dictionary mapping feed ID to the change of its unread count
+        """
+        for feed_id, delta in deltas.items():
+            if delta:
+                FeedCounter.objects.filter(feed_id=feed_id).update(
+                    unread_count=F("unread_count") + delta
+                )
+
+    @staticmethod
+    def set_read(queryset: models.QuerySet, read: bool) -> int:
+        """
+        Set the read state of articles and update the unread counts.
+
+        Args:
+            queryset: Articles to change
+            read: New read state
+
+        Returns:
+            Number of articles whose read state changed
+        """
+        with transaction.atomic():
+            changing = queryset.filter(read=not read)
+            per_feed = changing.order_by().values("feed_id").annotate(n=Count("id"))
+            sign = -1 if read else 1
+            deltas = {row["feed_id"]: sign * row["n"] for row in per_feed}
+
+            updated = changing.update(read=read)
+            FeedCounterService.adjust_unread(deltas)
+
+        return updated
+
+    @staticmethod
+    def delete_articles(queryset: models.QuerySet) -> int:
+        """
+        Delete articles and update the counters of their feeds.
+
+        Also drops the articles' references to shared image blobs.
+
+        Args:
+            queryset: Articles to delete
+
+        Returns:
+            Number of deleted articles
+        """
+        with transaction.atomic():
+            per_feed = (
+                queryset.order_by()
+                .values("feed_id")
+                .annotate(
+                    unread=Count("id", filter=Q(read=False)),
+                    total=Count("id"),
+                )
+            )
+            removed = {row["feed_id"]: (row["unread"], row["total"]) for row in per_feed}
+
+            ImageBlobService.release_articles(queryset)
+            count, _ = queryset.delete()
+
+            for feed_id, (unread, total) in removed.items():
+                FeedCounter.objects.filter(feed_id=feed_id).update(
+                    unread_count=F("unread_count") - unread,
+                    total_count=F("total_count") - total,
+                )
+            # The newest article may have been deleted; (feed, date) index lookup per feed
+            newest = (
+                Article.objects.filter(feed_id=OuterRef("feed_id"))
+                .order_by("-date")
+                .values("date")[:1]
+            )
+            FeedCounter.objects.filter(feed_id__in=list(removed)).update(
+                newest_date=Subquery(newest)
+            )
+
+        return count
+
+    @staticmethod
+    def verify() -> List[Tuple[int, Counts, Counts]]:
+        """
+        Compare stored counters with the articles table.
+
+        Returns:
+            List of (feed ID, stored counts, actual counts) for each mismatch
+        """
+        mismatches = []
+        stored = {
+            counter.feed_id: (counter.unread_count, counter.total_count, counter.newest_date)
+            for counter in FeedCounter.objects.all()
+        }
+        actual = FeedCounterService.compute(stored.keys())
+        for feed_id, counts in stored.items():
+            if counts != actual[feed_id]:
+                mismatches.append((feed_id, counts, actual[feed_id]))
+        return mismatches
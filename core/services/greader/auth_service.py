@@ -6,15 +6,27 @@ Handles token generation, validation, and user authentication for the Google Rea
 import hashlib
 import logging
 import secrets
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
+from django.core.cache import cache
 
 from core.models import GReaderAuthToken
 
 logger = logging.getLogger(__name__)
 
+# Token lookups are cached in-process (LRU) in front of the shared cache, so
+# authenticated requests with a known token need no database query. The
+# in-process TTL bounds how long a token revoked in another process stays
+# usable here.
+TOKEN_CACHE_SIZE = 1024
+TOKEN_CACHE_TTL = 60
+SHARED_TOKEN_CACHE_TTL = 300
+
 
 class AuthenticationError(Exception):
     """Authentication failed."""
@@ -28,6 +40,46 @@ class TokenExpiredError(Exception):
     pass
 
 
+class _TokenCache:
+    """Thread-safe LRU cache with a per-entry TTL."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            stored_at, value = item
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: dict) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_token_cache = _TokenCache(TOKEN_CACHE_SIZE, TOKEN_CACHE_TTL)
+
+
 def generate_auth_token(username: str, user_id: int) -> str:
     """Generate a long-lived authentication token.
 
@@ -168,25 +220,17 @@ def _authenticate_with_header(auth_header: str) -> dict | None:
 
     token = token.strip()
 
-    # Query token from database
-    try:
-        auth_token = GReaderAuthToken.objects.select_related("user").get(token=token)
-    except GReaderAuthToken.DoesNotExist:
+    entry = _lookup_token(token)
+    if entry is None:
         logger.warning("Authentication failed: token not found")
         return None
 
-    # Check validity using model method
-    if not auth_token.is_valid():
+    if not _entry_is_valid(entry):
         logger.warning("Authentication failed: token invalid or expired")
         return None
 
     # Return user info
-    user = auth_token.user
-    return {
-        "id": user.id,
-        "username": user.username,
-        "email": user.email,
-    }
+    return dict(entry["user"])
 
 
 def validate_token(token_str: str) -> bool:
@@ -198,11 +242,68 @@ def validate_token(token_str: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    try:
-        auth_token = GReaderAuthToken.objects.get(token=token_str)
-        return auth_token.is_valid()
-    except GReaderAuthToken.DoesNotExist:
-        return False
+    entry = _lookup_token(token_str)
+    return entry is not None and _entry_is_valid(entry)
+
+
+def _shared_cache_key(token_str: str) -> str:
+    # Hash the token so it never appears in cache keys or files
+    return f"greader:auth:{hashlib.sha256(token_str.encode()).hexdigest()}"
+
+
+def _lookup_token(token_str: str) -> dict | None:
+    """Get user info and expiry of a token, from the caches or the database.
+
+    Args:
+        token_str: Token to look up
+
+    Returns:
+        Dict with 'user' (id, username, email) and 'expires_at' (Unix
+        timestamp or None), or None if the token does not exist
+    """
+    entry = _token_cache.get(token_str)
+    if entry is not None:
+        return entry
+
+    shared_key = _shared_cache_key(token_str)
+    entry = cache.get(shared_key)
+    if entry is None:
+        try:
+            auth_token = GReaderAuthToken.objects.select_related("user").get(token=token_str)
+        except GReaderAuthToken.DoesNotExist:
+            return None
+
+        user = auth_token.user
+        entry = {
+            "user": {
+                "id": user.id,
+                "username": user.username,
+                "email": user.email,
+            },
+            "expires_at": auth_token.expires_at.timestamp() if auth_token.expires_at else None,
+        }
+        cache.set(shared_key, entry, timeout=SHARED_TOKEN_CACHE_TTL)
+
+    _token_cache.set(token_str, entry)
+    return entry
+
+
+def _entry_is_valid(entry: dict) -> bool:
+    """Check the expiry of a cached token entry (like GReaderAuthToken.is_valid)."""
+    expires_at = entry["expires_at"]
+    return expires_at is None or expires_at >= time.time()
+
+
+def _evict_tokens(token_strs: list[str]) -> None:
+    """Remove tokens from the in-process and shared caches."""
+    for token_str in token_strs:
+        _token_cache.discard(token_str)
+    cache.delete_many([_shared_cache_key(token_str) for token_str in token_strs])
+
+
+def clear_token_cache() -> None:
+    """Clear the in-process token cache (the shared cache expires on its own)."""
+    _token_cache.clear()
 
 
 def revoke_token(token_str: str) -> bool:
@@ -217,6 +318,7 @@ def revoke_token(token_str: str) -> bool:
     try:
         auth_token = GReaderAuthToken.objects.get(token=token_str)
         auth_token.delete()
+        _evict_tokens([token_str])
         logger.info(f"Token revoked for user {auth_token.user.username}")
         return True
     except GReaderAuthToken.DoesNotExist:
@@ -233,7 +335,9 @@ def cleanup_expired_tokens() -> int:
 
     # Handle both aware and naive datetimes in the query
     tokens = GReaderAuthToken.objects.filter(expires_at__lte=now)
+    token_strs = list(tokens.values_list("token", flat=True))
     count, _ = tokens.delete()
+    _evict_tokens(token_strs)
 
     if count > 0:
         logger.info(f"Cleaned up {count} expired tokens")
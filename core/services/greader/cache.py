@@ -0,0 +1,84 @@
+"""Google Reader API cache helpers.
+
+GReader data is cached in Django's default cache, which is shared by all web
+and qcluster processes (see CACHES in settings). Keys are versioned per user:
+invalidating a user's entries bumps their version instead of deleting keys
+one by one, and a global generation invalidates every user without clearing
+unrelated cache entries.
+
+Version numbers are seeded from the clock, so a version key that was evicted
+never comes back with a value that old entries were stored under.
+"""
+
+import logging
+import time
+from typing import Any
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+ALL_USERS = "all"
+
+
+def _version_key(namespace: str, user_id: int | str) -> str:
+    return f"greader:{namespace}:version:{user_id}"
+
+
+def _new_version() -> int:
+    return time.time_ns() // 1000
+
+
+def get_version(namespace: str, user_id: int) -> str:
+    """Get the current cache version of a user's entries in a namespace.
+
+    Args:
+        namespace: Cache namespace (e.g. 'unread')
+        user_id: Django user ID
+
+    Returns:
+        Version string combining the global generation and the user's version
+    """
+    global_key = _version_key(namespace, ALL_USERS)
+    user_key = _version_key(namespace, user_id)
+    versions = cache.get_many([global_key, user_key])
+
+    for key in (global_key, user_key):
+        if key not in versions:
+            version = _new_version()
+            # add() keeps a version another process stored in the meantime
+            if not cache.add(key, version, timeout=None):
+                version = cache.get(key, version)
+            versions[key] = version
+
+    return f"{versions[global_key]}.{versions[user_key]}"
+
+
+def make_key(namespace: str, user_id: int, *parts: Any) -> str:
+    """Build a versioned cache key for a user's entry.
+
+    Args:
+        namespace: Cache namespace (e.g. 'unread')
+        user_id: Django user ID
+        *parts: Further key components
+
+    Returns:
+        Cache key that changes whenever the user's entries are invalidated
+    """
+    suffix = ":".join(str(part) for part in parts)
+    return f"greader:{namespace}:{user_id}:v{get_version(namespace, user_id)}:{suffix}"
+
+
+def bump_version(namespace: str, user_id: int | None = None) -> None:
+    """Invalidate cached entries in a namespace.
+
+    Args:
+        namespace: Cache namespace (e.g. 'unread')
+        user_id: If provided, invalidate only this user's entries; else all users
+    """
+    key = _version_key(namespace, user_id if user_id else ALL_USERS)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Key was never set or has been evicted
+        cache.set(key, _new_version(), timeout=None)
@@ -4,9 +4,12 @@ Handles formatting of articles and feeds for Google Reader API responses,
 including ID encoding/decoding and response structure building.
 """
 
+import base64
+import binascii
 import logging
-from datetime import datetime
-from typing import Any, Optional
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import Any, Iterable, Optional
 from urllib.parse import urlparse
 
 from core.models import Article, Feed
@@ -96,6 +99,49 @@ def encode_item_id(article_id: int) -> str:
     return f"tag:google.com,2005:reader/item/{hex_id}"
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+
+def encode_continuation(date: datetime, article_id: int) -> str:
+    """Encode the position of the last returned item as a continuation token.
+
+    The token is opaque to clients and carries the ``(date, id)`` seek key
+    of the last item on the page, so the next page can start right after it
+    without an OFFSET.
+
+    Args:
+        date: Publication date of the last returned article
+        article_id: ID of the last returned article
+
+    Returns:
+        URL-safe continuation token
+    """
+    microseconds = (date - _EPOCH) // timedelta(microseconds=1)
+    raw = f"{microseconds}:{article_id}".encode("ascii")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_continuation(token: str) -> tuple[datetime, int]:
+    """Decode a continuation token produced by encode_continuation.
+
+    Args:
+        token: Continuation token from a previous stream/contents response
+
+    Returns:
+        Tuple of (date, article_id) of the last item on the previous page
+
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("ascii")
+        microseconds, article_id = raw.split(":", 1)
+        return _EPOCH + timedelta(microseconds=int(microseconds)), int(article_id)
+    except (binascii.Error, UnicodeError, ValueError, OverflowError) as e:
+        raise ValueError(f"Invalid continuation token: {token}") from e
+
+
 def unix_timestamp(dt: Optional[datetime]) -> int:
     """Convert datetime to Unix timestamp (seconds).
 
@@ -194,6 +240,37 @@ def get_site_url(feed: Feed) -> str:
     return ""
 
 
+def get_feed_origin(feed: Feed, request=None) -> tuple[str, str]:
+    """Get the source and website URLs for a feed, memoised per request.
+
+    Resolving the source URL instantiates the feed's aggregator, so a stream
+    response with many items from the same few feeds would otherwise build
+    one aggregator per item. Results are cached on the request object keyed
+    by feed ID.
+
+    Args:
+        feed: Feed model instance
+        request: Django request object used as the cache scope (optional)
+
+    Returns:
+        Tuple of (feed_url, html_url)
+    """
+    cache = getattr(request, "_greader_feed_origins", None) if request is not None else None
+    if cache is None:
+        cache = {}
+        if request is not None:
+            request._greader_feed_origins = cache
+
+    origin = cache.get(feed.id)
+    if origin is None:
+        feed_url = get_feed_source_url(feed)
+        html_url = get_site_url(feed) or feed_url
+        origin = (feed_url, html_url)
+        cache[feed.id] = origin
+
+    return origin
+
+
 def format_subscription(feed: Feed, request, groups: list[dict] | None = None) -> dict[str, Any]:
     """Format a Feed as Google Reader subscription object.
 
@@ -209,8 +286,7 @@ def format_subscription(feed: Feed, request, groups: list[dict] | None = None) -
         groups = []
 
     # Use original feed URL and website URL
-    feed_url = get_feed_source_url(feed)
-    html_url = get_site_url(feed) or feed_url
+    feed_url, html_url = get_feed_origin(feed, request)
 
     return {
         "id": f"feed/{feed.id}",
@@ -275,8 +351,7 @@ def format_stream_item(
         item["canonical"] = [{"href": article.identifier}]
 
     # Add origin (feed info)
-    feed_url = get_feed_source_url(feed)
-    html_url = get_site_url(feed) or feed_url
+    feed_url, html_url = get_feed_origin(feed, request)
 
     item["origin"] = {
         "streamId": f"feed/{feed.id}",
@@ -284,16 +359,14 @@ def format_stream_item(
         "htmlUrl": html_url,
     }
 
-    # Add summary (content)
+    # Add summary and content (one shared object, clients expect both keys)
     if article.content:
-        item["summary"] = {
-            "direction": "ltr",
-            "content": article.content,
-        }
-        item["content"] = {
+        body = {
             "direction": "ltr",
             "content": article.content,
         }
+        item["summary"] = body
+        item["content"] = body
 
     # Add author if available
     if article.author:
@@ -335,14 +408,14 @@ def format_tag_list(tags: list[dict[str, str]]) -> dict[str, Any]:
 
 
 def format_stream_contents(
-    items: list[dict],
+    items: Iterable[dict],
     stream_id: str = "user/-/state/com.google/reading-list",
     continuation: str | None = None,
 ) -> dict[str, Any]:
     """Format stream contents as Google Reader response.
 
     Args:
-        items: List of items from format_stream_item
+        items: Items from format_stream_item, a list or a lazy iterable
         stream_id: The stream ID being displayed
         continuation: Optional continuation token for pagination
 
@@ -11,12 +11,16 @@ from django.db.models import Q
 from django.utils import timezone
 
 from core.models import Article, Feed
+from core.services.greader.cache import bump_version, make_key
 
 logger = logging.getLogger(__name__)
 
 # Cache timeout for unread counts (seconds)
 UNREAD_COUNT_CACHE_TTL = 30
 
+# Rows fetched per round trip when iterating stream results
+STREAM_CHUNK_SIZE = 100
+
 
 class StreamError(Exception):
     """Stream operation failed."""
@@ -27,7 +31,7 @@ class StreamError(Exception):
 def get_unread_count(user_id: int, include_all: bool = False) -> dict[str, Any]:
     """Get unread article counts per feed.
 
-    Uses caching for performance (30-second TTL).
+    Uses the shared cache for performance (30-second TTL).
 
     Args:
         user_id: Django user ID
@@ -37,7 +41,7 @@ def get_unread_count(user_id: int, include_all: bool = False) -> dict[str, Any]:
         Dict with 'max' and 'unreadcounts' array
     """
     # Check cache
-    cache_key = f"greader:unread:{user_id}:{include_all}"
+    cache_key = make_key("unread", user_id, include_all)
     cached = cache.get(cache_key)
     if cached is not None:
         return cached
@@ -54,38 +58,36 @@ def get_unread_count(user_id: int, include_all: bool = False) -> dict[str, Any]:
 def _compute_unread_count(user_id: int, include_all: bool) -> dict[str, Any]:
     """Actually compute unread counts (internal function).
 
-    Optimized to use a single query with annotations to prevent N+1 bottlenecks.
+    Reads the per-feed counters maintained by FeedCounterService, so the cost
+    is O(feeds) rather than a scan of all articles.
     """
-    from django.db.models import Count, Max
-
+    from core.services.feed_counter_service import FeedCounterService
     from core.services.greader.stream_format import unix_timestamp_microseconds
 
-    # Get newest timestamp per feed using a subquery for better accuracy if needed,
-    # though aggregation on the main query is usually sufficient.
-    # We use conditional aggregation to get unread counts in one go.
-    feeds = Feed.objects.filter(
-        Q(user_id=user_id) | Q(user_id__isnull=True),
-        enabled=True,
-    ).annotate(
-        unread_count=Count("articles", filter=Q(articles__read=False)),
-        total_count=Count("articles"),
-        newest_item_date=Max("articles__date"),
+    feed_ids = list(
+        Feed.objects.filter(
+            Q(user_id=user_id) | Q(user_id__isnull=True),
+            enabled=True,
+        ).values_list("id", flat=True)
     )
+    counters = FeedCounterService.get_counters(feed_ids)
 
     unreadcounts = []
-    for feed in feeds:
+    for feed_id in feed_ids:
+        counter = counters[feed_id]
+
         # Skip if 0 unread and not include_all
-        if feed.unread_count == 0 and not include_all:
+        if counter.unread_count == 0 and not include_all:
             continue
 
         newest_timestamp = unix_timestamp_microseconds(
-            feed.newest_item_date if feed.newest_item_date else timezone.now()
+            counter.newest_date if counter.newest_date else timezone.now()
         )
 
         unreadcounts.append(
             {
-                "id": f"feed/{feed.id}",
-                "count": feed.unread_count,
+                "id": f"feed/{feed_id}",
+                "count": counter.unread_count,
                 "newestItemTimestampUsec": newest_timestamp,
             }
         )
@@ -104,6 +106,7 @@ def get_stream_item_ids(
     exclude_tag: str | None = None,
     include_tag: str | None = None,
     reverse_order: bool = False,
+    lazy: bool = False,
 ) -> dict[str, Any]:
     """Get article IDs from a stream (lightweight query for syncing).
 
@@ -115,6 +118,8 @@ def get_stream_item_ids(
         exclude_tag: Tag to exclude (typically read articles)
         include_tag: Tag to include (typically starred articles)
         reverse_order: If True, get newest first; else oldest first
+        lazy: If True, 'itemRefs' is an iterator that reads rows from the
+            database as it is consumed (for streaming responses)
 
     Returns:
         Dict with 'itemRefs' array containing article IDs
@@ -151,11 +156,13 @@ def get_stream_item_ids(
 
     articles = articles[:limit]
 
-    # Return IDs only
-    item_ids = [str(article.id) for article in articles]
+    # Select the ID column only: no model instances, and SQLite can answer
+    # from an index (which always carries the rowid) without reading the row
+    rows = articles.values_list("id", flat=True).iterator(chunk_size=STREAM_CHUNK_SIZE)
+    item_refs = ({"id": str(article_id)} for article_id in rows)
 
     return {
-        "itemRefs": [{"id": item_id} for item_id in item_ids],
+        "itemRefs": item_refs if lazy else list(item_refs),
     }
 
 
@@ -169,6 +176,7 @@ def get_stream_contents(
     exclude_tag: str | None = None,
     include_tag: str | None = None,
     continuation: str | None = None,
+    lazy: bool = False,
 ) -> dict[str, Any]:
     """Get full article contents from a stream (with pagination).
 
@@ -182,12 +190,15 @@ def get_stream_contents(
         exclude_tag: Tag to exclude
         include_tag: Tag to include
         continuation: Continuation token for pagination
+        lazy: If True, 'items' is a StreamPage that formats articles as it is
+            iterated, and 'continuation' is a callable returning the token (or
+            None) once the items have been consumed (for streaming responses)
 
     Returns:
         Dict with 'items' array and optional 'continuation' token
     """
     from core.services.greader.stream_filter_builder import StreamFilterOrchestrator
-    from core.services.greader.stream_format import format_stream_contents, format_stream_item
+    from core.services.greader.stream_format import decode_continuation, format_stream_contents
 
     # Handle specific item IDs
     if item_ids:
@@ -210,7 +221,7 @@ def get_stream_contents(
                 feed__enabled=True,
             )
             .select_related("feed")
-            .order_by("-date")
+            .order_by("-date", "-id")
         )
 
     else:
@@ -236,58 +247,78 @@ def get_stream_contents(
             articles = articles.filter(date__lte=from_datetime)
 
         # Order
-        articles = articles.order_by("-date")
+        articles = articles.order_by("-date", "-id")
+
+    # raw_content (the unprocessed source HTML) is never sent to clients
+    articles = articles.defer("raw_content")
 
-    # Handle pagination
-    offset = 0
+    # Handle pagination: seek past the last item of the previous page
     if continuation:
         try:
-            offset = int(continuation)
+            last_date, last_id = decode_continuation(continuation)
         except ValueError:
             logger.warning(f"Invalid continuation token: {continuation}")
+        else:
+            articles = articles.filter(Q(date__lt=last_date) | Q(date=last_date, id__lt=last_id))
 
-    # Get total for continuation
-    total = articles.count()
-    has_more = (offset + limit) < total
-
-    # Get articles for this page
-    articles = articles[offset : offset + limit]
-
-    # Format items
-    items = []
-    # Use iterator() for memory efficiency on large querysets
-    for article in articles.iterator(chunk_size=limit):
-        item = format_stream_item(
-            article,
-            article.feed,
-            request,
-            is_read=article.read,
-            is_starred=article.starred,
-        )
-        items.append(item)
+    page = StreamPage(articles, limit, request)
+    stream_name = stream_id or "user/-/state/com.google/reading-list"
+
+    if lazy:
+        response = format_stream_contents(page, stream_name)
+        response["continuation"] = lambda: page.continuation
+        return response
 
     # Build response
-    stream_name = stream_id or "user/-/state/com.google/reading-list"
-    response = format_stream_contents(items, stream_name)
+    response = format_stream_contents(list(page), stream_name)
 
     # Add continuation if more results
-    if has_more:
-        response["continuation"] = str(offset + limit)
+    if page.continuation:
+        response["continuation"] = page.continuation
 
     return response
 
 
+class StreamPage:
+    """One page of stream/contents items, formatted as rows are read.
+
+    Iterating reads up to limit + 1 rows through a database cursor and yields
+    the first `limit` of them as stream items. An extra row means another page
+    exists; `continuation` then holds its token once iteration has finished.
+    """
+
+    def __init__(self, articles, limit: int, request):
+        self.articles = articles
+        self.limit = limit
+        self.request = request
+        self.continuation: str | None = None
+
+    def __iter__(self):
+        from core.services.greader.stream_format import encode_continuation, format_stream_item
+
+        last = None
+        rows = self.articles[: self.limit + 1].iterator(chunk_size=STREAM_CHUNK_SIZE)
+        for count, article in enumerate(rows):
+            if count == self.limit:
+                if last is not None:
+                    self.continuation = encode_continuation(last.date, last.id)
+                break
+            last = article
+            yield format_stream_item(
+                article,
+                article.feed,
+                self.request,
+                is_read=article.read,
+                is_starred=article.starred,
+            )
+
+
 def invalidate_unread_cache(user_id: int | None = None) -> None:
     """Invalidate cached unread counts.
 
     Args:
         user_id: If provided, invalidate only for this user; else invalidate all
     """
-    if user_id:
-        cache.delete(f"greader:unread:{user_id}:False")
-        cache.delete(f"greader:unread:{user_id}:True")
-    else:
-        # Invalidate all unread caches (crude but safe)
-        cache.clear()
+    bump_version("unread", user_id)
 
     logger.debug(f"Invalidated unread cache for user {user_id or 'all'}")
@@ -6,10 +6,16 @@ Handles tag operations: listing tags and marking articles with tags (read/starre
 import logging
 from typing import Any, List, Optional, Union
 
+from django.db import connection, transaction
+
 from core.models import Article, FeedGroup
+from core.services.feed_counter_service import FeedCounterService
 
 logger = logging.getLogger(__name__)
 
+# Bound parameters kept free for the non-ID filters of a batched UPDATE
+ID_BATCH_RESERVED_PARAMS = 10
+
 
 class TagError(Exception):
     """Tag operation failed."""
@@ -58,7 +64,7 @@ def edit_tags(
         remove_tag: Tag to remove
 
     Returns:
-        Dict with operation result
+        Dict with operation result; 'updated' counts articles whose state changed
 
     Raises:
         TagError: If operation fails
@@ -78,25 +84,26 @@ def edit_tags(
     if not article_ids:
         raise TagError("No valid article IDs provided")
 
-    # Get accessible articles
-    articles = Article.objects.filter(
-        id__in=article_ids,
-        feed__user_id__in=[user_id, None],  # User's articles or shared articles
-        feed__enabled=True,
-    )
-
-    if not articles.exists():
-        raise TagError("No accessible articles found")
-
-    # Update articles
+    # Update in batches of IDs that fit SQLite's bound-variable limit, one
+    # UPDATE per batch and tag, all in one transaction
+    batch_size = _id_batch_size()
+    batches = [
+        article_ids[start : start + batch_size] for start in range(0, len(article_ids), batch_size)
+    ]
     updated_count = 0
-    for article in articles:
-        if add_tag:
-            _add_article_tag(article, add_tag)
-            updated_count += 1
-        if remove_tag:
-            _remove_article_tag(article, remove_tag)
-            updated_count += 1
+    with transaction.atomic():
+        for batch in batches:
+            articles = _accessible_articles(user_id, batch)
+            if add_tag:
+                updated_count += _set_article_tag(articles, add_tag, True)
+            if remove_tag:
+                updated_count += _set_article_tag(articles, remove_tag, False)
+
+    # Nothing changed: tell "already tagged" apart from "not accessible"
+    if updated_count == 0 and not any(
+        _accessible_articles(user_id, batch).exists() for batch in batches
+    ):
+        raise TagError("No accessible articles found")
 
     if updated_count > 0:
         from core.services.greader.stream_service import invalidate_unread_cache
@@ -155,8 +162,8 @@ def mark_all_as_read(
         from_datetime = datetime.fromtimestamp(timestamp, tz=timezone.utc)
         articles = articles.filter(date__lte=from_datetime)
 
-    # Update all matching articles
-    updated_count = articles.update(read=True)
+    # Update all matching unread articles
+    updated_count = FeedCounterService.set_read(articles, read=True)
 
     if updated_count > 0:
         from core.services.greader.stream_service import invalidate_unread_cache
@@ -171,31 +178,42 @@ def mark_all_as_read(
     }
 
 
-def _add_article_tag(article: Article, tag: str) -> None:
-    """Add a tag to an article.
+def _id_batch_size() -> int:
+    """Get how many article IDs fit in one query, leaving room for other parameters."""
+    max_params = connection.features.max_query_params or 1000
+    return max(1, max_params - ID_BATCH_RESERVED_PARAMS)
+
+
+def _accessible_articles(user_id: int, article_ids: list[int]):
+    """Get the articles among article_ids the user may tag.
 
     Args:
-        article: Article instance
-        tag: Tag ID
+        user_id: Django user ID
+        article_ids: Article IDs
+
+    Returns:
+        Article queryset
     """
-    if tag == "user/-/state/com.google/read":
-        article.read = True
-        article.save(update_fields=["read"])
-    elif tag == "user/-/state/com.google/starred":
-        article.starred = True
-        article.save(update_fields=["starred"])
+    return Article.objects.filter(
+        id__in=article_ids,
+        feed__user_id__in=[user_id, None],  # User's articles or shared articles
+        feed__enabled=True,
+    )
 
 
-def _remove_article_tag(article: Article, tag: str) -> None:
-    """Remove a tag from an article.
+def _set_article_tag(articles, tag: str, value: bool) -> int:
+    """Add or remove a tag on a set of articles with a single UPDATE.
 
     Args:
-        article: Article instance
+        articles: Article queryset
         tag: Tag ID
+        value: True to add the tag, False to remove it
+
+    Returns:
+        Number of articles whose state changed
     """
     if tag == "user/-/state/com.google/read":
-        article.read = False
-        article.save(update_fields=["read"])
-    elif tag == "user/-/state/com.google/starred":
-        article.starred = False
-        article.save(update_fields=["starred"])
+        return FeedCounterService.set_read(articles, read=value)
+    if tag == "user/-/state/com.google/starred":
+        return articles.filter(starred=not value).update(starred=value)
+    return 0
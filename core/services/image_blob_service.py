@@ -0,0 +1,289 @@
+"""Service for content-addressed, deduplicated storage of article images."""
+
+import hashlib
+import logging
+import re
+from collections import Counter
+from datetime import timedelta
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import models, transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from ..models import Article, ImageBlob
+
+logger = logging.getLogger(__name__)
+
+# Storage directory of blob files, below MEDIA_ROOT
+BLOB_DIRECTORY = "article_icons/blobs"
+
+# Unreferenced blobs attached more recently than this are kept by garbage
+# collection: the article row pointing at them may not be written yet
+GARBAGE_GRACE_PERIOD = timedelta(hours=1)
+
+# Blob names in article content (images embedded by URL, see embed_image)
+CONTENT_BLOB_PATTERN = re.compile(
+    re.escape(BLOB_DIRECTORY) + r"/[0-9a-f]{2}/[0-9a-f]{64}\.[A-Za-z0-9]{1,4}"
+)
+
+
+class ImageBlobService:
+    """
+    Store article images once per distinct content.
+
+    Files are named after the SHA-256 of their bytes, so identical images
+    (subreddit icons, channel art, domain override images) share one file
+    that every article references through Article.icon. Each ImageBlob row
+    counts the articles pointing at it: attach() raises the count, replacing
+    an icon or deleting articles through FeedCounterService.delete_articles
+    lowers it.
+
+    Images embedded in article content by URL (see
+    compression.embed_image) are references as well, but only counted by
+    recount(). Counts can also drift when articles disappear another way
+    (e.g. cascade deletes of a feed), so collect_garbage() recounts
+    references from the articles table before it deletes anything.
+    """
+
+    @staticmethod
+    def file_extension(content_type: str) -> str:
+        """
+        Get the file extension for an image MIME type.
+
+        Args:
+            content_type: MIME type (e.g. 'image/jpeg')
+
+        Returns:
+            Extension without dot, at most 4 alphanumeric characters
+        """
+        extension = content_type.split("/")[-1]
+        if extension == "jpeg":
+            extension = "jpg"
+        elif "icon" in extension or "vnd.microsoft.icon" in content_type:
+            extension = "ico"
+
+        # Sanitize extension (limit length and remove weird chars)
+        extension = "".join(c for c in extension if c.isalnum())[:4]
+        return extension or "jpg"
+
+    @staticmethod
+    def store(image_bytes: bytes, content_type: str, references: int = 0) -> ImageBlob:
+        """
+        Store image bytes, reusing the blob of identical content.
+
+        Args:
+            image_bytes: Raw image data
+            content_type: MIME type
+            references: Number of references to add to the blob's count (the
+                blob is marked as recently attached either way)
+
+        Returns:
+            The ImageBlob holding the bytes
+        """
+        digest = hashlib.sha256(image_bytes).hexdigest()
+        extension = ImageBlobService.file_extension(content_type)
+        name = f"{BLOB_DIRECTORY}/{digest[:2]}/{digest}.{extension}"
+
+        with transaction.atomic():
+            blob, _ = ImageBlob.objects.get_or_create(
+                digest=digest,
+                defaults={"name": name, "content_type": content_type, "size": len(image_bytes)},
+            )
+            # Restarts the garbage collection grace period, covering a
+            # reference that is not written yet
+            ImageBlob.objects.filter(pk=digest).update(
+                ref_count=F("ref_count") + references, updated_at=timezone.now()
+            )
+
+        # Written after the row is committed: garbage collection deletes the
+        # files of collected rows after its commit, so a file missing here is
+        # rewritten
+        if not default_storage.exists(blob.name):
+            saved_name = default_storage.save(blob.name, ContentFile(image_bytes))
+            if saved_name != blob.name:
+                # Another process wrote the same bytes concurrently
+                default_storage.delete(saved_name)
+
+        return blob
+
+    @staticmethod
+    def url(blob: ImageBlob) -> str:
+        """
+        Get the absolute URL of a blob's file, for embedding in article content.
+
+        Blob files never change, the media view serves them with long cache
+        headers.
+
+        Args:
+            blob: ImageBlob instance
+
+        Returns:
+            URL below BASE_URL
+        """
+        return f"{settings.BASE_URL}{default_storage.url(blob.name)}"
+
+    @staticmethod
+    def attach(article: Article, image_bytes: bytes, content_type: str) -> ImageBlob:
+        """
+        Point an article's icon at the blob of the image and count the reference.
+
+        Releases the blob of the article's previous icon. Does not save the
+        article; the caller writes the icon field.
+
+        Args:
+            article: Article instance
+            image_bytes: Raw image data
+            content_type: MIME type
+
+        Returns:
+            The ImageBlob now referenced by the article
+        """
+        previous = article.icon.name if article.icon else None
+        digest = hashlib.sha256(image_bytes).hexdigest()
+        if previous and digest in previous:
+            # Already pointing at this content
+            return ImageBlobService.store(image_bytes, content_type)
+
+        blob = ImageBlobService.store(image_bytes, content_type, references=1)
+        if previous:
+            ImageBlobService.release([previous])
+        article.icon.name = blob.name
+        return blob
+
+    @staticmethod
+    def release(names: Iterable[Optional[str]]) -> None:
+        """
+        Drop references to blobs, one per name given.
+
+        Names that are not blob files (e.g. icons uploaded in the admin) are
+        ignored.
+
+        Args:
+            names: Storage names of the released icons
+        """
+        counts = Counter(name for name in names if name and name.startswith(BLOB_DIRECTORY))
+        for name, count in counts.items():
+            ImageBlob.objects.filter(name=name).update(ref_count=F("ref_count") - count)
+
+    @staticmethod
+    def release_articles(queryset: models.QuerySet) -> None:
+        """
+        Drop the blob references of articles about to be deleted.
+
+        Call inside the transaction that deletes them.
+
+        Args:
+            queryset: Articles that will be deleted
+        """
+        rows = (
+            queryset.filter(icon__startswith=f"{BLOB_DIRECTORY}/")
+            .order_by()
+            .values("icon")
+            .annotate(n=Count("id"))
+        )
+        for row in rows:
+            ImageBlob.objects.filter(name=row["icon"]).update(ref_count=F("ref_count") - row["n"])
+
+    @staticmethod
+    def count_embedded() -> Counter[str]:
+        """
+        Count the articles embedding each blob in their content.
+
+        Reads the content of every article that embeds a blob; call it
+        outside transactions, so writers are not held up meanwhile.
+
+        Returns:
+            Counter mapping blob name to number of articles
+        """
+        embedded: Counter[str] = Counter()
+        for content in (
+            Article.objects.filter(content__contains=f"{BLOB_DIRECTORY}/")
+            .values_list("content", flat=True)
+            .iterator()
+        ):
+            embedded.update(set(CONTENT_BLOB_PATTERN.findall(content)))
+        return embedded
+
+    @staticmethod
+    def recount(embedded: Optional[Counter[str]] = None) -> int:
+        """
+        Recompute every blob's reference count from the articles table.
+
+        Counts article icons and images embedded in article content.
+
+        Args:
+            embedded: Result of count_embedded(), counted now if not given
+
+        Returns:
+            Number of blobs whose stored count was wrong
+        """
+        actual = dict(
+            Article.objects.filter(icon__startswith=f"{BLOB_DIRECTORY}/")
+            .order_by()
+            .values("icon")
+            .annotate(n=Count("id"))
+            .values_list("icon", "n")
+        )
+        if embedded is None:
+            embedded = ImageBlobService.count_embedded()
+        for name, count in embedded.items():
+            actual[name] = actual.get(name, 0) + count
+        fixed = 0
+        for digest, name, ref_count in ImageBlob.objects.values_list(
+            "digest", "name", "ref_count"
+        ).iterator():
+            count = actual.get(name, 0)
+            if ref_count != count:
+                ImageBlob.objects.filter(pk=digest).update(ref_count=count)
+                fixed += 1
+        return fixed
+
+    @staticmethod
+    def collect_garbage(grace_period: timedelta = GARBAGE_GRACE_PERIOD) -> int:
+        """
+        Delete blobs no article references, with their files.
+
+        Reference counts are recomputed first, so a drifted count never
+        deletes a file that is still in use. Blobs attached within the grace
+        period are kept.
+
+        Args:
+            grace_period: Minimum time since a blob was last attached
+
+        Returns:
+            Number of deleted blobs
+        """
+        cutoff = timezone.now() - grace_period
+        # Scanning article content is slow, keep it out of the write lock
+        embedded = ImageBlobService.count_embedded()
+        with transaction.atomic():
+            fixed = ImageBlobService.recount(embedded)
+            if fixed:
+                logger.warning(f"Corrected {fixed} image blob reference count(s)")
+
+            unreferenced = ImageBlob.objects.filter(ref_count__lte=0, updated_at__lt=cutoff)
+            # Content written since the scan may embed a candidate
+            names = [
+                name
+                for name in unreferenced.values_list("name", flat=True)
+                if not Article.objects.filter(content__contains=name).exists()
+            ]
+            ImageBlob.objects.filter(name__in=names).delete()
+            # Files go only once the rows are gone for good: a failed commit
+            # brings the rows back, and they must still have their files
+            transaction.on_commit(lambda: ImageBlobService._delete_files(names))
+
+        logger.info(f"Deleted {len(names)} unreferenced image blob(s)")
+        return len(names)
+
+    @staticmethod
+    def _delete_files(names: Iterable[str]) -> None:
+        """Delete the files of collected blobs, unless store() created the blob again."""
+        reused = set(ImageBlob.objects.filter(name__in=names).values_list("name", flat=True))
+        for name in names:
+            if name not in reused:
+                default_storage.delete(name)
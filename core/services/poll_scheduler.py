@@ -0,0 +1,163 @@
+"""Adaptive per-feed polling schedule."""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.db.models import Q, QuerySet
+from django.utils import timezone
+
+from ..models import Feed
+
+logger = logging.getLogger(__name__)
+
+# Interval for feeds without history, the previous fixed polling interval
+DEFAULT_INTERVAL = timedelta(minutes=30)
+
+# Defaults for the AGGREGATOR_POLL_* settings (minutes)
+DEFAULT_MIN_INTERVAL_MINUTES = 10
+DEFAULT_MAX_INTERVAL_MINUTES = 12 * 60
+
+# Polls per expected new article: 2 means a feed publishing once an hour is
+# polled every 30 minutes
+POLLS_PER_ARTICLE = 2
+
+# Weight of the latest run in the smoothed new article rate
+RATE_SMOOTHING = 0.3
+
+# Interval growth per run without new articles
+QUIET_BACKOFF = 1.5
+
+# Time a queued feed is not enqueued again while its task is pending
+ENQUEUE_LEASE = timedelta(minutes=15)
+
+
+class PollScheduler:
+    """
+    Decide when each feed is polled next.
+
+    Every run records how many new articles a feed delivered. The smoothed rate
+    sets the interval to the next poll: busy feeds are polled more often, quiet
+    feeds back off by QUIET_BACKOFF per empty run, and failing feeds double
+    their interval per consecutive failure. Feeds that reached their daily
+    limit wait until the next day. AggregatorService.trigger_due only enqueues
+    feeds whose next poll is due.
+    """
+
+    @staticmethod
+    def get_min_interval() -> timedelta:
+        return timedelta(
+            minutes=getattr(settings, "AGGREGATOR_POLL_MIN_INTERVAL", DEFAULT_MIN_INTERVAL_MINUTES)
+        )
+
+    @staticmethod
+    def get_max_interval() -> timedelta:
+        return timedelta(
+            minutes=getattr(settings, "AGGREGATOR_POLL_MAX_INTERVAL", DEFAULT_MAX_INTERVAL_MINUTES)
+        )
+
+    @staticmethod
+    def due_feeds(now: Optional[datetime] = None) -> QuerySet[Feed]:
+        """Enabled feeds whose next poll is due (or that were never scheduled)."""
+        now = now or timezone.now()
+        return Feed.objects.filter(enabled=True).filter(
+            Q(next_poll_at__isnull=True) | Q(next_poll_at__lte=now)
+        )
+
+    @staticmethod
+    def lease(feed: Feed, now: Optional[datetime] = None) -> None:
+        """Push the next poll back while the feed's task waits in the queue."""
+        now = now or timezone.now()
+        feed.next_poll_at = now + ENQUEUE_LEASE
+        Feed.objects.filter(pk=feed.pk).update(next_poll_at=feed.next_poll_at)
+
+    @staticmethod
+    def compute_interval(
+        feed: Feed, new_articles: int, success: bool, previous: Optional[timedelta] = None
+    ) -> timedelta:
+        """
+        Calculate the interval to the next poll.
+
+        Args:
+            feed: Feed with its updated rate and failure count
+            new_articles: New articles stored by the run
+            success: Whether the run succeeded
+            previous: Interval of the last successful run (None if the feed has no history)
+
+        Returns:
+            Interval, clamped to the configured minimum and maximum
+        """
+        min_interval = PollScheduler.get_min_interval()
+        max_interval = PollScheduler.get_max_interval()
+        previous = previous or DEFAULT_INTERVAL
+
+        if not success:
+            interval = previous * 2 ** min(feed.consecutive_failures, 10)
+        else:
+            if feed.new_article_rate > 0:
+                interval = timedelta(hours=1 / (feed.new_article_rate * POLLS_PER_ARTICLE))
+            else:
+                interval = previous
+            if new_articles == 0:
+                interval = max(interval, previous * QUIET_BACKOFF)
+
+        return max(min_interval, min(interval, max_interval))
+
+    @staticmethod
+    def record_run(
+        feed: Feed,
+        new_articles: int,
+        success: bool = True,
+        daily_limit_reached: bool = False,
+    ) -> None:
+        """
+        Update the feed's publish statistics and schedule its next poll.
+
+        Args:
+            feed: Polled feed
+            new_articles: New articles stored by the run
+            success: Whether the run succeeded
+            daily_limit_reached: Whether the feed cannot collect more today
+        """
+        now = timezone.now()
+
+        if success:
+            # The first run only sees the feed's backlog, which says nothing about its rate
+            if feed.last_polled_at:
+                hours = max((now - feed.last_polled_at).total_seconds() / 3600, 1 / 60)
+                observed = new_articles / hours
+                feed.new_article_rate = (
+                    RATE_SMOOTHING * observed + (1 - RATE_SMOOTHING) * feed.new_article_rate
+                )
+            if new_articles:
+                feed.last_new_article_at = now
+            feed.consecutive_failures = 0
+            feed.last_polled_at = now
+        else:
+            feed.consecutive_failures += 1
+
+        previous = timedelta(seconds=feed.poll_interval) if feed.poll_interval else None
+        interval = PollScheduler.compute_interval(feed, new_articles, success, previous)
+        next_poll_at = now + interval
+
+        if success and daily_limit_reached:
+            tomorrow = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+            next_poll_at = max(next_poll_at, tomorrow)
+
+        if success:
+            # Failure backoff is derived from the failure count, not stored
+            feed.poll_interval = int(interval.total_seconds())
+        feed.next_poll_at = next_poll_at
+        Feed.objects.filter(pk=feed.pk).update(
+            new_article_rate=feed.new_article_rate,
+            last_new_article_at=feed.last_new_article_at,
+            last_polled_at=feed.last_polled_at,
+            consecutive_failures=feed.consecutive_failures,
+            poll_interval=feed.poll_interval,
+            next_poll_at=feed.next_poll_at,
+        )
+        logger.info(
+            f"Feed {feed.id} ({feed.name}): {new_articles} new, "
+            f"rate {feed.new_article_rate:.2f}/h, next poll in {interval} at {next_poll_at}"
+        )
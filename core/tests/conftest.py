@@ -3,6 +3,7 @@
 from datetime import timedelta
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.utils import timezone
 
 import pytest
@@ -10,6 +11,32 @@ import pytest
 from core.models import Article, Feed, FeedGroup, UserSettings
 
 
+@pytest.fixture(autouse=True)
+def isolated_caches(settings, tmp_path):
+    """Use a fresh LocMemCache (not the default file cache), token and image cache per test.
+
+    Media files go to a temporary directory. Images are processed inline,
+    tests that need the worker pool enable it.
+    """
+    from core.services.greader.auth_service import clear_token_cache
+
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    }
+    settings.AGGREGATOR_IMAGE_CACHE_DIR = str(tmp_path / "image-cache")
+    settings.AGGREGATOR_IMAGE_WORKERS = 0
+    settings.MEDIA_ROOT = tmp_path / "media"
+    cache.clear()
+    clear_token_cache()
+
+
+@pytest.fixture
+def public_base_url(settings):
+    """Set a public BASE_URL, images are only stored as files below one."""
+    settings.BASE_URL = "https://yana.example.com"
+    return settings.BASE_URL
+
+
 @pytest.fixture
 def user(db):
     return User.objects.create_user(
@@ -218,3 +218,65 @@ class TestAggregatorService:
         assert mock_trigger.called
         assert results[0]["success"] is True
         assert results[0]["articles_count"] == 3
+
+
+@pytest.mark.django_db
+class TestBulkArticlePersistence:
+    def _articles(self, count, **extra):
+        return [
+            {
+                "name": f"Article {i}",
+                "identifier": f"https://example.com/{i}",
+                "raw_content": "raw",
+                "content": "clean",
+                **extra,
+            }
+            for i in range(count)
+        ]
+
+    def test_query_count_does_not_grow_with_articles(self, rss_feed, django_assert_max_num_queries):
+        with django_assert_max_num_queries(6):
+            created, updated = AggregatorService._save_articles(
+                rss_feed, self._articles(25), force_update=False
+            )
+
+        assert (created, updated) == (25, 0)
+        assert Article.objects.filter(feed=rss_feed).count() == 25
+
+    def test_force_update_only_writes_changed_rows(self, rss_feed):
+        AggregatorService._save_articles(rss_feed, self._articles(3), force_update=False)
+        articles = self._articles(3)
+        articles[1]["content"] = "changed"
+
+        created, updated = AggregatorService._save_articles(rss_feed, articles, force_update=True)
+
+        assert (created, updated) == (0, 1)
+        assert Article.objects.get(identifier="https://example.com/1").content == "changed"
+
+    def test_duplicate_identifiers_create_one_article(self, rss_feed):
+        articles = self._articles(1) + self._articles(1)
+
+        created, _ = AggregatorService._save_articles(rss_feed, articles, force_update=False)
+
+        assert created == 1
+        assert Article.objects.filter(feed=rss_feed).count() == 1
+
+    @patch("core.services.aggregator_service.HeaderElementFileHandler.save_image_to_article")
+    def test_header_images_are_saved_after_commit(self, mock_save_img, rss_feed):
+        header_data = MagicMock(image_bytes=b"image", content_type="image/jpeg")
+
+        def save_image(article, image_bytes, content_type, save=True):
+            # The row is already committed when the file is written
+            assert Article.objects.filter(pk=article.pk).exists()
+            assert save is False
+            article.icon.name = "article_icons/test.jpg"
+            return True
+
+        mock_save_img.side_effect = save_image
+
+        AggregatorService._save_articles(
+            rss_feed, self._articles(2, header_data=header_data), force_update=False
+        )
+
+        assert mock_save_img.call_count == 2
+        assert set(Article.objects.values_list("icon", flat=True)) == {"article_icons/test.jpg"}
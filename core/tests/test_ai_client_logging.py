@@ -37,7 +37,7 @@ class TestCoreLoggerConfig:
 
 
 class TestAIClientLogLevels:
-    @patch("core.ai_client.requests.post")
+    @patch("core.http_client.post")
     def test_gemini_request_error_logs_warning_not_error(self, mock_post):
         """Request errors should log at WARNING, not ERROR."""
         response = MagicMock(spec=requests.Response)
@@ -58,7 +58,7 @@ def _make_success_response(body):
 
 
 class TestGeminiRetryOn429:
-    @patch("core.ai_client.requests.post")
+    @patch("core.http_client.post")
     def test_retries_on_429_then_succeeds(self, mock_post):
         """Gemini 429 should be retried and succeed on subsequent attempt."""
         settings = _make_settings(provider="gemini", max_retries=3, retry_delay=0)
@@ -75,7 +75,7 @@ class TestGeminiRetryOn429:
         assert result == "hello"
         assert mock_post.call_count == 2
 
-    @patch("core.ai_client.requests.post")
+    @patch("core.http_client.post")
     def test_returns_none_after_max_retries_exhausted(self, mock_post):
         """Should return None after exhausting all retries on persistent 429."""
         settings = _make_settings(provider="gemini", max_retries=3, retry_delay=0)
@@ -94,7 +94,7 @@ class TestGeminiRetryOn429:
         # 1 initial + 3 retries = 4
         assert mock_post.call_count == 4
 
-    @patch("core.ai_client.requests.post")
+    @patch("core.http_client.post")
     def test_no_retry_on_non_429_error(self, mock_post):
         """Non-429 errors should NOT be retried."""
         settings = _make_settings(provider="gemini", max_retries=3, retry_delay=0)
@@ -114,7 +114,7 @@ class TestGeminiRetryOn429:
         assert mock_post.call_count == 1
 
     @patch("core.ai_client.time.sleep")
-    @patch("core.ai_client.requests.post")
+    @patch("core.http_client.post")
     def test_backoff_delay_increases(self, mock_post, mock_sleep):
         """Retry delay should increase exponentially."""
         settings = _make_settings(provider="gemini", max_retries=3, retry_delay=2)
@@ -135,7 +135,7 @@ class TestGeminiRetryOn429:
         mock_sleep.assert_any_call(2)
         mock_sleep.assert_any_call(4)
 
-    @patch("core.ai_client.requests.post")
+    @patch("core.http_client.post")
     def test_zero_retries_means_no_retry(self, mock_post):
         """With max_retries=0, no retry should be attempted."""
         settings = _make_settings(provider="gemini", max_retries=0, retry_delay=0)
@@ -150,7 +150,7 @@ class TestGeminiRetryOn429:
 
     @patch("core.ai_client.time.monotonic")
     @patch("core.ai_client.time.sleep")
-    @patch("core.ai_client.requests.post")
+    @patch("core.http_client.post")
     def test_stops_retrying_when_time_budget_exceeded(self, mock_post, mock_sleep, mock_mono):
         """Should stop retrying if next sleep would exceed max_retry_time."""
         settings = _make_settings(
@@ -175,7 +175,7 @@ class TestGeminiRetryOn429:
 
 
 class TestOpenAIRetryOn429:
-    @patch("core.ai_client.requests.post")
+    @patch("core.http_client.post")
     def test_retries_on_429_then_succeeds(self, mock_post):
         """OpenAI 429 should be retried and succeed on subsequent attempt."""
         settings = _make_settings(provider="openai", max_retries=3, retry_delay=0)
@@ -194,7 +194,7 @@ class TestOpenAIRetryOn429:
 
 
 class TestAnthropicRetryOn429:
-    @patch("core.ai_client.requests.post")
+    @patch("core.http_client.post")
     def test_retries_on_429_then_succeeds(self, mock_post):
         """Anthropic 429 should be retried and succeed on subsequent attempt."""
         settings = _make_settings(provider="anthropic", max_retries=3, retry_delay=0)
@@ -33,8 +33,8 @@ def test_ai_response_with_fluff_and_payload_check():
     feed = Feed.objects.create(name="Test Feed", user=user, options={"ai_summarize": True})
     aggregator = TestAggregator(feed)
 
-    # We mock requests.post to check the payload sent by AIClient
-    with patch("core.ai_client.requests.post") as mock_post:
+    # We mock http_client.post to check the payload sent by AIClient
+    with patch("core.http_client.post") as mock_post:
         # Setup successful response
         mock_response = MagicMock()
         # Mocking the Gemini response structure
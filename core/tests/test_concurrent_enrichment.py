@@ -0,0 +1,161 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from core.aggregators.exceptions import ArticleSkipError
+from core.aggregators.heise.aggregator import HeiseAggregator
+from core.aggregators.rss import RssAggregator
+from core.aggregators.website import FullWebsiteAggregator
+from core.models import Feed
+
+
+def make_articles(count, host="example.com"):
+    return [
+        {"name": f"Article {i}", "identifier": f"https://{host}/{i}", "content": "summary"}
+        for i in range(count)
+    ]
+
+
+class ConcurrencyProbe:
+    """Records how many enrich calls run at the same time."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, article):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return article
+
+
+@pytest.mark.django_db
+class TestEnrichEach:
+    def test_serial_by_default(self):
+        feed = Feed.objects.create(name="Site", aggregator="full_website")
+        aggregator = FullWebsiteAggregator(feed)
+        probe = ConcurrencyProbe(delay=0)
+
+        result = aggregator.enrich_each(make_articles(5), probe)
+
+        assert aggregator.get_enrichment_workers() == 1
+        assert [a["identifier"] for a in result] == [f"https://example.com/{i}" for i in range(5)]
+        assert probe.peak == 1
+
+    def test_option_ignored_without_support(self):
+        feed = Feed.objects.create(
+            name="RSS", aggregator="feed_content", options={"concurrent_enrichment": True}
+        )
+
+        assert RssAggregator(feed).get_enrichment_workers() == 1
+
+    def test_concurrent_keeps_order_and_skips(self):
+        feed = Feed.objects.create(
+            name="Site",
+            aggregator="full_website",
+            options={"concurrent_enrichment": True, "enrichment_workers": 4},
+        )
+        aggregator = FullWebsiteAggregator(feed)
+
+        def enrich(article):
+            index = int(article["identifier"].rsplit("/", 1)[1])
+            # Finish out of order
+            time.sleep(0.01 * (6 - index))
+            return None if index == 2 else article
+
+        result = aggregator.enrich_each(make_articles(6), enrich)
+
+        assert [a["identifier"] for a in result] == [
+            f"https://example.com/{i}" for i in (0, 1, 3, 4, 5)
+        ]
+
+    def test_per_host_cap(self):
+        feed = Feed.objects.create(
+            name="Site",
+            aggregator="full_website",
+            options={
+                "concurrent_enrichment": True,
+                "enrichment_workers": 8,
+                "enrichment_per_host": 2,
+            },
+        )
+        aggregator = FullWebsiteAggregator(feed)
+        probe = ConcurrencyProbe()
+
+        aggregator.enrich_each(make_articles(6), probe)
+
+        assert probe.peak == 2
+
+    def test_hosts_run_in_parallel(self):
+        feed = Feed.objects.create(
+            name="Site",
+            aggregator="full_website",
+            options={
+                "concurrent_enrichment": True,
+                "enrichment_workers": 8,
+                "enrichment_per_host": 1,
+            },
+        )
+        aggregator = FullWebsiteAggregator(feed)
+        probe = ConcurrencyProbe()
+
+        aggregator.enrich_each(make_articles(2, "a.com") + make_articles(2, "b.com"), probe)
+
+        assert probe.peak == 2
+
+
+@pytest.mark.django_db
+class TestConcurrentFullWebsiteEnrichment:
+    def test_skip_and_fallback_semantics_match_serial(self):
+        feed = Feed.objects.create(
+            name="Site",
+            aggregator="full_website",
+            options={"concurrent_enrichment": True, "enrichment_workers": 4},
+        )
+        aggregator = FullWebsiteAggregator(feed)
+
+        def fetch(url, timeout=30):
+            if url.endswith("/1"):
+                raise ArticleSkipError("gone", status_code=404)
+            if url.endswith("/2"):
+                raise RuntimeError("boom")
+            return f"<html><body><article><p>Body {url}</p></article></body></html>"
+
+        with (
+            patch.object(aggregator, "extract_header_element", return_value=None),
+            patch("core.aggregators.website.fetch_html", side_effect=fetch),
+        ):
+            result = aggregator.enrich_articles(make_articles(4))
+
+        assert [a["identifier"] for a in result] == [
+            "https://example.com/0",
+            "https://example.com/2",
+            "https://example.com/3",
+        ]
+        assert "Body https://example.com/0" in result[0]["content"]
+        # Generic failures keep the RSS summary
+        assert result[1]["content"] == "summary"
+
+    def test_page_cache_fits_all_workers(self):
+        feed = Feed.objects.create(
+            name="Site",
+            aggregator="full_website",
+            options={"concurrent_enrichment": True, "enrichment_workers": 12},
+        )
+
+        assert FullWebsiteAggregator(feed).page_cache._max_entries == 12
+
+    def test_heise_exposes_enrichment_fields(self):
+        fields = HeiseAggregator.get_all_configuration_fields()
+
+        assert "include_comments" in fields
+        assert {"concurrent_enrichment", "enrichment_workers", "enrichment_per_host"} <= set(fields)
+        assert "concurrent_enrichment" not in RssAggregator.get_all_configuration_fields()
@@ -0,0 +1,178 @@
+import hashlib
+from unittest.mock import MagicMock, patch
+
+from django.utils import timezone
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from core.aggregators.rss import RssAggregator
+from core.aggregators.utils.rss_parser import parse_rss_feed
+from core.models import Feed
+from core.services.aggregator_service import AggregatorService
+
+FEED_URL = "https://example.com/rss"
+
+RSS_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0"><channel><title>Example</title>
+<item><title>Item 0</title><link>https://example.com/0</link></item>
+<item><title>Item 1</title><link>https://example.com/1</link></item>
+</channel></rss>"""
+
+RSS_HASH = hashlib.sha256(RSS_XML).hexdigest()
+
+
+def make_response(status_code=200, content=RSS_XML, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = content
+    response.url = FEED_URL
+    response.headers = CaseInsensitiveDict(
+        {"Content-Type": "application/rss+xml", **(headers or {})}
+    )
+    return response
+
+
+@pytest.fixture
+def feed_content_feed(user):
+    return Feed.objects.create(
+        name="Feed Content",
+        aggregator="feed_content",
+        identifier=FEED_URL,
+        user=user,
+    )
+
+
+def _midday():
+    return timezone.now().replace(hour=12, minute=0, second=0, microsecond=0)
+
+
+class TestParseRssFeed:
+    @patch("core.http_client.get")
+    def test_returns_validators(self, mock_get):
+        mock_get.return_value = make_response(
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 14 Oct 2026 08:00:00 GMT"}
+        )
+
+        result = parse_rss_feed(FEED_URL)
+
+        assert result["not_modified"] is False
+        assert [e["title"] for e in result["entries"]] == ["Item 0", "Item 1"]
+        assert result["etag"] == '"v1"'
+        assert result["modified"] == "Wed, 14 Oct 2026 08:00:00 GMT"
+        assert result["content_hash"] == RSS_HASH
+        assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+
+    @patch("core.http_client.get")
+    def test_sends_validators(self, mock_get):
+        mock_get.return_value = make_response(status_code=304)
+
+        result = parse_rss_feed(FEED_URL, etag='"v1"', modified="Wed, 14 Oct 2026 08:00:00 GMT")
+
+        headers = mock_get.call_args.kwargs["headers"]
+        assert headers["If-None-Match"] == '"v1"'
+        assert headers["If-Modified-Since"] == "Wed, 14 Oct 2026 08:00:00 GMT"
+        assert result["not_modified"] is True
+        assert result["entries"] == []
+        assert result["etag"] == '"v1"'
+
+    @patch("core.aggregators.utils.rss_parser.feedparser.parse")
+    @patch("core.http_client.get")
+    def test_identical_hash_is_not_parsed(self, mock_get, mock_parse):
+        mock_get.return_value = make_response()
+
+        result = parse_rss_feed(FEED_URL, previous_hash=RSS_HASH)
+
+        assert result["not_modified"] is True
+        mock_parse.assert_not_called()
+
+    @patch("core.http_client.get")
+    def test_http_error_raises_value_error(self, mock_get):
+        mock_get.side_effect = requests.ConnectionError("down")
+
+        with pytest.raises(ValueError, match="Feed fetch error"):
+            parse_rss_feed(FEED_URL)
+
+
+@pytest.mark.django_db
+class TestConditionalAggregation:
+    def test_not_modified_short_circuits_run(self, feed_content_feed):
+        aggregator = RssAggregator(feed_content_feed)
+
+        with (
+            patch(
+                "core.aggregators.rss.parse_rss_feed",
+                return_value={"entries": [], "not_modified": True},
+            ),
+            patch.object(aggregator, "parse_to_raw_articles") as mock_parse,
+        ):
+            articles = aggregator.aggregate()
+
+        assert articles == []
+        mock_parse.assert_not_called()
+
+    @patch("core.http_client.get")
+    def test_validators_stored_after_run_and_sent_next_time(self, mock_get, feed_content_feed):
+        mock_get.return_value = make_response(headers={"ETag": '"v1"'})
+
+        with patch("django.utils.timezone.now", return_value=_midday()):
+            result = AggregatorService.trigger_by_feed_id(feed_content_feed.id)
+
+        assert result["articles_count"] == 2
+        feed_content_feed.refresh_from_db()
+        assert feed_content_feed.fetch_etag == '"v1"'
+        assert feed_content_feed.fetch_content_hash == RSS_HASH
+
+        mock_get.return_value = make_response(status_code=304)
+        with patch("django.utils.timezone.now", return_value=_midday()):
+            result = AggregatorService.trigger_by_feed_id(feed_content_feed.id)
+
+        assert result["success"] is True
+        assert result["articles_count"] == 0
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    @patch("core.http_client.get")
+    def test_force_update_ignores_validators(self, mock_get, feed_content_feed):
+        Feed.objects.filter(pk=feed_content_feed.pk).update(
+            fetch_etag='"v1"', fetch_content_hash=RSS_HASH
+        )
+        mock_get.return_value = make_response()
+
+        with patch("django.utils.timezone.now", return_value=_midday()):
+            result = AggregatorService.trigger_by_feed_id(feed_content_feed.id, force_update=True)
+
+        assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+        assert result["articles_count"] == 2
+
+    @patch("core.http_client.get")
+    def test_feed_longer_than_run_limit_is_skipped_when_unchanged(
+        self, mock_get, feed_content_feed
+    ):
+        # Run limit at midday: 2 articles
+        feed_content_feed.daily_limit = 4
+        feed_content_feed.save()
+        items = "".join(
+            f"<item><title>Item {i}</title><link>https://example.com/{i}</link></item>"
+            for i in range(5)
+        )
+        rss = f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'.encode()
+        mock_get.return_value = make_response(content=rss)
+
+        with patch("django.utils.timezone.now", return_value=_midday()):
+            result = AggregatorService.trigger_by_feed_id(feed_content_feed.id)
+
+        assert result["articles_count"] == 2
+        feed_content_feed.refresh_from_db()
+        assert feed_content_feed.fetch_content_hash == hashlib.sha256(rss).hexdigest()
+
+        with (
+            patch("django.utils.timezone.now", return_value=_midday()),
+            patch("core.aggregators.rss.RssAggregator.parse_to_raw_articles") as mock_parse,
+        ):
+            result = AggregatorService.trigger_by_feed_id(feed_content_feed.id)
+
+        assert result["success"] is True
+        assert result["articles_count"] == 0
+        assert mock_get.call_count == 2
+        mock_parse.assert_not_called()
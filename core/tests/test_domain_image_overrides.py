@@ -109,7 +109,7 @@ class TestHeaderElementExtractorOverride:
 
     def test_override_short_circuits_strategies(self):
         fake_image = {"imageData": b"x" * 200, "contentType": "image/svg+xml"}
-        encoded = {"dataUri": "data:image/svg+xml;base64,FAKE"}
+        encoded = {"src": "data:image/svg+xml;base64,FAKE"}
 
         extractor = HeaderElementExtractor()
         with (
@@ -127,7 +127,7 @@ class TestHeaderElementExtractorOverride:
 
         assert result is not None
         assert result.image_url == NINTENDO_OVERRIDE_IMAGE
-        assert result.base64_data_uri == "data:image/svg+xml;base64,FAKE"
+        assert result.image_src == "data:image/svg+xml;base64,FAKE"
         assert result.content_type == "image/svg+xml"
         mock_fetch.assert_called_once_with(NINTENDO_OVERRIDE_IMAGE)
         mock_encode.assert_called_once()
@@ -0,0 +1,121 @@
+from unittest.mock import patch
+
+from django.utils import timezone
+
+import pytest
+
+from core.aggregators.rss import RssAggregator
+from core.models import Article, Feed
+from core.services.aggregator_service import AggregatorService
+
+
+def _entries(count):
+    return {
+        "entries": [
+            {
+                "title": f"Item {i}",
+                "link": f"https://example.com/{i}",
+                "summary": "summary",
+                "published": None,
+            }
+            for i in range(count)
+        ]
+    }
+
+
+@pytest.mark.django_db
+class TestRemoveExistingArticles:
+    def test_drops_known_identifiers(self, rss_feed):
+        Article.objects.create(
+            feed=rss_feed, identifier="https://example.com/1", name="Known", content=""
+        )
+        aggregator = RssAggregator(rss_feed)
+        articles = [
+            {"identifier": "https://example.com/0", "name": "New"},
+            {"identifier": "https://example.com/1", "name": "Known"},
+        ]
+
+        result = aggregator.remove_existing_articles(articles)
+
+        assert [a["identifier"] for a in result] == ["https://example.com/0"]
+        assert aggregator.skipped_existing_count == 1
+
+    def test_ignores_other_feeds(self, rss_feed, user):
+        other_feed = Feed.objects.create(
+            name="Other", aggregator="rss", identifier="https://other.com/rss", user=user
+        )
+        Article.objects.create(
+            feed=other_feed, identifier="https://example.com/1", name="Other", content=""
+        )
+        aggregator = RssAggregator(rss_feed)
+
+        result = aggregator.remove_existing_articles([{"identifier": "https://example.com/1"}])
+
+        assert len(result) == 1
+        assert aggregator.skipped_existing_count == 0
+
+    def test_disabled_keeps_everything(self, rss_feed):
+        Article.objects.create(
+            feed=rss_feed, identifier="https://example.com/1", name="Known", content=""
+        )
+        aggregator = RssAggregator(rss_feed)
+        aggregator.skip_existing = False
+
+        result = aggregator.remove_existing_articles([{"identifier": "https://example.com/1"}])
+
+        assert len(result) == 1
+
+    def test_known_articles_are_not_enriched(self, rss_feed):
+        Article.objects.create(
+            feed=rss_feed, identifier="https://example.com/0", name="Known", content=""
+        )
+        aggregator = RssAggregator(rss_feed)
+        midday = timezone.now().replace(hour=12, minute=0, second=0, microsecond=0)
+
+        with (
+            patch("django.utils.timezone.now", return_value=midday),
+            patch("core.aggregators.rss.parse_rss_feed", return_value=_entries(3)),
+            patch.object(aggregator, "enrich_articles", side_effect=lambda a: a) as mock_enrich,
+        ):
+            articles = aggregator.aggregate()
+
+        enriched = mock_enrich.call_args[0][0]
+        assert "https://example.com/0" not in [a["identifier"] for a in enriched]
+        assert len(articles) == 2
+
+
+@pytest.fixture
+def feed_content_feed(user):
+    return Feed.objects.create(
+        name="Feed Content",
+        aggregator="feed_content",
+        identifier="https://example.com/rss",
+        user=user,
+    )
+
+
+@pytest.mark.django_db
+class TestAggregatorServiceSkipCounter:
+    def test_result_reports_skipped_existing(self, feed_content_feed):
+        Article.objects.create(
+            feed=feed_content_feed, identifier="https://example.com/0", name="Known", content=""
+        )
+
+        with patch("core.aggregators.rss.parse_rss_feed", return_value=_entries(2)):
+            result = AggregatorService.trigger_by_feed_id(feed_content_feed.id)
+
+        assert result["success"] is True
+        assert result["skipped_existing"] == 1
+        assert result["articles_count"] == 1
+
+    def test_force_update_does_not_skip(self, feed_content_feed):
+        Article.objects.create(
+            feed=feed_content_feed, identifier="https://example.com/0", name="Known", content=""
+        )
+
+        with patch("core.aggregators.rss.parse_rss_feed", return_value=_entries(1)):
+            result = AggregatorService.trigger_by_feed_id(feed_content_feed.id, force_update=True)
+
+        assert result["success"] is True
+        assert result["skipped_existing"] == 0
+        assert Article.objects.get(feed=feed_content_feed).name == "Item 0"
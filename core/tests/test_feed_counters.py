@@ -0,0 +1,166 @@
+"""Tests for the denormalised per-feed article counters."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.utils import timezone
+
+import pytest
+
+from core.models import Article, Feed, FeedCounter
+from core.services import AggregatorService, ArticleService, FeedCounterService
+from core.services.greader.stream_service import _compute_unread_count
+from core.services.greader.tag_service import edit_tags, mark_all_as_read
+
+
+def _counts(feed):
+    counter = FeedCounter.objects.get(feed=feed)
+    return counter.unread_count, counter.total_count
+
+
+@pytest.mark.django_db
+class TestFeedCounterService:
+    def test_counters_are_computed_on_first_read(self, rss_feed, articles_batch):
+        assert not FeedCounter.objects.exists()
+
+        counter = FeedCounterService.get_counters([rss_feed.id])[rss_feed.id]
+
+        assert (counter.unread_count, counter.total_count) == (50, 50)
+        assert counter.newest_date == articles_batch[0].date
+
+    def test_feed_without_articles_gets_zero_counter(self, rss_feed):
+        counter = FeedCounterService.get_counters([rss_feed.id])[rss_feed.id]
+
+        assert (counter.unread_count, counter.total_count, counter.newest_date) == (0, 0, None)
+
+    def test_saved_articles_are_counted(self, rss_feed, article):
+        FeedCounterService.get_counters([rss_feed.id])
+        data = [
+            {"identifier": f"https://example.com/new/{i}", "name": "New", "content": "c"}
+            for i in range(3)
+        ]
+
+        AggregatorService._save_articles(rss_feed, data, force_update=False)
+
+        assert _counts(rss_feed) == (4, 4)
+        newest = Article.objects.filter(feed=rss_feed).order_by("-date").first().date
+        assert FeedCounter.objects.get(feed=rss_feed).newest_date == newest
+
+    def test_edit_tag_updates_unread_count(self, user, rss_feed, articles_batch):
+        FeedCounterService.get_counters([rss_feed.id])
+        ids = [a.id for a in articles_batch[:5]]
+
+        edit_tags(user.id, ids, add_tag="user/-/state/com.google/read")
+        # Marking read twice must not count twice
+        edit_tags(user.id, ids, add_tag="user/-/state/com.google/read")
+        assert _counts(rss_feed) == (45, 50)
+
+        edit_tags(user.id, ids[:2], remove_tag="user/-/state/com.google/read")
+        assert _counts(rss_feed) == (47, 50)
+
+    def test_mark_all_as_read_updates_unread_count(self, user, rss_feed, articles_batch):
+        FeedCounterService.get_counters([rss_feed.id])
+        Article.objects.filter(pk=articles_batch[0].pk).update(read=True)
+        FeedCounterService.refresh([rss_feed.id])
+
+        result = mark_all_as_read(user.id, f"feed/{rss_feed.id}")
+
+        assert result["updated"] == 49
+        assert _counts(rss_feed) == (0, 50)
+
+    def test_cleanup_updates_counters(self, rss_feed, articles_batch):
+        old = articles_batch[0]
+        Article.objects.filter(pk=old.pk).update(date=timezone.now() - timedelta(days=365))
+        FeedCounterService.refresh([rss_feed.id])
+
+        deleted = ArticleService.delete_old_articles(months=2)
+
+        assert deleted == 1
+        assert _counts(rss_feed) == (49, 50 - 1)
+        assert FeedCounter.objects.get(feed=rss_feed).newest_date == articles_batch[1].date
+
+    def test_single_article_saves_update_counters(self, rss_feed, article):
+        FeedCounterService.get_counters([rss_feed.id])
+
+        article.read = True
+        article.save()
+        assert _counts(rss_feed) == (0, 1)
+
+        # Saving again without a change must not count twice
+        article.save()
+        assert _counts(rss_feed) == (0, 1)
+
+        Article.objects.create(
+            name="Created", identifier="https://example.com/created", feed=rss_feed
+        )
+        assert _counts(rss_feed) == (1, 2)
+
+    def test_moving_an_article_updates_both_feeds(self, user, rss_feed, articles_batch):
+        other = Feed.objects.create(
+            name="Other", aggregator="rss", identifier="https://example.com/other", user=user
+        )
+        FeedCounterService.get_counters([rss_feed.id, other.id])
+
+        moved = Article.objects.get(pk=articles_batch[0].pk)
+        moved.feed = other
+        moved.save()
+
+        assert _counts(rss_feed) == (49, 49)
+        assert _counts(other) == (1, 1)
+
+    def test_single_article_delete_updates_counters(self, rss_feed, articles_batch):
+        FeedCounterService.get_counters([rss_feed.id])
+
+        Article.objects.get(pk=articles_batch[0].pk).delete()
+
+        assert _counts(rss_feed) == (49, 49)
+        assert FeedCounter.objects.get(feed=rss_feed).newest_date == articles_batch[1].date
+
+    def test_unread_count_reads_counters(self, user, rss_feed, articles_batch):
+        FeedCounter.objects.create(feed=rss_feed, unread_count=7, total_count=50)
+
+        result = _compute_unread_count(user.id, include_all=False)
+
+        assert result["unreadcounts"][0]["count"] == 7
+
+
+@pytest.mark.django_db(transaction=True)
+class TestRefreshTransaction:
+    def test_articles_counted_during_refresh_cannot_commit_in_between(self, rss_feed, article):
+        FeedCounterService.refresh([rss_feed.id])
+        compute = FeedCounterService.compute
+        in_transaction = []
+
+        def compute_then_count_new_article(feed_ids=None):
+            counts = compute(feed_ids)
+            # An aggregation run counting an article after the computation:
+            # it must not commit before the upsert, another connection waits
+            # for the write lock of the open IMMEDIATE transaction
+            in_transaction.append(connection.in_atomic_block)
+            FeedCounterService.record_created(
+                [Article(feed_id=rss_feed.id, read=False, date=timezone.now())]
+            )
+            return counts
+
+        with patch.object(FeedCounterService, "compute", compute_then_count_new_article):
+            FeedCounterService.refresh([rss_feed.id])
+
+        assert in_transaction == [True]
+
+
+@pytest.mark.django_db
+class TestRebuildFeedCountersCommand:
+    def test_verify_reports_drift_and_rebuild_fixes_it(self, rss_feed, articles_batch):
+        FeedCounterService.get_counters([rss_feed.id])
+        # Queryset updates bypass Article.save and the service
+        Article.objects.filter(feed=rss_feed).update(read=True)
+
+        with pytest.raises(CommandError):
+            call_command("rebuild_feed_counters", "--verify")
+
+        call_command("rebuild_feed_counters")
+
+        assert _counts(rss_feed) == (0, 50)
+        call_command("rebuild_feed_counters", "--verify")
@@ -0,0 +1,56 @@
+from django.core.cache import cache
+
+from core.models import Article
+from core.services import FeedCounterService
+from core.services.greader.cache import bump_version, get_version, make_key
+from core.services.greader.stream_service import get_unread_count, invalidate_unread_cache
+
+
+class TestGReaderCacheKeys:
+    def test_key_is_stable_until_bumped(self):
+        assert make_key("unread", 1, True) == make_key("unread", 1, True)
+
+    def test_bump_user_only_changes_that_user(self):
+        key_1 = make_key("unread", 1, True)
+        key_2 = make_key("unread", 2, True)
+
+        bump_version("unread", 1)
+
+        assert make_key("unread", 1, True) != key_1
+        assert make_key("unread", 2, True) == key_2
+
+    def test_bump_all_changes_every_user(self):
+        key_1 = make_key("unread", 1, True)
+        key_2 = make_key("unread", 2, True)
+
+        bump_version("unread")
+
+        assert make_key("unread", 1, True) != key_1
+        assert make_key("unread", 2, True) != key_2
+
+    def test_evicted_version_does_not_reuse_old_keys(self):
+        version = get_version("unread", 1)
+        cache.delete("greader:unread:version:1")
+
+        assert get_version("unread", 1) != version
+
+    def test_bump_does_not_clear_other_entries(self):
+        cache.set("unrelated", "value")
+
+        bump_version("unread")
+
+        assert cache.get("unrelated") == "value"
+
+
+class TestUnreadCountCache:
+    def test_invalidate_recomputes(self, user, rss_feed, article):
+        first = get_unread_count(user.id)
+        assert first["unreadcounts"][0]["count"] == 1
+        FeedCounterService.set_read(Article.objects.filter(pk=article.pk), read=True)
+
+        # Still served from cache
+        assert get_unread_count(user.id) == first
+
+        invalidate_unread_cache(user.id)
+        counts = {c["id"]: c["count"] for c in get_unread_count(user.id, True)["unreadcounts"]}
+        assert counts[f"feed/{rss_feed.id}"] == 0
@@ -0,0 +1,38 @@
+"""Tests for the GReader JSON encoder selection."""
+
+import json
+from decimal import Decimal
+
+import pytest
+
+from core.views.greader.json_encoder import GReaderJsonResponse, get_dumps, get_encoder_name
+
+PAYLOAD = {
+    "title": "Überschrift – „Zitat“ 🚀",
+    "count": 3,
+    "ratio": Decimal("1.5"),
+    "items": [{"id": "1", "read": True}, {"id": "2", "read": False}],
+}
+
+
+class TestJsonEncoder:
+    @pytest.mark.parametrize("encoder", ["orjson", "json"])
+    def test_encoders_produce_equal_json(self, encoder):
+        encoded = get_dumps(encoder)(PAYLOAD)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == json.loads(get_dumps("json")(PAYLOAD))
+
+    def test_unknown_encoder_falls_back_to_json(self, settings):
+        settings.GREADER_JSON_ENCODER = "simplejson-ng"
+
+        assert get_encoder_name() == "json"
+
+    def test_response_has_json_content_type(self, settings):
+        settings.GREADER_JSON_ENCODER = "orjson"
+
+        response = GReaderJsonResponse({"status": "ok"}, status=201)
+
+        assert response["Content-Type"] == "application/json"
+        assert response.status_code == 201
+        assert json.loads(response.content) == {"status": "ok"}
@@ -0,0 +1,127 @@
+"""Query plan checks for the GReader stream and unread-count queries.
+
+Runs EXPLAIN QUERY PLAN on the SQL each code path actually executes, so an
+index change (or a query change) that makes SQLite read a whole table fails
+here instead of showing up as a slow sync in production.
+"""
+
+import re
+
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from core.services.greader.stream_service import (
+    _compute_unread_count,
+    get_stream_contents,
+    get_stream_item_ids,
+)
+
+READ = "user/-/state/com.google/read"
+STARRED = "user/-/state/com.google/starred"
+
+# "SCAN <table>" without "USING ... INDEX" reads every row of the table
+FULL_SCAN = re.compile(r"^SCAN (?P<table>\w+)(?: AS \w+)?$")
+
+pytestmark = pytest.mark.skipif(
+    connection.vendor != "sqlite", reason="plans are checked against SQLite"
+)
+
+
+def _query_plans(func) -> dict[str, list[str]]:
+    """Run func and get the query plan lines of each SELECT it executed."""
+    with CaptureQueriesContext(connection) as ctx:
+        func()
+
+    plans = {}
+    with connection.cursor() as cursor:
+        for query in ctx.captured_queries:
+            sql = query["sql"]
+            if not sql.startswith("SELECT"):
+                continue
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            plans[sql] = [row[3] for row in cursor.fetchall()]
+    return plans
+
+
+def _full_scans(plans: dict[str, list[str]]) -> list[str]:
+    return [
+        f"{line}\n  in {sql}"
+        for sql, lines in plans.items()
+        for line in lines
+        if FULL_SCAN.match(line)
+    ]
+
+
+def _uses_index(plans: dict[str, list[str]], index_name: str) -> bool:
+    return any(index_name in line for lines in plans.values() for line in lines)
+
+
+@pytest.fixture
+def stream_ids(rss_feed, feed_group):
+    return {
+        "default": "",
+        "reading-list": "user/-/state/com.google/reading-list",
+        "feed": f"feed/{rss_feed.id}",
+        "feed-url": f"feed/{rss_feed.identifier}",
+        "label": f"user/-/label/{feed_group.name}",
+        "starred": STARRED,
+        "read": READ,
+    }
+
+
+@pytest.mark.django_db
+class TestStreamQueryPlans:
+    @pytest.mark.parametrize(
+        "stream", ["default", "reading-list", "feed", "feed-url", "label", "starred", "read"]
+    )
+    @pytest.mark.parametrize(
+        "exclude_tag,include_tag", [(None, None), (READ, None), (None, STARRED)]
+    )
+    def test_stream_queries_use_indexes(
+        self, user, stream_ids, articles_batch, stream, exclude_tag, include_tag
+    ):
+        stream_id = stream_ids[stream]
+        request = RequestFactory().get("/reader/api/0/stream/contents")
+
+        def run():
+            get_stream_item_ids(
+                user.id, stream_id, limit=20, exclude_tag=exclude_tag, include_tag=include_tag
+            )
+            get_stream_contents(
+                user.id,
+                request,
+                stream_id,
+                limit=20,
+                exclude_tag=exclude_tag,
+                include_tag=include_tag,
+            )
+
+        plans = _query_plans(run)
+
+        assert plans
+        assert _full_scans(plans) == []
+
+    def test_unread_feed_stream_reads_unread_rows_only(self, user, stream_ids, articles_batch):
+        plans = _query_plans(
+            lambda: get_stream_item_ids(user.id, stream_ids["feed"], exclude_tag=READ)
+        )
+
+        assert _uses_index(plans, "core_article_unread_feed_idx")
+
+    def test_starred_stream_reads_starred_rows_only(self, user, stream_ids, articles_batch):
+        plans = _query_plans(lambda: get_stream_item_ids(user.id, stream_ids["starred"]))
+
+        assert _uses_index(plans, "core_article_starred_date_idx")
+
+
+@pytest.mark.django_db
+class TestUnreadCountQueryPlans:
+    def test_unread_count_uses_indexes(self, user, rss_feed, articles_batch):
+        # First call computes the missing counters from the articles table
+        plans = _query_plans(lambda: _compute_unread_count(user.id, include_all=True))
+        plans.update(_query_plans(lambda: _compute_unread_count(user.id, include_all=True)))
+
+        assert _full_scans(plans) == []
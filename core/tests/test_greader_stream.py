@@ -1,11 +1,19 @@
 from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
 
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 import pytest
 
 from core.models import Article, Feed, GReaderAuthToken
+from core.services.greader.stream_format import (
+    decode_continuation,
+    encode_continuation,
+    parse_item_id,
+)
 
 
 @pytest.mark.django_db
@@ -142,6 +150,17 @@ class TestGReaderStreamIds:
         assert ids[1] == str(articles[1].id)
         assert ids[2] == str(articles[0].id)
 
+    def test_stream_ids_select_only_the_id(
+        self, client, user, auth_headers, stream_ids_url, articles
+    ):
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(stream_ids_url, **auth_headers)
+
+        assert len(response.json()["itemRefs"]) == 3
+        article_queries = [q["sql"] for q in ctx.captured_queries if "core_article" in q["sql"]]
+        assert article_queries
+        assert all('"core_article"."content"' not in sql for sql in article_queries)
+
     @pytest.fixture
     def contents_url(self):
         return reverse("greader:stream_contents")
@@ -170,8 +189,6 @@ class TestGReaderStreamIds:
         data = response.json()
         assert len(data["items"]) == 2
 
-        from core.services.greader.stream_format import parse_item_id
-
         ids = [parse_item_id(item["id"]) for item in data["items"]]
 
         assert articles[0].id in ids
@@ -196,6 +213,74 @@ class TestGReaderStreamIds:
         # Art 3 should be the last one (descending date)
         assert str(articles[2].id) in data["items"][0]["id"]
 
+    def test_stream_contents_pagination_ties_on_date(
+        self, client, user, auth_headers, contents_url, feed
+    ):
+        # Articles sharing a timestamp must neither repeat nor be skipped across pages
+        now = datetime.now(timezone.utc)
+        created = [
+            Article.objects.create(
+                feed=feed, name=f"Same {i}", identifier=f"same{i}", content="x", date=now
+            )
+            for i in range(5)
+        ]
+
+        seen = []
+        params = {"n": "2"}
+        for _ in range(5):
+            data = client.get(contents_url, params, **auth_headers).json()
+            seen.extend(parse_item_id(item["id"]) for item in data["items"])
+            if "continuation" not in data:
+                break
+            params = {"n": "2", "c": data["continuation"]}
+
+        assert seen == sorted((a.id for a in created), reverse=True)
+
+    def test_stream_contents_last_page_has_no_continuation(
+        self, client, user, auth_headers, contents_url, articles
+    ):
+        response = client.get(contents_url, {"n": "3"}, **auth_headers)
+        data = response.json()
+        assert len(data["items"]) == 3
+        assert "continuation" not in data
+
+    def test_stream_contents_invalid_continuation(
+        self, client, user, auth_headers, contents_url, articles
+    ):
+        # Malformed tokens fall back to the first page
+        response = client.get(contents_url, {"n": "2", "c": "not-a-token!"}, **auth_headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert parse_item_id(data["items"][0]["id"]) == articles[0].id
+
+    def test_stream_contents_resolves_feed_origin_once(
+        self, client, user, auth_headers, contents_url, articles
+    ):
+        from core.aggregators.registry import get_aggregator
+
+        with patch(
+            "core.aggregators.registry.get_aggregator", side_effect=get_aggregator
+        ) as mock_get:
+            response = client.get(contents_url, **auth_headers)
+
+        assert response.status_code == 200
+        assert len(response.json()["items"]) == 3
+        assert mock_get.call_count == 1
+
+    def test_stream_contents_skip_raw_content(
+        self, client, user, auth_headers, contents_url, articles
+    ):
+        with CaptureQueriesContext(connection) as ctx:
+            response = client.get(contents_url, **auth_headers)
+
+        assert len(response.json()["items"]) == 3
+        assert all("raw_content" not in q["sql"] for q in ctx.captured_queries)
+
+    def test_continuation_token_roundtrip(self):
+        date = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        token = encode_continuation(date, 42)
+        assert decode_continuation(token) == (date, 42)
+
     def test_unread_count(self, client, user, auth_headers, articles, feed):
         url = reverse("greader:unread_count")
 
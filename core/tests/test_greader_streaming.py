@@ -0,0 +1,87 @@
+import json
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.http import StreamingHttpResponse
+from django.urls import reverse
+from django.utils import timezone
+
+import pytest
+
+from core.models import Article, GReaderAuthToken
+from core.views.greader.streaming import iter_json
+
+
+def _streamed_json(response):
+    assert isinstance(response, StreamingHttpResponse)
+    return json.loads(b"".join(response.streaming_content))
+
+
+class TestIterJson:
+    def test_encodes_generators_as_arrays(self):
+        data = {"a": 1, "items": (i for i in range(3)), "b": [1, 2]}
+
+        assert json.loads(b"".join(iter_json(data))) == {"a": 1, "items": [0, 1, 2], "b": [1, 2]}
+
+    def test_deferred_values_are_evaluated_after_earlier_items(self):
+        seen = []
+
+        def items():
+            for i in range(2):
+                seen.append(i)
+                yield i
+
+        data = {"items": items(), "count": lambda: len(seen), "skip": lambda: None}
+
+        assert json.loads(b"".join(iter_json(data))) == {"items": [0, 1], "count": 2}
+
+
+@pytest.mark.django_db
+class TestGReaderStreamingResponses:
+    @pytest.fixture
+    def auth_headers(self, user):
+        token = GReaderAuthToken.generate_for_user(user)
+        return {"HTTP_AUTHORIZATION": f"GoogleLogin auth={token.token}"}
+
+    @pytest.fixture
+    def many_articles(self, rss_feed):
+        now = timezone.now()
+        return [
+            Article.objects.create(
+                feed=rss_feed,
+                name=f"Article {i}",
+                identifier=f"https://example.com/s/{i}",
+                content=f"<p>{i}</p>",
+                date=now - timedelta(minutes=i),
+            )
+            for i in range(5)
+        ]
+
+    def test_large_item_ids_request_is_streamed(self, client, auth_headers, many_articles):
+        url = reverse("greader:stream_items_ids")
+        response = client.get(url, {"n": "1000"}, **auth_headers)
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "application/json"
+        data = _streamed_json(response)
+        assert [ref["id"] for ref in data["itemRefs"]] == [str(a.id) for a in many_articles]
+
+    def test_streamed_contents_include_continuation(self, client, auth_headers, many_articles):
+        url = reverse("greader:stream_contents")
+
+        with patch("core.views.greader.stream.STREAMING_MIN_ITEMS", 2):
+            first = _streamed_json(client.get(url, {"n": "3"}, **auth_headers))
+            second = _streamed_json(
+                client.get(url, {"n": "3", "c": first["continuation"]}, **auth_headers)
+            )
+
+        assert len(first["items"]) == 3
+        assert len(second["items"]) == 2
+        assert "continuation" not in second
+
+    def test_small_requests_are_not_streamed(self, client, auth_headers, many_articles):
+        url = reverse("greader:stream_contents")
+        response = client.get(url, {"n": "2"}, **auth_headers)
+
+        assert not isinstance(response, StreamingHttpResponse)
+        assert len(response.json()["items"]) == 2
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 from django.contrib.auth.models import User
 from django.urls import reverse
 
@@ -151,6 +153,43 @@ class TestGReaderTag:
         assert a1.starred
         assert a2.starred
 
+    def test_edit_tags_uses_one_update_per_batch(self, user, feed, django_assert_max_num_queries):
+        from core.services.greader.tag_service import edit_tags
+
+        ids = [
+            Article.objects.create(feed=feed, name=f"A{i}", identifier=f"bulk{i}").id
+            for i in range(200)
+        ]
+
+        with django_assert_max_num_queries(8):
+            result = edit_tags(user.id, ids, add_tag="user/-/state/com.google/starred")
+
+        assert result["updated"] == 200
+        assert Article.objects.filter(feed=feed, starred=True).count() == 200
+
+    def test_edit_tags_batches_ids(self, user, feed):
+        from core.services.greader import tag_service
+
+        ids = [
+            Article.objects.create(feed=feed, name=f"A{i}", identifier=f"batch{i}").id
+            for i in range(5)
+        ]
+
+        with patch.object(tag_service, "_id_batch_size", return_value=2):
+            result = tag_service.edit_tags(user.id, ids, add_tag="user/-/state/com.google/read")
+
+        assert result["updated"] == 5
+        assert not Article.objects.filter(feed=feed, read=False).exists()
+
+    def test_edit_tags_counts_only_changed_articles(self, user, feed, article):
+        from core.services.greader.tag_service import edit_tags
+
+        first = edit_tags(user.id, [article.id], add_tag="user/-/state/com.google/starred")
+        second = edit_tags(user.id, [article.id], add_tag="user/-/state/com.google/starred")
+
+        assert first["updated"] == 1
+        assert second["updated"] == 0
+
     def test_edit_tag_inaccessible_article(self, client, user, auth_headers, edit_tag_url):
         from django.contrib.auth.models import User
 
@@ -0,0 +1,69 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+import pytest
+
+from core.models import GReaderAuthToken
+from core.services.greader.auth_service import (
+    authenticate_request,
+    cleanup_expired_tokens,
+    clear_token_cache,
+    revoke_token,
+)
+
+
+@pytest.mark.django_db
+class TestGReaderTokenCache:
+    @pytest.fixture
+    def user(self):
+        return User.objects.create_user(
+            username="tokenuser", email="token@example.com", password="password"
+        )
+
+    @pytest.fixture
+    def token(self, user):
+        return GReaderAuthToken.generate_for_user(user)
+
+    def _header(self, token):
+        return f"GoogleLogin auth={token.token}"
+
+    def test_cached_token_needs_no_query(self, user, token, django_assert_num_queries):
+        assert authenticate_request(self._header(token))["id"] == user.id
+
+        with django_assert_num_queries(0):
+            assert authenticate_request(self._header(token))["id"] == user.id
+
+    def test_shared_cache_serves_other_processes(self, user, token, django_assert_num_queries):
+        authenticate_request(self._header(token))
+        # Simulate another worker process with an empty in-process cache
+        clear_token_cache()
+
+        with django_assert_num_queries(0):
+            assert authenticate_request(self._header(token))["id"] == user.id
+
+    def test_revoked_token_is_rejected(self, token):
+        assert authenticate_request(self._header(token)) is not None
+
+        assert revoke_token(token.token)
+
+        assert authenticate_request(self._header(token)) is None
+
+    def test_cleanup_evicts_expired_tokens(self, token):
+        assert authenticate_request(self._header(token)) is not None
+        GReaderAuthToken.objects.filter(pk=token.pk).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+
+        assert cleanup_expired_tokens() == 1
+
+        assert authenticate_request(self._header(token)) is None
+
+    def test_cached_token_expiry_is_checked(self, token):
+        assert authenticate_request(self._header(token)) is not None
+        after_expiry = (token.expires_at + timedelta(seconds=1)).timestamp()
+
+        with patch("core.services.greader.auth_service.time.time", return_value=after_expiry):
+            assert authenticate_request(self._header(token)) is None
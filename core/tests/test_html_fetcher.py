@@ -7,7 +7,7 @@ from core.aggregators.utils.html_fetcher import fetch_html
 
 
 class TestHtmlFetcher:
-    @patch("core.aggregators.utils.html_fetcher.requests.get")
+    @patch("core.http_client.get")
     def test_fetch_html_success(self, mock_get):
         mock_response = MagicMock()
         mock_response.text = "<html>Content</html>"
@@ -23,7 +23,7 @@ class TestHtmlFetcher:
         assert "User-Agent" in kwargs["headers"]
         assert "YanaBot" in kwargs["headers"]["User-Agent"]
 
-    @patch("core.aggregators.utils.html_fetcher.requests.get")
+    @patch("core.http_client.get")
     @patch("core.aggregators.utils.html_fetcher.time.sleep")
     def test_fetch_html_retry_success(self, mock_sleep, mock_get):
         # Fail first, succeed second
@@ -44,7 +44,7 @@ class TestHtmlFetcher:
         assert mock_sleep.call_count == 1
         mock_sleep.assert_called_with(1)  # 2**0
 
-    @patch("core.aggregators.utils.html_fetcher.requests.get")
+    @patch("core.http_client.get")
     @patch("core.aggregators.utils.html_fetcher.time.sleep")
     def test_fetch_html_max_retries_exceeded(self, mock_sleep, mock_get):
         mock_get.side_effect = requests.RequestException("Persistent Fail")
@@ -55,7 +55,7 @@ class TestHtmlFetcher:
         assert mock_get.call_count == 3
         assert mock_sleep.call_count == 2
 
-    @patch("core.aggregators.utils.html_fetcher.requests.get")
+    @patch("core.http_client.get")
     @patch("core.aggregators.utils.html_fetcher.time.sleep")
     def test_fetch_html_timeout(self, mock_sleep, mock_get):
         # Mock sleep to avoid waiting during test
@@ -68,7 +68,21 @@ class TestHtmlFetcher:
         assert mock_get.call_count == 3
         assert mock_sleep.call_count == 2
 
-    @patch("core.aggregators.utils.html_fetcher.requests.get")
+    @patch("core.http_client.get")
+    @patch("core.aggregators.utils.html_fetcher.time.sleep")
+    def test_fetch_html_does_not_retry_client_errors(self, mock_sleep, mock_get):
+        response = MagicMock()
+        response.status_code = 404
+        response.raise_for_status.side_effect = requests.HTTPError("Not Found", response=response)
+        mock_get.return_value = response
+
+        with pytest.raises(requests.HTTPError):
+            fetch_html("https://example.com")
+
+        assert mock_get.call_count == 1
+        mock_sleep.assert_not_called()
+
+    @patch("core.http_client.get")
     def test_fetch_html_fixes_iso8859_default_encoding(self, mock_get):
         """UTF-8 content with ISO-8859-1 default should use apparent_encoding."""
         utf8_text = "Ärger mit Übung und Straße"
@@ -84,7 +98,7 @@ class TestHtmlFetcher:
         assert result == utf8_text
         assert mock_response.encoding == "utf-8"
 
-    @patch("core.aggregators.utils.html_fetcher.requests.get")
+    @patch("core.http_client.get")
     def test_fetch_html_preserves_explicit_charset(self, mock_get):
         """When server explicitly sets charset, encoding should not be overridden."""
         mock_response = MagicMock()
@@ -99,7 +113,7 @@ class TestHtmlFetcher:
         assert result == "Content with ä ö ü"
         assert mock_response.encoding == "utf-8"
 
-    @patch("core.aggregators.utils.html_fetcher.requests.get")
+    @patch("core.http_client.get")
     def test_fetch_html_fixes_latin1_alias_encoding(self, mock_get):
         """latin-1 alias should also trigger encoding correction."""
         mock_response = MagicMock()
@@ -0,0 +1,122 @@
+"""
+Compatibility suite for the HTML parser backends.
+
+Runs the aggregator fixtures through html.parser and lxml and diffs the
+output, so the faster lxml default never changes what ends up in articles.
+"""
+
+import difflib
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from django.test import override_settings
+
+import pytest
+
+from core.aggregators.caschys_blog.aggregator import CaschysBlogAggregator
+from core.aggregators.dark_legacy.aggregator import DarkLegacyAggregator
+from core.aggregators.explosm.aggregator import ExplosmAggregator
+from core.aggregators.heise.aggregator import HeiseAggregator
+from core.aggregators.mactechnews.aggregator import MactechnewsAggregator
+from core.aggregators.mactechnews.comment_extractor import extract_comments
+from core.aggregators.mactechnews.multipage_handler import detect_pagination
+from core.aggregators.mein_mmo.aggregator import MeinMmoAggregator
+from core.aggregators.merkur.aggregator import MerkurAggregator
+from core.aggregators.oglaf.aggregator import OglafAggregator
+from core.aggregators.tagesschau.aggregator import TagesschauAggregator
+from core.aggregators.utils import get_document_parser, parse_document
+from core.aggregators.website import FullWebsiteAggregator
+
+FIXTURES = sorted((Path(__file__).parent / "fixtures").glob("*.html"))
+
+AGGREGATORS = [
+    FullWebsiteAggregator,
+    CaschysBlogAggregator,
+    DarkLegacyAggregator,
+    ExplosmAggregator,
+    HeiseAggregator,
+    MactechnewsAggregator,
+    MeinMmoAggregator,
+    MerkurAggregator,
+    OglafAggregator,
+    TagesschauAggregator,
+]
+
+PARSERS = ["html.parser", "lxml"]
+
+
+def make_feed():
+    feed = MagicMock()
+    feed.identifier = ""
+    feed.daily_limit = 5
+    # Options that would make the aggregators fetch more than the fixture
+    feed.options = {"include_comments": False, "convert_to_base64": False}
+    return feed
+
+
+def enrich_with_parser(parser, aggregator_class, html):
+    article = {
+        "name": "Fixture Article",
+        "identifier": "https://example.com/article/1",
+        "content": "",
+    }
+    with (
+        override_settings(AGGREGATOR_HTML_PARSER=parser),
+        patch("core.aggregators.website.fetch_html", return_value=html),
+        patch.object(aggregator_class, "extract_header_element", return_value=None),
+    ):
+        aggregator = aggregator_class(make_feed())
+        return aggregator.enrich_articles([article])[0]["content"]
+
+
+def assert_same_output(html_parser_output, lxml_output):
+    diff = "\n".join(
+        difflib.unified_diff(
+            html_parser_output.splitlines(),
+            lxml_output.splitlines(),
+            "html.parser",
+            "lxml",
+            lineterm="",
+        )
+    )
+    assert not diff, diff
+
+
+class TestParserSelection:
+    def test_default_is_lxml(self):
+        assert get_document_parser() == "lxml"
+
+    @override_settings(AGGREGATOR_HTML_PARSER="html.parser")
+    def test_configurable(self):
+        assert get_document_parser() == "html.parser"
+
+    @override_settings(AGGREGATOR_HTML_PARSER="not-installed")
+    def test_falls_back_when_missing(self):
+        assert get_document_parser() == "html.parser"
+        assert parse_document("<p>Text</p>").p.get_text() == "Text"
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=lambda path: path.stem)
+@pytest.mark.parametrize("aggregator_class", AGGREGATORS, ids=lambda cls: cls.__name__)
+def test_aggregator_output_matches(aggregator_class, fixture):
+    html = fixture.read_text()
+
+    outputs = [enrich_with_parser(parser, aggregator_class, html) for parser in PARSERS]
+
+    assert_same_output(*outputs)
+
+
+@pytest.mark.parametrize("fixture", FIXTURES, ids=lambda path: path.stem)
+def test_mactechnews_helpers_match(fixture):
+    html = fixture.read_text()
+    results = []
+    for parser in PARSERS:
+        with override_settings(AGGREGATOR_HTML_PARSER=parser):
+            results.append(
+                (
+                    extract_comments(html, "https://example.com/article/1", max_comments=5),
+                    detect_pagination(html, MagicMock()),
+                )
+            )
+
+    assert results[0] == results[1]
@@ -0,0 +1,131 @@
+import re
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from bs4 import BeautifulSoup
+
+from core.aggregators.services.header_element.context import HeaderElementData
+from core.aggregators.utils import (
+    HtmlPipeline,
+    clean_html,
+    extract_main_content,
+    remove_image_by_url,
+    sanitize_class_names,
+)
+from core.aggregators.utils.youtube import proxy_youtube_embeds
+from core.aggregators.website import FullWebsiteAggregator
+from core.models import Feed
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+PAGE_HTML = """
+<html><body>
+    <nav>Menu</nav>
+    <article class="post">
+        <!-- tracking -->
+        <img class="hero" src="https://example.com/img/header-780x438.jpg">
+        <p class="lead">Intro</p>
+        <iframe src="https://www.youtube.com/embed/dQw4w9WgXcQ"></iframe>
+        <div class="ad">Ad</div>
+        <script>tracking()</script>
+    </article>
+</body></html>
+"""
+
+
+def normalize_whitespace(html):
+    # Re-parsing merged the whitespace left behind by removed elements
+    return re.sub(r"\s+", " ", html)
+
+
+def multi_parse(html, selector, remove, header_image_url):
+    """The previous chain: every step parsed and serialised again."""
+    content = extract_main_content(html, selector=selector, remove_selectors=remove)
+    soup = BeautifulSoup(content, "html.parser")
+    proxy_youtube_embeds(soup)
+    remove_image_by_url(soup, header_image_url)
+    sanitize_class_names(soup)
+    return clean_html(str(soup))
+
+
+class TestHtmlPipeline:
+    @pytest.mark.parametrize(
+        "html",
+        [PAGE_HTML]
+        + [(FIXTURES / name).read_text() for name in ("caschys_blog.html", "mactechnews.html")],
+    )
+    def test_matches_multi_parse_chain(self, html):
+        selector = "article, .article-content, .entry-content, main"
+        remove = ["script", "style", ".ad"]
+        header = "https://example.com/img/header.jpg"
+
+        result = (
+            HtmlPipeline.extract(html, selector, remove)
+            .proxy_youtube_embeds()
+            .remove_image_by_url(header)
+            .sanitize_class_names()
+            .remove_comments()
+            .to_html()
+        )
+
+        assert normalize_whitespace(result) == normalize_whitespace(
+            multi_parse(html, selector, remove, header)
+        )
+
+    def test_steps(self):
+        result = (
+            HtmlPipeline.extract(PAGE_HTML, "article", ["script", ".ad"])
+            .remove_image_by_url("https://example.com/img/header.jpg")
+            .sanitize_class_names()
+            .remove_comments()
+            .to_html()
+        )
+
+        assert "Menu" not in result
+        assert "tracking" not in result
+        assert "header-780x438" not in result
+        assert 'data-sanitized-class="lead"' in result
+
+    def test_parse_reuses_tree(self):
+        soup = BeautifulSoup("<p>Text</p>", "html.parser")
+
+        assert HtmlPipeline.parse(soup).root is soup
+
+
+@pytest.mark.django_db
+class TestFullWebsiteSingleParse:
+    def test_article_is_parsed_once(self):
+        feed = Feed.objects.create(name="Site", aggregator="full_website")
+        aggregator = FullWebsiteAggregator(feed)
+        article = {
+            "name": "Post",
+            "identifier": "https://example.com/post",
+            "header_data": HeaderElementData(
+                image_bytes=b"",
+                content_type="image/jpeg",
+                image_src="",
+                image_url="https://example.com/img/header.jpg",
+            ),
+        }
+
+        parsed = []
+        original_init = BeautifulSoup.__init__
+
+        def counting_init(soup, markup="", *args, **kwargs):
+            # Only count parses of the article itself, not of small embed snippets
+            if "Intro" in str(markup):
+                parsed.append(markup)
+            original_init(soup, markup, *args, **kwargs)
+
+        with (
+            patch("core.aggregators.website.fetch_html", return_value=PAGE_HTML),
+            patch.object(BeautifulSoup, "__init__", counting_init),
+        ):
+            raw_html = aggregator.fetch_article_content(article["identifier"])
+            content = aggregator.build_content(raw_html, article)
+
+        assert len(parsed) == 1
+        assert "Intro" in content
+        assert "header-780x438" not in content
+        assert "youtube-embed-container" in content
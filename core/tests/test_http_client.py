@@ -0,0 +1,92 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from core import http_client
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set = set()
+
+    def do_GET(self):
+        KeepAliveHandler.connections.add(self.client_address)
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", "session=abc; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    KeepAliveHandler.connections = set()
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_session():
+    http_client.close_session()
+    http_client.clear_dns_cache()
+    yield
+    http_client.close_session()
+    http_client.clear_dns_cache()
+
+
+class TestSharedSession:
+    def test_session_is_shared(self):
+        assert http_client.get_session() is http_client.get_session()
+
+    def test_new_session_after_fork(self):
+        session = http_client.get_session()
+
+        with patch("core.http_client.os.getpid", return_value=-1):
+            assert http_client.get_session() is not session
+
+    def test_default_user_agent(self):
+        assert http_client.get_session().headers["User-Agent"] == http_client.USER_AGENT
+
+    def test_connections_are_reused(self, server):
+        for _ in range(5):
+            http_client.get(f"{server}/page", timeout=5).raise_for_status()
+
+        assert len(KeepAliveHandler.connections) == 1
+
+    def test_cookies_are_not_kept(self, server):
+        http_client.get(f"{server}/page", timeout=5)
+
+        assert len(http_client.get_session().cookies) == 0
+
+
+class TestDnsCache:
+    def test_host_is_resolved_once(self, server):
+        original = http_client.socket.getaddrinfo
+        with patch("core.http_client.socket.getaddrinfo", side_effect=original) as lookup:
+            for path in ("a", "b", "c"):
+                # A new session per request forces a new connection each time
+                http_client.create_session().get(f"{server}/{path}", timeout=5)
+
+        # urllib3 still calls getaddrinfo, but only with the cached address
+        hosts = [call.args[0] for call in lookup.call_args_list]
+        assert hosts.count("localhost") == 1
+
+    def test_failed_lookup_is_not_cached(self):
+        with patch("core.http_client.socket.getaddrinfo", side_effect=OSError("nope")):
+            assert http_client.resolve_host("example.invalid", 80) == []
+
+        with patch(
+            "core.http_client.socket.getaddrinfo",
+            return_value=[(2, 1, 6, "", ("192.0.2.1", 80))],
+        ):
+            assert http_client.resolve_host("example.invalid", 80) == ["192.0.2.1"]
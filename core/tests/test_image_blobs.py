@@ -0,0 +1,207 @@
+"""Tests for content-addressed article image storage."""
+
+from collections import Counter
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.db import DatabaseError, connection, transaction
+from django.test import RequestFactory
+from django.urls import resolve
+from django.utils import timezone
+
+import pytest
+
+from core.aggregators.services.header_element.file_handler import HeaderElementFileHandler
+from core.aggregators.services.image_extraction.compression import embed_image
+from core.models import Article, ImageBlob
+from core.services import ArticleService, FeedCounterService, ImageBlobService
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"a" * 64
+JPEG = b"\xff\xd8\xff" + b"b" * 64
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+def _make_articles(feed, count):
+    return [
+        Article.objects.create(
+            feed=feed, name=f"Article {i}", identifier=f"https://example.com/{i}", content="c"
+        )
+        for i in range(count)
+    ]
+
+
+def _age_blobs():
+    ImageBlob.objects.update(updated_at=timezone.now() - timedelta(days=1))
+
+
+@pytest.mark.django_db
+class TestImageBlobService:
+    def test_identical_images_are_stored_once(self, rss_feed):
+        first, second = _make_articles(rss_feed, 2)
+
+        assert HeaderElementFileHandler.save_image_to_article(first, PNG, "image/png")
+        assert HeaderElementFileHandler.save_image_to_article(second, PNG, "image/png")
+
+        blob = ImageBlob.objects.get()
+        assert blob.ref_count == 2
+        first.refresh_from_db()
+        second.refresh_from_db()
+        assert first.icon.name == second.icon.name == blob.name
+        assert blob.name.endswith(".png")
+        assert first.icon.read() == PNG
+
+    def test_replacing_icon_releases_previous_blob(self, rss_feed):
+        (article,) = _make_articles(rss_feed, 1)
+        HeaderElementFileHandler.save_image_to_article(article, PNG, "image/png")
+
+        HeaderElementFileHandler.save_image_to_article(article, JPEG, "image/jpeg")
+        # Same image again does not count twice
+        HeaderElementFileHandler.save_image_to_article(article, JPEG, "image/jpeg")
+
+        counts = dict(ImageBlob.objects.values_list("content_type", "ref_count"))
+        assert counts == {"image/png": 0, "image/jpeg": 1}
+
+    def test_deleting_articles_releases_blobs(self, rss_feed):
+        articles = _make_articles(rss_feed, 3)
+        for article in articles:
+            HeaderElementFileHandler.save_image_to_article(article, PNG, "image/png")
+
+        FeedCounterService.delete_articles(Article.objects.filter(pk=articles[0].pk))
+        assert ImageBlob.objects.get().ref_count == 2
+
+        Article.objects.filter(pk=articles[1].pk).update(date=timezone.now() - timedelta(days=365))
+        ArticleService.delete_old_articles(months=2)
+        assert ImageBlob.objects.get().ref_count == 1
+
+    def test_collect_garbage_deletes_only_unreferenced_blobs(
+        self, rss_feed, django_capture_on_commit_callbacks
+    ):
+        kept, dropped = _make_articles(rss_feed, 2)
+        HeaderElementFileHandler.save_image_to_article(kept, PNG, "image/png")
+        HeaderElementFileHandler.save_image_to_article(dropped, JPEG, "image/jpeg")
+        dropped_name = ImageBlob.objects.get(content_type="image/jpeg").name
+        FeedCounterService.delete_articles(Article.objects.filter(pk=dropped.pk))
+        _age_blobs()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            assert ImageBlobService.collect_garbage() == 1
+
+        assert list(ImageBlob.objects.values_list("content_type", flat=True)) == ["image/png"]
+        assert not default_storage.exists(dropped_name)
+        kept.refresh_from_db()
+        assert default_storage.exists(kept.icon.name)
+
+    def test_collect_garbage_deletes_files_only_after_commit(self, rss_feed):
+        (article,) = _make_articles(rss_feed, 1)
+        HeaderElementFileHandler.save_image_to_article(article, PNG, "image/png")
+        name = ImageBlob.objects.get().name
+        FeedCounterService.delete_articles(Article.objects.filter(pk=article.pk))
+        _age_blobs()
+
+        with pytest.raises(DatabaseError), transaction.atomic():
+            ImageBlobService.collect_garbage()
+            # The commit fails, the row comes back
+            raise DatabaseError("database is locked")
+
+        assert ImageBlob.objects.get().name == name
+        assert default_storage.exists(name)
+
+    def test_files_of_blobs_stored_again_are_kept(self, rss_feed):
+        blob = ImageBlobService.store(PNG, "image/png")
+
+        ImageBlobService._delete_files([blob.name])
+
+        assert default_storage.exists(blob.name)
+
+    def test_collect_garbage_keeps_recently_attached_blobs(self, rss_feed):
+        # File stored, article row not written yet (as in _save_articles)
+        ImageBlobService.store(PNG, "image/png", references=1)
+
+        assert ImageBlobService.collect_garbage() == 0
+        assert ImageBlob.objects.exists()
+
+    def test_collect_garbage_recounts_before_deleting(self, rss_feed):
+        (article,) = _make_articles(rss_feed, 1)
+        HeaderElementFileHandler.save_image_to_article(article, PNG, "image/png")
+        # Drifted count must not delete a file that is still referenced
+        ImageBlob.objects.update(ref_count=0)
+        _age_blobs()
+
+        call_command("collect_image_blobs")
+
+        assert ImageBlob.objects.get().ref_count == 1
+        assert default_storage.exists(ImageBlob.objects.get().name)
+
+    def test_blob_file_is_rewritten_if_missing(self, rss_feed):
+        blob = ImageBlobService.store(PNG, "image/png")
+        default_storage.delete(blob.name)
+
+        ImageBlobService.store(PNG, "image/png")
+
+        with default_storage.open(blob.name) as f:
+            assert f.read() == PNG
+
+    def test_collect_garbage_keeps_blobs_embedded_in_content(self, rss_feed, public_base_url):
+        src = embed_image(PNG, "image/png")
+        (article,) = _make_articles(rss_feed, 1)
+        Article.objects.filter(pk=article.pk).update(content=f'<p><img src="{src}"></p>')
+        _age_blobs()
+
+        assert ImageBlobService.collect_garbage() == 0
+        assert ImageBlob.objects.get().ref_count == 1
+
+        FeedCounterService.delete_articles(Article.objects.filter(pk=article.pk))
+        _age_blobs()
+
+        assert ImageBlobService.collect_garbage() == 1
+
+    def test_collect_garbage_rechecks_content_written_after_the_scan(
+        self, rss_feed, public_base_url
+    ):
+        src = embed_image(PNG, "image/png")
+        (article,) = _make_articles(rss_feed, 1)
+        Article.objects.filter(pk=article.pk).update(content=f'<p><img src="{src}"></p>')
+        _age_blobs()
+
+        # The content scan ran before the article was written
+        with patch.object(ImageBlobService, "count_embedded", return_value=Counter()):
+            assert ImageBlobService.collect_garbage() == 0
+
+        assert ImageBlob.objects.exists()
+
+    def test_blob_files_are_served_with_long_cache_headers(self, media_root):
+        blob = ImageBlobService.store(PNG, "image/png")
+        path = f"/media/{blob.name}"
+
+        match = resolve(path)
+        # document_root is bound when the URLconf is loaded
+        response = match.func(
+            RequestFactory().get(path), path=match.kwargs["path"], document_root=media_root
+        )
+
+        assert response.status_code == 200
+        assert response["Content-Type"] == "image/png"
+        assert "immutable" in response["Cache-Control"]
+        assert "max-age=31536000" in response["Cache-Control"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_collect_garbage_scans_content_outside_the_transaction(rss_feed):
+    count_embedded = ImageBlobService.count_embedded
+    in_transaction = []
+
+    def record_transaction():
+        in_transaction.append(connection.in_atomic_block)
+        return count_embedded()
+
+    with patch.object(ImageBlobService, "count_embedded", side_effect=record_transaction):
+        ImageBlobService.collect_garbage()
+
+    assert in_transaction == [False]
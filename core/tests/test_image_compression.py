@@ -0,0 +1,108 @@
+"""Tests for image compression and the compressed variant cache."""
+
+import io
+import os
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from core.aggregators.services.image_extraction import compression
+from core.aggregators.services.image_extraction.compression import (
+    compress_and_encode_image,
+    compress_image,
+    embed_image,
+)
+from core.models import ImageBlob
+from core.services import ImageBlobService
+
+
+@pytest.fixture
+def large_png():
+    # Noise does not compress, so the PNG is well above MIN_IMAGE_SIZE
+    img = Image.frombytes("RGB", (1300, 650), os.urandom(1300 * 650 * 3))
+    output = io.BytesIO()
+    img.save(output, format="PNG")
+    return output.getvalue()
+
+
+class TestCompressedVariantCache:
+    def test_recurring_image_is_compressed_once(self, large_png):
+        with patch.object(
+            compression, "_compress_image", wraps=compression._compress_image
+        ) as mock_compress:
+            first = compress_image(large_png, "image/png", is_header=True)
+            second = compress_image(large_png, "image/png", is_header=True)
+
+        assert mock_compress.call_count == 1
+        assert second == first
+        assert (first["width"], first["height"], first["contentType"]) == (
+            1200,
+            600,
+            "image/webp",
+        )
+
+    def test_target_size_is_part_of_the_key(self, large_png):
+        with patch.object(
+            compression, "_compress_image", wraps=compression._compress_image
+        ) as mock_compress:
+            header = compress_image(large_png, "image/png", is_header=True)
+            inline = compress_image(large_png, "image/png", is_header=False)
+
+        assert mock_compress.call_count == 2
+        assert (header["width"], inline["width"]) == (1200, 1300)
+
+    def test_data_uri_is_built_from_cached_variant(self, settings, large_png):
+        settings.AGGREGATOR_IMAGE_EMBED = "base64"
+        first = compress_and_encode_image(large_png, "image/png", is_header=True)
+
+        with patch.object(compression, "_compress_image") as mock_compress:
+            second = compress_and_encode_image(large_png, "image/png", is_header=True)
+
+        mock_compress.assert_not_called()
+        assert second == first
+        assert first["src"].startswith("data:image/webp;base64,")
+
+    def test_small_images_are_returned_unchanged(self):
+        data = b"\x89PNG" + b"x" * 100
+
+        result = compress_image(data, "image/png")
+
+        assert result["data"] == data
+        assert result["contentType"] == "image/png"
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("public_base_url")
+class TestEmbedImage:
+    def test_images_are_stored_and_linked_by_url(self, settings, large_png):
+        result = compress_and_encode_image(large_png, "image/png", is_header=True)
+
+        blob = ImageBlob.objects.get()
+        assert result["src"] == f"https://yana.example.com/media/{blob.name}"
+        assert blob.content_type == "image/webp"
+        assert (settings.MEDIA_ROOT / blob.name).exists()
+
+    def test_identical_images_share_one_file(self):
+        data = b"\x89PNG" + b"x" * 100
+
+        assert embed_image(data, "image/png") == embed_image(data, "image/png")
+        assert ImageBlob.objects.count() == 1
+
+    def test_base64_is_the_fallback_if_storing_fails(self):
+        with patch.object(ImageBlobService, "store", side_effect=OSError("disk full")):
+            src = embed_image(b"abc", "image/png")
+
+        assert src == "data:image/png;base64,YWJj"
+
+    def test_base64_mode(self, settings):
+        settings.AGGREGATOR_IMAGE_EMBED = "base64"
+
+        assert embed_image(b"abc", "image/png") == "data:image/png;base64,YWJj"
+        assert not ImageBlob.objects.exists()
+
+    def test_base64_while_base_url_is_the_default(self, settings):
+        settings.BASE_URL = compression.LOCAL_BASE_URL
+
+        assert embed_image(b"abc", "image/png") == "data:image/png;base64,YWJj"
+        assert not ImageBlob.objects.exists()
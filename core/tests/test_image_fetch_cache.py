@@ -0,0 +1,145 @@
+"""Tests for the on-disk image fetch cache."""
+
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from core.aggregators.services.image_extraction.fetch_cache import (
+    DEFAULT_TTL,
+    CachedImage,
+    ImageFetchCache,
+    freshness_lifetime,
+    get_image_fetch_cache,
+)
+from core.aggregators.services.image_extraction.fetcher import fetch_single_image
+
+URL = "https://example.com/icon.png"
+IMAGE = b"\x89PNG\r\n\x1a\n" + b"x" * 200
+
+
+def _response(status=200, content=IMAGE, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = content
+    response.url = URL
+    response.headers.update({"Content-Type": "image/png", **(headers or {})})
+    return response
+
+
+@pytest.fixture
+def mock_get():
+    with patch("core.aggregators.services.image_extraction.fetcher.http_client.get") as mock:
+        yield mock
+
+
+class TestFetchSingleImageCache:
+    def test_second_fetch_is_served_from_cache(self, mock_get):
+        mock_get.return_value = _response(headers={"Cache-Control": "max-age=3600"})
+
+        first = fetch_single_image(URL)
+        second = fetch_single_image(URL)
+
+        assert first == second == {"imageData": IMAGE, "contentType": "image/png"}
+        assert mock_get.call_count == 1
+
+    def test_no_store_responses_are_not_cached(self, mock_get):
+        mock_get.return_value = _response(headers={"Cache-Control": "no-store"})
+
+        fetch_single_image(URL)
+        fetch_single_image(URL)
+
+        assert mock_get.call_count == 2
+
+    def test_stale_entry_is_revalidated_with_etag(self, mock_get):
+        mock_get.return_value = _response(headers={"Cache-Control": "no-cache", "ETag": '"v1"'})
+        fetch_single_image(URL)
+
+        mock_get.return_value = _response(
+            status=304, content=b"", headers={"Cache-Control": "max-age=60"}
+        )
+        result = fetch_single_image(URL)
+
+        assert result["imageData"] == IMAGE
+        assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+        # Fresh again after the 304
+        fetch_single_image(URL)
+        assert mock_get.call_count == 2
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            _response(status=404),
+            _response(headers={"Content-Type": "text/html"}),
+            _response(content=b"tiny"),
+        ],
+        ids=["not-found", "content-type", "too-small"],
+    )
+    def test_failures_are_cached_as_negative_entries(self, mock_get, response):
+        mock_get.return_value = response
+
+        assert fetch_single_image(URL) is None
+        assert fetch_single_image(URL) is None
+
+        assert mock_get.call_count == 1
+        assert get_image_fetch_cache().get(URL).is_negative
+
+    def test_transient_failures_are_not_cached(self, mock_get):
+        mock_get.side_effect = [requests.exceptions.Timeout(), _response()]
+
+        assert fetch_single_image(URL) is None
+        assert fetch_single_image(URL) is not None
+
+    def test_cache_can_be_disabled(self, settings, mock_get):
+        settings.AGGREGATOR_IMAGE_CACHE_SIZE = 0
+        mock_get.return_value = _response()
+
+        fetch_single_image(URL)
+        fetch_single_image(URL)
+
+        assert get_image_fetch_cache() is None
+        assert mock_get.call_count == 2
+
+
+class TestImageFetchCache:
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = ImageFetchCache(tmp_path, max_size=100_000)
+        urls = [f"https://example.com/{i}.png" for i in range(3)]
+        for i, url in enumerate(urls):
+            cache.put(CachedImage(url=url, expires=time.time() + 60, data=b"x" * 4000))
+            # Distinct last-use times, oldest first
+            os.utime(cache._path(url), (1000 + i, 1000 + i))
+        cache.get(urls[0])
+
+        cache.max_size = 9000
+        assert cache.evict() == 2
+
+        assert cache.get(urls[0]) is not None
+        assert cache.get(urls[1]) is None
+        assert cache.get(urls[2]) is None
+
+    def test_unreadable_entries_are_dropped(self, tmp_path):
+        cache = ImageFetchCache(tmp_path, max_size=100_000)
+        path = cache._path(URL)
+        path.parent.mkdir(parents=True)
+        path.write_bytes(b"not json\n")
+
+        assert cache.get(URL) is None
+        assert not path.exists()
+
+
+class TestFreshnessLifetime:
+    @pytest.mark.parametrize(
+        "headers,expected",
+        [
+            ({"Cache-Control": "public, max-age=600"}, 600),
+            ({"Cache-Control": "no-cache"}, 0),
+            ({"Cache-Control": "private, no-store"}, None),
+            ({"Expires": "0"}, 0),
+            ({}, DEFAULT_TTL),
+        ],
+    )
+    def test_lifetime_from_headers(self, headers, expected):
+        assert freshness_lifetime(headers) == expected
@@ -0,0 +1,107 @@
+"""Tests for image decoding and encoding in the image worker pool."""
+
+import io
+import os
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from core import image_processing
+from core.aggregators.services.image_extraction.compression import compress_image
+
+
+def _image(size, format, mode="RGB"):
+    img = Image.frombytes(mode, size, os.urandom(size[0] * size[1] * len(mode)))
+    output = io.BytesIO()
+    img.save(output, format=format)
+    return output.getvalue()
+
+
+@pytest.fixture
+def image_pool(settings):
+    settings.AGGREGATOR_IMAGE_WORKERS = 1
+    settings.AGGREGATOR_IMAGE_WORKER_MEMORY = 512
+    yield
+    image_processing.shutdown_pool()
+
+
+class TestResizeAndEncode:
+    def test_large_jpeg_is_decoded_at_reduced_scale(self):
+        # 2400x1600 only fits the limit when decoded at half scale
+        data = _image((2400, 1600), "JPEG")
+
+        with patch.object(image_processing, "MAX_DECODED_PIXELS", 1_000_000):
+            result = compress_image(data, "image/jpeg", is_header=True)
+
+        assert (result["width"], result["height"]) == (1200, 800)
+        assert result["contentType"] == "image/webp"
+
+    def test_images_above_the_pixel_limit_are_skipped(self):
+        data = _image((2400, 1600), "PNG")
+
+        with patch.object(image_processing, "MAX_DECODED_PIXELS", 1_000_000):
+            assert compress_image(data, "image/png", is_header=True) is None
+
+    def test_non_header_images_keep_their_size(self):
+        data = _image((800, 400), "JPEG")
+
+        result = compress_image(data, "image/jpeg")
+
+        assert (result["width"], result["height"]) == (800, 400)
+
+
+class TestImagePool:
+    def test_images_are_processed_in_a_worker(self, image_pool):
+        data = _image((2400, 1200), "JPEG")
+
+        result = compress_image(data, "image/jpeg", is_header=True)
+        worker_pid = image_processing.run(os.getpid)
+
+        assert (result["width"], result["height"]) == (1200, 600)
+        assert worker_pid != os.getpid()
+
+    def test_workers_are_memory_limited(self, image_pool):
+        with pytest.raises(MemoryError):
+            image_processing.run(bytearray, 1024 * 1024 * 1024)
+
+        # The worker survives the failed allocation
+        assert image_processing.run(sum, [1, 2]) == 3
+
+    def test_slow_jobs_time_out_and_the_pool_is_replaced(self, image_pool):
+        first_pid = image_processing.run(os.getpid)
+
+        with patch.object(image_processing, "JOB_TIMEOUT", 0.5), pytest.raises(TimeoutError):
+            image_processing.run(time.sleep, 10)
+
+        assert image_processing.run(os.getpid) != first_pid
+
+    def test_jobs_killed_by_another_timeout_are_resubmitted(self, image_pool):
+        first_pid = image_processing.run(os.getpid)
+        results = {}
+
+        def slow_job():
+            with pytest.raises(TimeoutError):
+                image_processing.run(time.sleep, 30)
+
+        def other_job():
+            started = time.monotonic()
+            results["pid"] = image_processing.run(os.getpid)
+            results["elapsed"] = time.monotonic() - started
+
+        with patch.object(image_processing, "JOB_TIMEOUT", 3):
+            slow = threading.Thread(target=slow_job)
+            slow.start()
+            time.sleep(0.5)
+            # Queued behind the slow job on the only worker
+            other = threading.Thread(target=other_job)
+            other.start()
+            slow.join()
+            other.join()
+
+        # Ran on the new pool as soon as the old one was terminated, well
+        # before its own deadline
+        assert results["pid"] not in (first_pid, None)
+        assert results["elapsed"] < 3
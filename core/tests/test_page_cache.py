@@ -0,0 +1,100 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from core.aggregators.exceptions import ArticleSkipError
+from core.aggregators.services.image_extraction.extractor import ImageExtractor
+from core.aggregators.utils.page_cache import PageCache
+from core.aggregators.website import FullWebsiteAggregator
+from core.models import Feed
+
+PAGE_HTML = """
+<html>
+    <head><meta property="og:image" content="https://example.com/header.jpg"></head>
+    <body>
+        <article><p>Article body</p><script>tracking()</script></article>
+    </body>
+</html>
+"""
+
+
+class TestPageCache:
+    def test_fetches_each_url_once(self):
+        fetcher = MagicMock(return_value=PAGE_HTML)
+        cache = PageCache(fetcher)
+
+        assert cache.get_html("https://example.com/a") == PAGE_HTML
+        soup = cache.get_soup("https://example.com/a")
+        assert cache.get_soup("https://example.com/a") is soup
+        assert cache.get_html("https://example.com/a") == PAGE_HTML
+
+        fetcher.assert_called_once_with("https://example.com/a")
+
+    def test_caches_fetch_errors(self):
+        fetcher = MagicMock(side_effect=requests.ConnectionError("down"))
+        cache = PageCache(fetcher)
+
+        with pytest.raises(requests.ConnectionError):
+            cache.get_soup("https://example.com/a")
+        with pytest.raises(requests.ConnectionError):
+            cache.get_html("https://example.com/a")
+
+        assert fetcher.call_count == 1
+
+    def test_take_soup_requires_cached_html(self):
+        cache = PageCache(MagicMock(return_value=PAGE_HTML))
+        html = cache.get_html("https://example.com/a")
+        parsed = cache.get_soup("https://example.com/a")
+
+        assert cache.take_soup("https://example.com/a", html + "<p>more</p>") is None
+        assert cache.take_soup("https://example.com/a", html) is parsed
+        # Handed out for modification, so the next caller gets a fresh parse
+        assert cache.get_soup("https://example.com/a") is not parsed
+
+    def test_evicts_least_recently_used(self):
+        fetcher = MagicMock(side_effect=lambda url: f"<p>{url}</p>")
+        cache = PageCache(fetcher, max_entries=2)
+
+        cache.get_html("https://example.com/a")
+        cache.get_html("https://example.com/b")
+        cache.get_html("https://example.com/a")
+        cache.get_html("https://example.com/c")
+        cache.get_html("https://example.com/a")
+        cache.get_html("https://example.com/b")
+
+        assert fetcher.call_count == 4
+
+    def test_image_extractor_maps_4xx_to_skip(self):
+        response = MagicMock(status_code=404)
+        cache = PageCache(MagicMock(side_effect=requests.HTTPError(response=response)))
+
+        with pytest.raises(ArticleSkipError):
+            ImageExtractor._fetch_and_parse_page("https://example.com/a", cache)
+
+
+@pytest.mark.django_db
+class TestFullWebsitePageSharing:
+    def test_header_and_content_share_one_fetch(self, user):
+        feed = Feed.objects.create(
+            name="Site", aggregator="full_website", identifier="https://example.com/rss", user=user
+        )
+        aggregator = FullWebsiteAggregator(feed)
+        article = {"name": "Title", "identifier": "https://example.com/article"}
+        image = {"imageData": b"x" * 200, "contentType": "image/png"}
+
+        with (
+            patch("core.aggregators.website.fetch_html", return_value=PAGE_HTML) as mock_fetch,
+            patch(
+                "core.aggregators.services.image_extraction.strategies.fetch_single_image",
+                return_value=image,
+            ),
+            patch("core.http_client.get") as mock_get,
+        ):
+            result = aggregator.enrich_articles([article])
+
+        mock_fetch.assert_called_once_with("https://example.com/article", timeout=30)
+        mock_get.assert_not_called()
+        assert result[0]["header_data"].image_url == "https://example.com/header.jpg"
+        assert "Article body" in result[0]["content"]
+        assert "tracking()" not in result[0]["content"]
@@ -0,0 +1,114 @@
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from django.utils import timezone
+
+import pytest
+
+from core.models import Feed
+from core.services.aggregator_service import AggregatorService
+from core.services.poll_scheduler import DEFAULT_INTERVAL, ENQUEUE_LEASE, PollScheduler
+
+
+def _poll(feed, new_articles, hours_later, **kwargs):
+    """Record a run that happens the given number of hours after the previous one."""
+    if feed.last_polled_at:
+        feed.last_polled_at = timezone.now() - timedelta(hours=hours_later)
+    PollScheduler.record_run(feed, new_articles, **kwargs)
+    feed.refresh_from_db()
+    return timedelta(seconds=feed.poll_interval)
+
+
+@pytest.mark.django_db
+class TestRecordRun:
+    def test_first_run_keeps_default_interval(self, rss_feed):
+        interval = _poll(rss_feed, 20, 0)
+
+        assert interval == DEFAULT_INTERVAL
+        assert rss_feed.new_article_rate == 0
+        assert rss_feed.last_polled_at is not None
+        assert rss_feed.last_new_article_at is not None
+
+    def test_busy_feed_is_polled_more_often(self, rss_feed):
+        _poll(rss_feed, 20, 0)
+        for _ in range(5):
+            interval = _poll(rss_feed, 6, 0.5)
+
+        assert interval == PollScheduler.get_min_interval()
+
+    def test_quiet_feed_backs_off(self, rss_feed):
+        _poll(rss_feed, 5, 0)
+        intervals = [_poll(rss_feed, 0, 1) for _ in range(12)]
+
+        assert intervals == sorted(intervals)
+        assert intervals[0] > DEFAULT_INTERVAL
+        assert intervals[-1] == PollScheduler.get_max_interval()
+
+    def test_failures_back_off_without_losing_interval(self, rss_feed):
+        _poll(rss_feed, 5, 0)
+        now = timezone.now()
+
+        PollScheduler.record_run(rss_feed, 0, success=False)
+        PollScheduler.record_run(rss_feed, 0, success=False)
+        rss_feed.refresh_from_db()
+
+        assert rss_feed.consecutive_failures == 2
+        assert rss_feed.next_poll_at - now >= DEFAULT_INTERVAL * 4
+        assert rss_feed.poll_interval == DEFAULT_INTERVAL.total_seconds()
+
+    def test_daily_limit_waits_for_next_day(self, rss_feed):
+        PollScheduler.record_run(rss_feed, 3, daily_limit_reached=True)
+        rss_feed.refresh_from_db()
+
+        tomorrow = (timezone.now() + timedelta(days=1)).date()
+        assert rss_feed.next_poll_at.date() >= tomorrow
+
+
+@pytest.mark.django_db
+class TestTriggerDue:
+    @patch("core.services.aggregator_service.async_task", return_value="task-1")
+    def test_only_due_feeds_are_enqueued(self, mock_async_task, rss_feed, youtube_feed):
+        now = timezone.now()
+        Feed.objects.filter(pk=rss_feed.pk).update(next_poll_at=now - timedelta(minutes=1))
+        Feed.objects.filter(pk=youtube_feed.pk).update(next_poll_at=now + timedelta(hours=1))
+
+        results = AggregatorService.trigger_due()
+
+        assert [r["feed_id"] for r in results] == [rss_feed.id]
+        rss_feed.refresh_from_db()
+        # Leased until its task has run
+        assert rss_feed.next_poll_at > now + ENQUEUE_LEASE - timedelta(minutes=1)
+        assert AggregatorService.trigger_due() == []
+        assert mock_async_task.call_count == 1
+
+    @patch("core.services.aggregator_service.async_task", return_value="task-1")
+    def test_new_and_disabled_feeds(self, mock_async_task, rss_feed, youtube_feed):
+        youtube_feed.enabled = False
+        youtube_feed.save()
+
+        results = AggregatorService.trigger_due()
+
+        assert [r["feed_id"] for r in results] == [rss_feed.id]
+
+    @patch("core.services.aggregator_service.get_aggregator")
+    def test_run_schedules_next_poll(self, mock_get_agg, rss_feed):
+        aggregator = MagicMock()
+        aggregator.aggregate.return_value = [{"name": "New", "identifier": "https://e.com/1"}]
+        aggregator.get_current_run_limit.return_value = 5
+        mock_get_agg.return_value = aggregator
+
+        AggregatorService.trigger_by_feed_id(rss_feed.id)
+
+        rss_feed.refresh_from_db()
+        assert rss_feed.last_new_article_at is not None
+        assert rss_feed.next_poll_at > timezone.now()
+
+    @patch("core.services.aggregator_service.get_aggregator")
+    def test_failed_run_counts_failure(self, mock_get_agg, rss_feed):
+        mock_get_agg.return_value.aggregate.side_effect = ValueError("Feed parsing error")
+
+        AggregatorService.trigger_by_feed_id(rss_feed.id)
+
+        rss_feed.refresh_from_db()
+        assert rss_feed.consecutive_failures == 1
+        assert rss_feed.next_poll_at > timezone.now()
@@ -0,0 +1,189 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock, patch
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from core import http_client, rate_limiter
+from core.aggregators.utils.html_fetcher import fetch_html
+from core.models import HostRateLimit
+from core.rate_limiter import HostRateLimitedError
+
+URL = "https://www.heise.de/news/1"
+
+
+class FakeClock:
+    """Stands in for the time module: sleeping advances the clock."""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(autouse=True)
+def pacing(settings):
+    settings.AGGREGATOR_HOST_RATE_LIMIT = 2.0
+    settings.AGGREGATOR_HOST_BURST = 2
+    settings.AGGREGATOR_HOST_MAX_WAIT = 60.0
+    rate_limiter.clear_leases()
+    yield settings
+    rate_limiter.clear_leases()
+
+
+@pytest.fixture
+def clock():
+    fake = FakeClock()
+    with patch("core.rate_limiter.time", fake):
+        yield fake
+
+
+def make_response(status_code, retry_after=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {"Retry-After": retry_after} if retry_after else {}
+    return response
+
+
+@pytest.mark.django_db
+class TestAcquire:
+    def test_burst_then_paced(self, clock):
+        waits = [rate_limiter.acquire(URL) for _ in range(4)]
+
+        assert waits == [0.0, 0.0, 0.5, 0.5]
+
+    def test_hosts_are_independent(self, clock):
+        for _ in range(3):
+            rate_limiter.acquire(URL)
+
+        assert rate_limiter.acquire("https://images.example.com/a.jpg") == 0.0
+        assert HostRateLimit.objects.count() == 2
+
+    def test_state_is_shared_through_database(self, clock):
+        for _ in range(rate_limiter.LEASE_SLOTS):
+            rate_limiter.acquire(URL)
+        # Another worker process only shares the database row
+        HostRateLimit.objects.filter(host="www.heise.de").update(next_request_at=clock.now + 10)
+
+        assert rate_limiter.acquire(URL) == pytest.approx(9.5)
+
+    def test_slots_are_reserved_from_database_in_windows(self, clock):
+        start = clock.now
+        with CaptureQueriesContext(connection) as ctx:
+            for _ in range(2 * rate_limiter.LEASE_SLOTS):
+                rate_limiter.acquire(URL)
+
+        updates = [q for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 2
+        row = HostRateLimit.objects.get()
+        # Two windows of LEASE_SLOTS slots, 0.5s apart
+        assert row.next_request_at == pytest.approx(start + rate_limiter.LEASE_SLOTS)
+
+    def test_disabled(self, clock, pacing):
+        pacing.AGGREGATOR_HOST_RATE_LIMIT = 0
+
+        assert [rate_limiter.acquire(URL) for _ in range(5)] == [0.0] * 5
+        assert not HostRateLimit.objects.exists()
+
+    def test_long_wait_raises(self, clock, pacing):
+        pacing.AGGREGATOR_HOST_MAX_WAIT = 5
+        rate_limiter.block(URL, 30)
+
+        with pytest.raises(HostRateLimitedError):
+            rate_limiter.acquire(URL)
+        assert clock.sleeps == []
+
+
+@pytest.mark.django_db
+class TestPruneIdleHosts:
+    def test_only_idle_hosts_are_deleted(self, clock):
+        rate_limiter.acquire(URL)
+        rate_limiter.acquire("https://images.example.com/a.jpg")
+        rate_limiter.block("https://blocked.example.com/", 3 * 24 * 3600)
+        clock.now += 2 * 24 * 3600
+        rate_limiter.acquire(URL)
+
+        assert rate_limiter.prune_idle_hosts() == 1
+
+        assert set(HostRateLimit.objects.values_list("host", flat=True)) == {
+            "www.heise.de",
+            "blocked.example.com",
+        }
+
+
+@pytest.mark.django_db
+class TestReportResponse:
+    def test_retry_after_blocks_host(self, clock):
+        rate_limiter.report_response(URL, make_response(429, "20"))
+
+        assert rate_limiter.acquire(URL) == pytest.approx(20)
+
+    def test_429_without_header_uses_default(self, clock):
+        rate_limiter.report_response(URL, make_response(429))
+
+        assert rate_limiter.acquire(URL) == pytest.approx(rate_limiter.DEFAULT_RETRY_AFTER)
+
+    def test_503_without_header_is_ignored(self, clock):
+        rate_limiter.report_response(URL, make_response(503))
+
+        assert rate_limiter.acquire(URL) == 0.0
+
+    def test_shorter_block_does_not_shorten(self, clock):
+        rate_limiter.block(URL, 20)
+        rate_limiter.block(URL, 5)
+
+        assert rate_limiter.acquire(URL) == pytest.approx(20)
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert rate_limiter.parse_retry_after("120") == 120.0
+
+    def test_http_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+
+        delay = rate_limiter.parse_retry_after(format_datetime(retry_at, usegmt=True))
+
+        assert 55 <= delay <= 60
+
+    def test_invalid(self):
+        assert rate_limiter.parse_retry_after("soon") is None
+        assert rate_limiter.parse_retry_after(None) is None
+
+
+class TestPoliteRequests:
+    def test_polite_request_is_paced_and_reported(self):
+        response = make_response(200)
+        session = MagicMock()
+        session.request.return_value = response
+
+        with (
+            patch("core.http_client.get_session", return_value=session),
+            patch("core.http_client.rate_limiter") as limiter,
+        ):
+            http_client.get(URL, polite=True)
+            http_client.get(URL)
+
+        limiter.acquire.assert_called_once_with(URL)
+        limiter.report_response.assert_called_once_with(URL, response)
+        assert "polite" not in session.request.call_args.kwargs
+
+    @patch("core.http_client.get")
+    @patch("core.aggregators.utils.html_fetcher.time.sleep")
+    def test_fetch_html_does_not_retry_rate_limited_host(self, mock_sleep, mock_get):
+        mock_get.side_effect = HostRateLimitedError("www.heise.de", 300)
+
+        with pytest.raises(HostRateLimitedError):
+            fetch_html(URL)
+
+        mock_get.assert_called_once()
+        assert mock_get.call_args.kwargs["polite"] is True
@@ -2,7 +2,7 @@
 
 import logging
 
-from django.http import HttpResponse, JsonResponse
+from django.http import HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 
@@ -13,6 +13,7 @@ from core.services.greader.auth_service import (
 )
 
 from .decorators import greader_auth_required
+from .json_encoder import GReaderJsonResponse
 
 logger = logging.getLogger(__name__)
 
@@ -128,11 +129,11 @@ def user_info(request):
             "userEmail": user["email"],
         }
 
-        return JsonResponse(response_data, status=200)
+        return GReaderJsonResponse(response_data, status=200)
 
     except Exception:
         logger.exception("Error in user_info view")
-        return JsonResponse(
+        return GReaderJsonResponse(
             {"error": "Internal server error"},
             status=500,
         )
@@ -3,10 +3,12 @@
 import logging
 from functools import wraps
 
-from django.http import HttpResponse, JsonResponse
+from django.http import HttpResponse
 
 from core.services.greader.auth_service import authenticate_request
 
+from .json_encoder import GReaderJsonResponse
+
 logger = logging.getLogger(__name__)
 
 
@@ -35,7 +37,7 @@ def greader_auth_required(view_func):
 
             # Return 401 in appropriate format
             if _expects_json(request):
-                return JsonResponse({"error": "Unauthorized"}, status=401)
+                return GReaderJsonResponse({"error": "Unauthorized"}, status=401)
             else:
                 return HttpResponse("Unauthorized", status=401, content_type="text/plain")
 
@@ -0,0 +1,74 @@
+"""JSON encoder selection for Google Reader API responses."""
+
+import json
+import logging
+from functools import lru_cache
+from typing import Any, Callable
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpResponse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENCODER = "orjson"
+FALLBACK_ENCODER = "json"
+
+
+def get_encoder_name() -> str:
+    """
+    Get the JSON encoder used for GReader responses.
+
+    Configured via the GREADER_JSON_ENCODER setting (default: orjson). Falls
+    back to the standard library json module if orjson is not installed.
+    """
+    encoder = getattr(settings, "GREADER_JSON_ENCODER", DEFAULT_ENCODER) or FALLBACK_ENCODER
+    return _resolve_encoder(encoder)
+
+
+@lru_cache(maxsize=None)
+def _resolve_encoder(encoder: str) -> str:
+    """Return the encoder if it is installed, else the fallback (warns once)."""
+    if encoder == "orjson":
+        try:
+            import orjson  # noqa: F401
+        except ImportError:
+            logger.warning(f"JSON encoder 'orjson' is not available, using {FALLBACK_ENCODER}")
+            return FALLBACK_ENCODER
+        return encoder
+    if encoder != FALLBACK_ENCODER:
+        logger.warning(f"Unknown JSON encoder '{encoder}', using {FALLBACK_ENCODER}")
+    return FALLBACK_ENCODER
+
+
+@lru_cache(maxsize=None)
+def get_dumps(encoder: str) -> Callable[[Any], bytes]:
+    """Get a function encoding a value to UTF-8 JSON bytes with the given encoder."""
+    # Types neither encoder handles natively (Decimal, UUID, lazy strings, ...)
+    django_default = DjangoJSONEncoder().default
+
+    if encoder == "orjson":
+        import orjson
+
+        def dumps_orjson(value: Any) -> bytes:
+            return orjson.dumps(value, default=django_default)
+
+        return dumps_orjson
+
+    def dumps_json(value: Any) -> bytes:
+        return json.dumps(value, cls=DjangoJSONEncoder, ensure_ascii=False).encode()
+
+    return dumps_json
+
+
+def dumps(value: Any) -> bytes:
+    """Encode a value as UTF-8 JSON bytes with the configured encoder."""
+    return get_dumps(get_encoder_name())(value)
+
+
+class GReaderJsonResponse(HttpResponse):
+    """JsonResponse counterpart that encodes with the configured encoder."""
+
+    def __init__(self, data: Any, **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(content=dumps(data), **kwargs)
@@ -2,10 +2,10 @@
 
 import logging
 
-from django.http import JsonResponse
 from django.views.decorators.http import require_http_methods
 
 from .decorators import greader_auth_required
+from .json_encoder import GReaderJsonResponse
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +18,7 @@ def preference_list(request):
     Response:
         JSON with empty prefs array
     """
-    return JsonResponse({"prefs": []}, status=200)
+    return GReaderJsonResponse({"prefs": []}, status=200)
 
 
 @require_http_methods(["GET"])
@@ -29,4 +29,4 @@ def preference_stream_list(request):
     Response:
         JSON with empty streamprefs object
     """
-    return JsonResponse({"streamprefs": {}}, status=200)
+    return GReaderJsonResponse({"streamprefs": {}}, status=200)
@@ -3,7 +3,6 @@
 import contextlib
 import logging
 
-from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 
@@ -15,6 +14,8 @@ from core.services.greader.stream_service import (
 )
 
 from .decorators import greader_auth_required
+from .json_encoder import GReaderJsonResponse
+from .streaming import STREAMING_MIN_ITEMS, StreamingJsonResponse
 
 logger = logging.getLogger(__name__)
 
@@ -42,11 +43,11 @@ def unread_count(request):
         # Get counts
         result = get_unread_count(user_id, include_all)
 
-        return JsonResponse(result, status=200)
+        return GReaderJsonResponse(result, status=200)
 
     except Exception:
         logger.exception("Error in unread_count view")
-        return JsonResponse(
+        return GReaderJsonResponse(
             {"error": "Internal server error"},
             status=500,
         )
@@ -66,7 +67,7 @@ def stream_items_ids(request):
     - r: Reverse (o = oldest first)
 
     Response (on success):
-        JSON with itemRefs array
+        JSON with itemRefs array (streamed for n >= STREAMING_MIN_ITEMS)
 
     Response (on failure):
         401 Unauthorized
@@ -81,6 +82,7 @@ def stream_items_ids(request):
         exclude_tag = request.GET.get("xt")
         include_tag = request.GET.get("it")
         reverse = request.GET.get("r") == "o"
+        streaming = limit >= STREAMING_MIN_ITEMS
 
         # Parse timestamp
         older_than = None
@@ -97,17 +99,20 @@ def stream_items_ids(request):
             exclude_tag=exclude_tag,
             include_tag=include_tag,
             reverse_order=reverse,
+            lazy=streaming,
         )
 
-        return JsonResponse(result, status=200)
+        if streaming:
+            return StreamingJsonResponse(result, status=200)
+        return GReaderJsonResponse(result, status=200)
 
     except StreamError as e:
         logger.warning(f"Stream error: {e}")
-        return JsonResponse({"error": str(e)}, status=400)
+        return GReaderJsonResponse({"error": str(e)}, status=400)
 
     except Exception:
         logger.exception("Error in stream_items_ids view")
-        return JsonResponse(
+        return GReaderJsonResponse(
             {"error": "Internal server error"},
             status=500,
         )
@@ -132,7 +137,8 @@ def stream_contents(request, stream_id=None):
     - c: Continuation token
 
     Response (on success):
-        JSON with items array and optional continuation
+        JSON with items array and optional continuation (streamed for
+        n >= STREAMING_MIN_ITEMS)
 
     Response (on failure):
         401 Unauthorized
@@ -155,6 +161,7 @@ def stream_contents(request, stream_id=None):
         exclude_tag = params.get("xt")
         include_tag = params.get("it")
         continuation = params.get("c")
+        streaming = limit >= STREAMING_MIN_ITEMS
 
         # Parse timestamp
         older_than = None
@@ -173,17 +180,20 @@ def stream_contents(request, stream_id=None):
             exclude_tag=exclude_tag,
             include_tag=include_tag,
             continuation=continuation,
+            lazy=streaming,
         )
 
-        return JsonResponse(result, status=200)
+        if streaming:
+            return StreamingJsonResponse(result, status=200)
+        return GReaderJsonResponse(result, status=200)
 
     except StreamError as e:
         logger.warning(f"Stream error: {e}")
-        return JsonResponse({"error": str(e)}, status=400)
+        return GReaderJsonResponse({"error": str(e)}, status=400)
 
     except Exception:
         logger.exception("Error in stream_contents view")
-        return JsonResponse(
+        return GReaderJsonResponse(
             {"error": "Internal server error"},
             status=500,
         )
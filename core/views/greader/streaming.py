@@ -0,0 +1,92 @@
+"""Streaming JSON responses for large Google Reader API results."""
+
+import logging
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from django.http import StreamingHttpResponse
+
+from .json_encoder import get_dumps, get_encoder_name
+
+logger = logging.getLogger(__name__)
+
+# Pages at least this large are streamed instead of encoded in one piece
+STREAMING_MIN_ITEMS = 250
+
+# Encoded output is written to the client in chunks of about this size
+STREAMING_BUFFER_SIZE = 64 * 1024
+
+
+def iter_json(data: dict[str, Any]) -> Iterator[bytes]:
+    """Encode a response dict as JSON, piece by piece, with the configured encoder.
+
+    Values of the top-level dict are encoded as follows:
+    - callables are called when their key is reached, and the key is left out
+      if they return None (for values known only after earlier items, such as
+      a continuation token)
+    - other iterables that are not lists, tuples, dicts or strings (e.g.
+      generators) are encoded as arrays, one element at a time
+    - everything else is encoded with json.dumps
+
+    Args:
+        data: Response dict
+
+    Yields:
+        UTF-8 JSON fragments
+    """
+    dumps = get_dumps(get_encoder_name())
+
+    yield b"{"
+    separator = b""
+    for key, value in data.items():
+        if callable(value):
+            value = value()
+            if value is None:
+                continue
+
+        yield separator + dumps(key) + b":"
+        separator = b","
+
+        if isinstance(value, Iterable) and not isinstance(value, (list, tuple, dict, str, bytes)):
+            yield b"["
+            item_separator = b""
+            for item in value:
+                yield item_separator + dumps(item)
+                item_separator = b","
+            yield b"]"
+        else:
+            yield dumps(value)
+    yield b"}"
+
+
+def _buffered(fragments: Iterable[bytes], size: int = STREAMING_BUFFER_SIZE) -> Iterator[bytes]:
+    """Join small fragments into chunks of roughly `size` bytes."""
+    buffer: list[bytes] = []
+    buffered = 0
+    try:
+        for fragment in fragments:
+            buffer.append(fragment)
+            buffered += len(fragment)
+            if buffered >= size:
+                yield b"".join(buffer)
+                buffer.clear()
+                buffered = 0
+    except Exception:
+        # Headers are already sent; all we can do is log and cut the body short
+        logger.exception("Error while streaming GReader response")
+        raise
+    if buffer:
+        yield b"".join(buffer)
+
+
+class StreamingJsonResponse(StreamingHttpResponse):
+    """JSON response whose body is encoded while it is sent (see iter_json).
+
+    Items are read from the database and formatted as the client consumes the
+    response, so memory use does not grow with the page size and the first
+    bytes go out before the whole page has been formatted.
+    """
+
+    def __init__(self, data: dict[str, Any], **kwargs):
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(_buffered(iter_json(data)), **kwargs)
@@ -2,7 +2,7 @@
 
 import logging
 
-from django.http import HttpResponse, JsonResponse
+from django.http import HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 
@@ -15,6 +15,7 @@ from core.services.greader.subscription_service import (
 )
 
 from .decorators import greader_auth_required
+from .json_encoder import GReaderJsonResponse
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +41,11 @@ def subscription_list(request):
             "subscriptions": subscriptions,
         }
 
-        return JsonResponse(response_data, status=200)
+        return GReaderJsonResponse(response_data, status=200)
 
     except Exception:
         logger.exception("Error in subscription_list view")
-        return JsonResponse(
+        return GReaderJsonResponse(
             {"error": "Internal server error"},
             status=500,
         )
@@ -131,15 +132,15 @@ def quickadd(request):
         quick_add_url = request.POST.get("quickadd")
 
         if not quick_add_url:
-            return JsonResponse({"error": "Missing quickadd parameter"}, status=400)
+            return GReaderJsonResponse({"error": "Missing quickadd parameter"}, status=400)
 
         result = quick_add_subscription(user_id, quick_add_url)
 
-        return JsonResponse(result, status=200)
+        return GReaderJsonResponse(result, status=200)
 
     except Exception:
         logger.exception("Error in quickadd view")
-        return JsonResponse(
+        return GReaderJsonResponse(
             {"error": "Internal server error"},
             status=500,
         )
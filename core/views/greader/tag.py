@@ -2,7 +2,7 @@
 
 import logging
 
-from django.http import HttpResponse, JsonResponse
+from django.http import HttpResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 
@@ -17,6 +17,7 @@ from core.services.greader.tag_service import (
 )
 
 from .decorators import greader_auth_required
+from .json_encoder import GReaderJsonResponse
 
 logger = logging.getLogger(__name__)
 
@@ -40,11 +41,11 @@ def tag_list(request):
 
         response_data = format_tag_list(tags)
 
-        return JsonResponse(response_data, status=200)
+        return GReaderJsonResponse(response_data, status=200)
 
     except Exception:
         logger.exception("Error in tag_list view")
-        return JsonResponse(
+        return GReaderJsonResponse(
             {"error": "Internal server error"},
             status=500,
         )
@@ -15,6 +15,8 @@ See .env.example for all available settings.
 
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 import environ
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -43,6 +45,23 @@ env = environ.Env(
     DEFAULT_FROM_EMAIL=(str, "noreply@localhost"),
     SERVER_EMAIL=(str, "server@localhost"),
     ADMIN_EMAIL=(str, ""),
+    # Aggregation
+    AGGREGATOR_HTML_PARSER=(str, "lxml"),
+    AGGREGATOR_HOST_RATE_LIMIT=(float, 2.0),
+    AGGREGATOR_HOST_BURST=(int, 4),
+    AGGREGATOR_HOST_MAX_WAIT=(float, 60.0),
+    AGGREGATOR_POLL_MIN_INTERVAL=(int, 10),
+    AGGREGATOR_POLL_MAX_INTERVAL=(int, 720),
+    AGGREGATOR_IMAGE_CACHE_DIR=(str, ""),
+    AGGREGATOR_IMAGE_CACHE_SIZE=(int, 256),
+    AGGREGATOR_IMAGE_WORKERS=(int, 2),
+    AGGREGATOR_IMAGE_WORKER_MEMORY=(int, 1024),
+    AGGREGATOR_IMAGE_EMBED=(str, "file"),
+    # Google Reader API
+    GREADER_JSON_ENCODER=(str, "orjson"),
+    # Cache
+    CACHE_BACKEND=(str, "file"),
+    CACHE_LOCATION=(str, ""),
 )
 
 # Read environment file (.env) if it exists
@@ -84,6 +103,43 @@ if not DEBUG:
 
 BASE_URL = env("BASE_URL").rstrip("/")
 
+# BeautifulSoup backend for parsing fetched pages ("lxml" or "html.parser").
+# Falls back to html.parser if lxml is not installed.
+AGGREGATOR_HTML_PARSER = env("AGGREGATOR_HTML_PARSER")
+
+# Per-host pacing of crawl requests, shared by all workers (see core.rate_limiter).
+# Requests per second per host (0 disables pacing), requests that may start at
+# once, and the longest a request waits for its slot before giving up.
+AGGREGATOR_HOST_RATE_LIMIT = env("AGGREGATOR_HOST_RATE_LIMIT")
+AGGREGATOR_HOST_BURST = env("AGGREGATOR_HOST_BURST")
+AGGREGATOR_HOST_MAX_WAIT = env("AGGREGATOR_HOST_MAX_WAIT")
+
+# Bounds (minutes) of the adaptive per-feed polling interval (see PollScheduler)
+AGGREGATOR_POLL_MIN_INTERVAL = env("AGGREGATOR_POLL_MIN_INTERVAL")
+AGGREGATOR_POLL_MAX_INTERVAL = env("AGGREGATOR_POLL_MAX_INTERVAL")
+
+# On-disk cache of image fetches shared by all workers (see
+# core.aggregators.services.image_extraction.fetch_cache): directory
+# (default data/image-cache) and size bound in MB (0 disables the cache)
+AGGREGATOR_IMAGE_CACHE_DIR = env("AGGREGATOR_IMAGE_CACHE_DIR") or str(
+    BASE_DIR / "data" / "image-cache"
+)
+AGGREGATOR_IMAGE_CACHE_SIZE = env("AGGREGATOR_IMAGE_CACHE_SIZE")
+
+# Processes per worker that decode and encode images (see core.image_processing;
+# 0 processes images inline) and their address space limit in MB (0: no limit)
+AGGREGATOR_IMAGE_WORKERS = env("AGGREGATOR_IMAGE_WORKERS")
+AGGREGATOR_IMAGE_WORKER_MEMORY = env("AGGREGATOR_IMAGE_WORKER_MEMORY")
+
+# How images are embedded in article content: "file" stores them below
+# MEDIA_ROOT and links them by URL (base64 if storing fails or BASE_URL is
+# the default), "base64" inlines them as data URIs
+AGGREGATOR_IMAGE_EMBED = env("AGGREGATOR_IMAGE_EMBED")
+
+# JSON encoder for Google Reader API responses ("orjson" or "json").
+# Falls back to json if orjson is not installed.
+GREADER_JSON_ENCODER = env("GREADER_JSON_ENCODER")
+
 
 # Application definition
 
@@ -178,6 +234,41 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+#
+# Shared by all gunicorn and qcluster processes, so cached GReader data
+# (unread counts, auth tokens) is invalidated everywhere at once:
+# - file: FileBasedCache in data/cache (default, no extra service needed)
+# - redis: RedisCache at CACHE_LOCATION (requires the redis package)
+# - locmem: per-process LocMemCache, only suitable for a single process
+
+CACHE_BACKENDS = {
+    "file": (
+        "django.core.cache.backends.filebased.FileBasedCache",
+        str(BASE_DIR / "data" / "cache"),
+    ),
+    "redis": ("django.core.cache.backends.redis.RedisCache", "redis://127.0.0.1:6379/1"),
+    "locmem": ("django.core.cache.backends.locmem.LocMemCache", "yana"),
+}
+
+CACHE_BACKEND = env("CACHE_BACKEND")
+if CACHE_BACKEND not in CACHE_BACKENDS:
+    raise ImproperlyConfigured(
+        f"CACHE_BACKEND must be one of {', '.join(CACHE_BACKENDS)}, got {CACHE_BACKEND!r}"
+    )
+
+cache_class, default_cache_location = CACHE_BACKENDS[CACHE_BACKEND]
+CACHES = {
+    "default": {
+        "BACKEND": cache_class,
+        "LOCATION": env("CACHE_LOCATION") or default_cache_location,
+    }
+}
+if CACHE_BACKEND == "file":
+    CACHES["default"]["OPTIONS"] = {"MAX_ENTRIES": 10000}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
 
@@ -241,6 +332,7 @@ Q_CLUSTER = {
     "save_limit": 250,
     "queue_limit": 500,
     "cpu_affinity": 1,
+    "daemonize_workers": False,  # Workers start image processes (core.image_processing)
     "label": "Django Q2",
     "redis": None,  # Use ORM broker (database) instead of Redis
     "orm": "default",  # Use the default database connection
@@ -1,5 +1,6 @@
 """Project-level URL configuration."""
 
+import re
 from typing import Any, List
 
 from django.conf import settings
@@ -7,8 +8,11 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.shortcuts import redirect
 from django.urls import include, path, re_path
+from django.views.decorators.cache import cache_control
 from django.views.static import serve
 
+from core.services.image_blob_service import BLOB_DIRECTORY
+
 
 def redirect_to_admin(request, *args, **kwargs):
     return redirect("admin:index")
@@ -20,8 +24,17 @@ urlpatterns: List[Any] = [
     path("", include("core.urls")),
 ]
 
+# Image blob files are named after their content and never change, so clients
+# and proxies may keep them for good (see ImageBlobService)
+IMAGE_BLOB_MAX_AGE = 365 * 24 * 3600
+
 # Serve media files via Django in both dev and prod (no Nginx sidecar)
 urlpatterns += [
+    re_path(
+        rf"^media/(?P<path>{re.escape(BLOB_DIRECTORY)}/.*)$",
+        cache_control(public=True, max_age=IMAGE_BLOB_MAX_AGE, immutable=True)(serve),
+        {"document_root": settings.MEDIA_ROOT},
+    ),
     re_path(r"^media/(?P<path>.*)$", serve, {"document_root": settings.MEDIA_ROOT}),
 ]
 